@@ -1,6 +1,69 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=C0322,C0323
+import importlib, sys, types
 import __pkginfo__
+
+# Public name => the submodule that defines it. These submodules are only
+# imported the first time one of their names is used, so importing colorClass
+# only loads Color, FrozenColor and the helpers they need.
+__lazyNames__ = {
+    'ColorArray': 'colorArray',
+    'ColorService': 'colorAsync',
+    'blend_many': 'colorBlend',
+    'ColorBuffer': 'colorBuffer',
+    'delta_e_many': 'colorDifference',
+    'delta_e_matrix': 'colorDifference',
+    'format_hex_many': 'colorFormat',
+    'hex_output_size': 'colorFormat',
+    'gradient_array': 'colorGradient',
+    'iter_gradient': 'colorGradient',
+    'color_histogram': 'colorHistogram',
+    'Palette': 'colorPalette',
+    'load_palette': 'colorPalette',
+    'write_palette': 'colorPalette',
+    'parse_many': 'colorParallel',
+    'PROFILER': 'colorProfiler',
+    'DEFAULT_QUANTIZE_METHOD': 'colorQuantize',
+    'QUANTIZE_METHODS': 'colorQuantize',
+    'quantize': 'colorQuantize',
+    'ColorIndex': 'colorSearch',
+    'nearest_names': 'colorSearch',
+    'iter_colors': 'colorStream'
+}
+
+# The submodules that are imported the first time they're used
+__lazyModules__ = sorted(set(__lazyNames__.values()) | set(['colorSpaces']))
+
+
+class __lazyPackage__(types.ModuleType):
+    """
+    The colorClass package, which imports a submodule the first time it,
+    or one of its names, is used
+    """
+    def __getattr__(self, name):
+        """
+        Imports the submodule that defines the name, and returns the name
+        """
+        if name in __lazyNames__:
+            moduleName = __lazyNames__[name]
+        elif name in __lazyModules__:
+            moduleName = name
+        else:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+
+        module = importlib.import_module('%s.%s' % (self.__name__, moduleName))
+        value = module if moduleName == name else getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        """
+        Returns the names of the package, including the ones that haven't
+        been imported yet
+        """
+        return sorted(set(self.__dict__.keys()) | set(__lazyNames__.keys()) | set(__lazyModules__))
+
+
 _allowedNames = set(['__name__', '__file__', '__doc__'])
 _ignoredNames = set()
 
@@ -15,10 +78,19 @@ __license__ = __pkginfo__.license
 __package__ = __name__ = __pkginfo__.modname
 __doc__ = __pkginfo__.long_desc
 
-# Add all of the imports, except for the ignored names
-__all__ = sorted(set(locals().keys()) - _ignoredNames)
+# Add all of the imports, except for the ignored names, and the names that are
+# imported when they're first used
+__all__ = sorted((set(locals().keys()) - _ignoredNames) | set(__lazyNames__.keys()) | set(__lazyModules__))
 del _allowedNames
 del _ignoredNames
 
+# Replace this module with a __lazyPackage__ that has the same names. The
+# module itself is kept on the package, since Python 2 clears the globals of
+# a module when it's deleted, and __lazyPackage__ uses them.
+__lazyPackageModule__ = __lazyPackage__(__name__, __doc__)
+__lazyPackageModule__.__dict__.update(sys.modules[__name__].__dict__)
+__lazyPackageModule__.__originalModule__ = sys.modules[__name__]
+sys.modules[__name__] = __lazyPackageModule__
+
 if __name__ == '__main__':
     print __pkginfo__.long_desc
@@ -24,6 +24,37 @@ changelog = {
         'Fewer functions try to extensively convert a provided value, and those that still do convert will prefer their intended input value type.',
         'Test coverage is virtually complete!',
         'The color constant class and the Color class both use the same parsing functions to determine the provided color.'
+    ],
+    '0.0.4': [
+        '__rgbFromValue__ classifies the provided value once, and parses it directly into an RGB tuple',
+        'Fixed the COLORS constant recursing infinitely when looking up a color name',
+        'Added PARSE_CACHE, an optional LRU cache of parsed color values',
+        'Added FrozenColor, an immutable and hashable color stored as a single packed integer',
+        'Added ColorArray, which stores many colors in a NumPy array and converts them in vectorized passes',
+        'COLORS indexes each color by name and by value, so color names are parsed with a single lookup',
+        'Added COLORS.get_names, which returns the names of the colors with a given value',
+        'Fixed COLORS allowing an existing color to be overwritten by using a different case',
+        'Added nearest_name, nearest_names and ColorIndex, which find the nearest named color with a KD-tree',
+        'Added iter_colors, which finds hex, rgb() and named colors in large text streams, one chunk at a time',
+        'Added write_palette, load_palette and Palette, a binary palette format that is memory-mapped for instant loading',
+        'Added parse_many, which parses large batches of color values across a pool of worker processes',
+        'Importing colorClass is faster: NumPy, concurrent.futures, the regular expressions, the COLORS table and every submodule except color are only loaded when first used',
+        'Added an import time benchmark, colorClassBenchmarks/importBenchmark.py, which fails if importing takes longer than its budget, or loads optional modules like NumPy',
+        'Added colorClassBenchmarks/parseBenchmark.py, which times the parsing and conversion hot paths, writes JSON results, and compares them to a baseline',
+        'Added PROFILER, an opt-in profiler that counts calls, time and input types of the parsing helpers and COLORS lookups',
+        'Added the hsl, hsv, xyz, lab and lch properties to Color, FrozenColor and ColorArray, and ColorArray.fromSpace',
+        'Color.hex, hex parsing and the per-channel helpers use lookup tables built once on import',
+        'FrozenColor returns a shared instance for each color in COLORS, and Color copies named colors from it without parsing',
+        'Added format_hex_many, which formats many colors as lines, a CSV row or a JSON array, into a string or a preallocated buffer',
+        'Added quantize, which reduces a raw RGB buffer or NumPy image to a palette with median cut or mini-batch k-means',
+        'Added iter_gradient and gradient_array, for multi-stop gradients in sRGB, linear RGB or Lab with easing, and Color.fromInt',
+        'Added Color.blend and blend_many, for over, multiply, screen, overlay, darken and lighten blending of colors and pixel arrays',
+        'Added alpha support to the parser, Color, FrozenColor and ColorArray, including #RRGGBBAA, #RGBA and rgba() strings',
+        'Added CIE76, CIE94 and CIEDE2000 color difference with Color.delta_e, delta_e_many and delta_e_matrix',
+        'Color and FrozenColor are compared, hashed and ordered by their RGB and alpha values, and setting Color.hex works again',
+        'Added color_histogram, which counts the unique colors of a raw pixel buffer, with or without NumPy',
+        'Added ColorService, which runs parse, extract_palette and nearest_name for asyncio code on a bounded executor, with backpressure, cancellation and shared in-flight requests',
+        'Added ColorBuffer, a packed color sequence over any buffer-protocol object, with zero-copy construction, memoryview slices and colors created on demand'
     ]
 }
 
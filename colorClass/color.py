@@ -7,9 +7,76 @@ Creates the Color class
 import copy
 import helpers as h
 
+# colorBlend, colorDifference, colorSearch and colorSpaces are imported by the
+# methods that use them, so that importing colorClass doesn't load them
+
 RGB_NAMES = h.RGB_NAMES
 
 DEFAULT_INT_VALUE = h.DEFAULT_INT_VALUE
+DEFAULT_ALPHA_VALUE = h.DEFAULT_ALPHA_VALUE
+
+# The shared FrozenColor for each packed value in COLORS. Every color is
+# created the first time a color name is parsed, not on import, and colors
+# that are added to COLORS later are created the first time they're parsed.
+__internedColors__ = dict()
+
+
+def __internedColor__(colorValue):
+    """
+    Returns the shared FrozenColor for a color name, or for the hex string
+    of a color in COLORS, without parsing it. Names are matched as they
+    were defined, or in lower case. Any other value returns None.
+        __internedColor__('Red')        => FrozenColor('#FF0000')
+        __internedColor__('#FF0000')    => FrozenColor('#FF0000')
+        __internedColor__('#FF0001')    => None
+    """
+    if not __internedColors__:
+        for packedValue in COLORS.__intNames__.keys():
+            __internedColors__.setdefault(packedValue, __frozenColorFromPacked__(packedValue))
+
+    packedValue = COLORS.__colorInts__.get(colorValue)
+    if packedValue is None:
+        if colorValue in COLORS.__hexNames__:
+            packedValue = h.__packHex__(colorValue)
+        else:
+            packedValue = COLORS.__colorInts__.get(colorValue.strip().lower())
+            if packedValue is None:
+                return None
+
+    internedColor = __internedColors__.get(packedValue)
+    if internedColor is None:
+        internedColor = __internedColors__.setdefault(packedValue, __frozenColorFromPacked__(packedValue))
+    return internedColor
+
+
+def __frozenColorFromPacked__(packedValue):
+    """
+    Returns a FrozenColor from a value packed by helpers.__packRGBA__, like
+    the values in COLORS
+    """
+    return FrozenColor.fromInt(packedValue & 0xFFFFFF, DEFAULT_ALPHA_VALUE - (packedValue >> 24))
+
+
+def __orderValueOf__(value):
+    """
+    Returns the 0xRRGGBBAA value that colors are compared by, for a Color, a
+    FrozenColor, or a color name, hex string or CSS rgb() call. Any other
+    value returns None, including strings that are not colors, so they are
+    never equal to black.
+        __orderValueOf__('#FF000080')    => 0xFF000080
+        __orderValueOf__('notacolor')    => None
+    """
+    if isinstance(value, (Color, FrozenColor)):
+        return value.__orderValue__()
+    elif isinstance(value, h.STRING_TYPES):
+        rgba = h.__rgbaFromColorString__(value)
+        if rgba is None:
+            return None
+        red, green, blue, alpha = rgba
+        return (red << 24) | (green << 16) | (blue << 8) | alpha
+    else:
+        return None
+
 
 _allowedNames = set(['__name__', '__file__', '__doc__'])
 _ignoredNames = set()
@@ -18,6 +85,7 @@ _ignoredNames = set()
 _ignoredNames = set(locals().keys()) - _allowedNames
 
 COLORS = h.COLORS
+PARSE_CACHE = h.PARSE_CACHE
 
 
 class Color(object):
@@ -25,25 +93,54 @@ class Color(object):
     Creates a Color object. Acceptable color values are color names, hex strings,
     or RGB values as an integer(0 - 255) or float(0 - 1) in an interable or as
     individual values.
-    Values in a non-dictionary iterable will be parsed as red, green, then blue values.
+    Values in a non-dictionary iterable will be parsed as red, green, blue, then alpha values.
     If no valid color value is provided, then the color will be set to Black.
+    Colors are opaque unless an alpha value (0 - 255, or a float from 0 - 1) is
+    provided, as a fourth value, an 'alpha' key, or a '#RRGGBBAA', '#RGBA' or
+    rgba() string.
     Stored red, green, and blue results from example Color constructors:
         Color(255)          => (255, 0, 0)
         Color('#000000')    => (0, 0, 0)
         Color('#000')       => (0, 0, 0)
     """
-    __slots__ = ['__rgb__', '__names__']
+    __slots__ = ['__rgb__', '__names__', '__alpha__']
 
     def __init__(self, *values):
         self.__names__ = RGB_NAMES[:]
         self.__rgb__ = [None for item in self.__names__]
+        self.__alpha__ = DEFAULT_ALPHA_VALUE
 
         if len(values) > 0:
             if len(values) == 1 and isinstance(values[0], Color):
                 self.__rgb__ = copy.deepcopy(values[0].__rgb__)
+                self.__alpha__ = values[0].__alpha__
+            elif len(values) == 1 and isinstance(values[0], FrozenColor):
+                self.__rgb__ = list(values[0].rgb)
+                self.__alpha__ = values[0].alpha
             else:
-                self.rgb = values
+                # Color names are copied from their shared FrozenColor, without parsing
+                internedColor = __internedColor__(values[0]) if len(values) == 1 and isinstance(values[0], h.STRING_TYPES) else None
+                if internedColor is not None:
+                    self.__rgb__ = list(internedColor.rgb)
+                    self.__alpha__ = internedColor.alpha
+                else:
+                    self.rgba = values
 
+    @classmethod
+    def fromInt(cls, packedValue, alpha = DEFAULT_ALPHA_VALUE):
+        """
+        Returns a Color from an integer packed as 0xRRGGBB, and an alpha value
+        (0 - 255), without parsing them.
+        """
+        if not h.__isIntType__(packedValue) or not 0 <= packedValue <= 0xFFFFFF:
+            raise ValueError('The packed color value must be an integer between 0 and 0xFFFFFF!')
+        if alpha.__class__ is not int or not 0 <= alpha <= DEFAULT_ALPHA_VALUE:
+            raise ValueError('The alpha must be an integer between 0 and 255!')
+
+        color = cls()
+        color.__rgb__ = list(h.__unpackRGB__(packedValue))
+        color.__alpha__ = alpha
+        return color
 
     def __str__(self):
         """
@@ -57,6 +154,71 @@ class Color(object):
         """
         return repr(self.hex)
 
+    def __orderValue__(self):
+        """
+        Returns the color packed as 0xRRGGBBAA, which orders colors by red,
+        green, blue, then alpha
+        """
+        red, green, blue = self.__rgb__
+        return ((red or DEFAULT_INT_VALUE) << 24) | ((green or DEFAULT_INT_VALUE) << 16) | ((blue or DEFAULT_INT_VALUE) << 8) | self.__alpha__
+
+    def __hash__(self):
+        """
+        Returns the same hash as a FrozenColor with the same RGB and alpha
+        values. A Color must not be changed while it's in a set or used as
+        a dictionary key.
+        """
+        red, green, blue = self.__rgb__
+        return hash(((DEFAULT_ALPHA_VALUE - self.__alpha__) << 24) | ((red or DEFAULT_INT_VALUE) << 16) | ((green or DEFAULT_INT_VALUE) << 8) | (blue or DEFAULT_INT_VALUE))
+
+    def __eq__(self, other):
+        """
+        Returns True if the other color has the same RGB and alpha values.
+        Color names, hex strings and CSS rgb() calls are compared as the
+        color they would create, like Color('red') == '#FF0000'. Such
+        comparisons are not consistent with hash(), since the string has a
+        different hash, so sets and dictionaries should only mix colors with
+        colors. Other strings and values are never equal to a color.
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() == otherValue
+
+    def __ne__(self, other):
+        """
+        Returns True if the other color has different RGB or alpha values
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() != otherValue
+
+    def __lt__(self, other):
+        """
+        Returns True if this color sorts before the other color. Colors are
+        ordered by red, green, blue, then alpha.
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() < otherValue
+
+    def __le__(self, other):
+        """
+        Returns True if this color sorts before or equal to the other color
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() <= otherValue
+
+    def __gt__(self, other):
+        """
+        Returns True if this color sorts after the other color
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() > otherValue
+
+    def __ge__(self, other):
+        """
+        Returns True if this color sorts after or equal to the other color
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() >= otherValue
+
     def __copy__(self):
         """
         Returns a copy of this object
@@ -83,19 +245,37 @@ class Color(object):
         """
         self.red, self.green, self.blue = h.__rgbFromValue__(values)
 
+    @property
+    def rgba(self):
+        """
+        Returns a valid RGBA value. If any of the RGB values are not set, a 0 is returned.
+        """
+        return (self.red or DEFAULT_INT_VALUE, self.green or DEFAULT_INT_VALUE, self.blue or DEFAULT_INT_VALUE, self.__alpha__)
+
+    @rgba.setter
+    def rgba(self, *values):
+        """
+        Sets the color value from RGB values, and an optional alpha value. The
+        color is opaque if no alpha value is provided.
+        """
+        # The parsed alpha is always a valid integer
+        self.red, self.green, self.blue, self.__alpha__ = h.__rgbaFromValue__(values)
+
     @property
     def hex(self):
         """
         Returns the color value in hex format. Missing values are represented as a 00.
+        Colors that are not opaque are formatted as '#RRGGBBAA'.
         """
-        return h.__rgbToHex__(self.rgb)
+        return h.__rgbaToHex__(self.rgb, self.__alpha__)
 
     @hex.setter
     def hex(self, hexValue):
         """
-        Sets the color value from a hex string
+        Sets the color value from a hex string, including the alpha of a
+        '#RRGGBBAA' string
         """
-        self.red, self.green, self.blue = h.__hexFromValue__(hexValue)
+        self.rgba = hexValue
 
     @property
     def red(self):
@@ -139,6 +319,420 @@ class Color(object):
         """
         self.__rgb__[self.__names__.index('blue')] = h.__getColorInt__(blue)
 
+    @property
+    def alpha(self):
+        """
+        Returns the alpha value, from 0 (transparent) to 255 (opaque)
+        """
+        return self.__alpha__
+
+    @alpha.setter
+    def alpha(self, alpha):
+        """
+        Sets the alpha value. Values that can't be converted make the color opaque.
+        """
+        alpha = h.__toAlphaInt__(alpha)
+        self.__alpha__ = DEFAULT_ALPHA_VALUE if alpha is None else alpha
+
+    @property
+    def hsl(self):
+        """
+        Returns the color as an HSL tuple. The hue is in degrees (0 - 360), and
+        the saturation and lightness are between 0 and 1.
+        """
+        import colorSpaces as sp
+        return sp.__rgbToHSL__(self.rgb)
+
+    @hsl.setter
+    def hsl(self, hslValue):
+        """
+        Sets the color value from an HSL tuple
+        """
+        import colorSpaces as sp
+        self.__rgb__ = list(sp.__hslToRGB__(hslValue))
+
+    @property
+    def hsv(self):
+        """
+        Returns the color as an HSV tuple. The hue is in degrees (0 - 360), and
+        the saturation and value are between 0 and 1.
+        """
+        import colorSpaces as sp
+        return sp.__rgbToHSV__(self.rgb)
+
+    @hsv.setter
+    def hsv(self, hsvValue):
+        """
+        Sets the color value from an HSV tuple
+        """
+        import colorSpaces as sp
+        self.__rgb__ = list(sp.__hsvToRGB__(hsvValue))
+
+    @property
+    def xyz(self):
+        """
+        Returns the color as a CIE XYZ tuple, using the D65 reference white
+        """
+        import colorSpaces as sp
+        return sp.__rgbToXYZ__(self.rgb)
+
+    @xyz.setter
+    def xyz(self, xyzValue):
+        """
+        Sets the color value from a CIE XYZ tuple. Colors outside of the RGB
+        range are clamped.
+        """
+        import colorSpaces as sp
+        self.__rgb__ = list(sp.__xyzToRGB__(xyzValue))
+
+    @property
+    def lab(self):
+        """
+        Returns the color as a CIE Lab tuple
+        """
+        import colorSpaces as sp
+        return sp.__rgbToLab__(self.rgb)
+
+    @lab.setter
+    def lab(self, labValue):
+        """
+        Sets the color value from a CIE Lab tuple. Colors outside of the RGB
+        range are clamped.
+        """
+        import colorSpaces as sp
+        self.__rgb__ = list(sp.__labToRGB__(labValue))
+
+    @property
+    def lch(self):
+        """
+        Returns the color as a CIE LCh tuple, with the hue in degrees (0 - 360)
+        """
+        import colorSpaces as sp
+        return sp.__rgbToLCh__(self.rgb)
+
+    @lch.setter
+    def lch(self, lchValue):
+        """
+        Sets the color value from a CIE LCh tuple. Colors outside of the RGB
+        range are clamped.
+        """
+        import colorSpaces as sp
+        self.__rgb__ = list(sp.__lchToRGB__(lchValue))
+
+    def nearest_name(self, palette = None, metric = h.DEFAULT_METRIC):
+        """
+        Returns the name of the nearest color in COLORS, or the nearest entry
+        in the provided palette. The palette and metric are the same as the
+        ones used by a ColorIndex.
+        """
+        import colorSearch as cs
+        return cs.__getIndex__(palette, metric).nearest(self.rgb)
+
+    def blend(self, other, mode = h.DEFAULT_BLEND_MODE, alpha = 1.0):
+        """
+        Returns a new Color with the other color blended onto this one. The
+        mode is 'over', 'multiply', 'screen', 'overlay', 'darken' or
+        'lighten', and the other color covers this one by its own alpha
+        times the alpha (0 - 1).
+            Color('white').blend('red', 'multiply')   => (255, 0, 0)
+            Color('blue').blend('red', alpha = 0.5)   => (128, 0, 128)
+            Color('blue').blend('#FF000080')          => (128, 0, 127)
+        """
+        import colorBlend as cb
+        rgba = cb.__blendRGBA__(h.__rgbaFromColor__(self), h.__rgbaFromColor__(other), mode, alpha)
+        return Color.fromInt(h.__packRGB__(rgba[:3]), rgba[3])
+
+    def delta_e(self, other, formula = h.DEFAULT_DELTA_E_FORMULA):
+        """
+        Returns how different the other color looks from this one, as a
+        delta-E between their CIE Lab values. The formula is 'cie76',
+        'cie94' or 'ciede2000'. Alpha is ignored.
+            Color('red').delta_e('red')                     => 0.0
+            Color('black').delta_e('white', 'cie76')        => 100.0...
+        """
+        import colorDifference as cd
+        return cd.__deltaE__(self.rgb, h.__rgbFromColor__(other), formula)
+
+
+class FrozenColor(object):
+    """
+    Creates an immutable, hashable color, stored as a single integer packed
+    as 0xRRGGBB. It accepts the same values as the Color class, including
+    Color objects, and a Color can be created from a FrozenColor.
+    Missing values are stored as 0.
+        FrozenColor('#FF0000')          => 0xFF0000
+        FrozenColor(Color(0, 178, 0))   => 0x00B200
+        Color(FrozenColor('#144AB6'))   => (20, 74, 182)
+    The alpha is stored in the same integer, as 255 - alpha in the top byte,
+    so opaque colors keep their 0xRRGGBB value.
+        FrozenColor('#FF000080')        => 0x7FFF0000
+    Color names, and the hex strings of the colors in COLORS, return a shared
+    instance for each color instead of a new object.
+        FrozenColor('red') is FrozenColor(COLORS.RED)   => True
+    """
+    __slots__ = ['__value__']
+
+    def __new__(cls, *values):
+        if len(values) == 1 and isinstance(values[0], FrozenColor):
+            packedValue = values[0].__value__
+        elif len(values) == 1 and isinstance(values[0], Color):
+            packedValue = h.__packRGBA__(values[0].rgba)
+        else:
+            if cls is FrozenColor and len(values) == 1 and isinstance(values[0], h.STRING_TYPES):
+                internedColor = __internedColor__(values[0])
+                if internedColor is not None:
+                    return internedColor
+            packedValue = h.__packRGBA__(h.__rgbaFromValue__(values))
+
+        frozenColor = object.__new__(cls)
+        object.__setattr__(frozenColor, '__value__', packedValue)
+        return frozenColor
+
+    @classmethod
+    def fromInt(cls, packedValue, alpha = DEFAULT_ALPHA_VALUE):
+        """
+        Returns a FrozenColor from an integer packed as 0xRRGGBB, and an alpha
+        value (0 - 255), without parsing them.
+        """
+        if not h.__isIntType__(packedValue) or not 0 <= packedValue <= 0xFFFFFF:
+            raise ValueError('The packed color value must be an integer between 0 and 0xFFFFFF!')
+        if alpha.__class__ is not int or not 0 <= alpha <= DEFAULT_ALPHA_VALUE:
+            raise ValueError('The alpha must be an integer between 0 and 255!')
+
+        frozenColor = object.__new__(cls)
+        object.__setattr__(frozenColor, '__value__', packedValue if alpha == DEFAULT_ALPHA_VALUE else ((DEFAULT_ALPHA_VALUE - alpha) << 24) | packedValue)
+        return frozenColor
+
+    def __setattr__(self, name, value):
+        """
+        FrozenColor objects cannot be changed
+        """
+        raise AttributeError('FrozenColor objects cannot be changed!')
+
+    def __delattr__(self, name):
+        """
+        FrozenColor objects cannot be changed
+        """
+        raise AttributeError('FrozenColor objects cannot be changed!')
+
+    def __reduce__(self):
+        """
+        Pickles the color as its hex string
+        """
+        return (self.__class__, (self.hex,))
+
+    def __int__(self):
+        """
+        Returns the packed 0xRRGGBB value, without the alpha
+        """
+        return self.__value__ & 0xFFFFFF
+
+    def __hash__(self):
+        """
+        Returns the hash of the packed value
+        """
+        return hash(self.__value__)
+
+    def __orderValue__(self):
+        """
+        Returns the color packed as 0xRRGGBBAA, which orders colors by red,
+        green, blue, then alpha
+        """
+        return ((self.__value__ & 0xFFFFFF) << 8) | (DEFAULT_ALPHA_VALUE - (self.__value__ >> 24))
+
+    def __eq__(self, other):
+        """
+        Returns True if the other color has the same RGB and alpha values.
+        Colors and strings are compared the same way as Color.__eq__.
+        """
+        if isinstance(other, FrozenColor):
+            return self.__value__ == other.__value__
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() == otherValue
+
+    def __ne__(self, other):
+        """
+        Returns True if the other color has different RGB or alpha values
+        """
+        if isinstance(other, FrozenColor):
+            return self.__value__ != other.__value__
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() != otherValue
+
+    def __lt__(self, other):
+        """
+        Returns True if this color sorts before the other color. Colors are
+        ordered by red, green, blue, then alpha.
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() < otherValue
+
+    def __le__(self, other):
+        """
+        Returns True if this color sorts before or equal to the other color
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() <= otherValue
+
+    def __gt__(self, other):
+        """
+        Returns True if this color sorts after the other color
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() > otherValue
+
+    def __ge__(self, other):
+        """
+        Returns True if this color sorts after or equal to the other color
+        """
+        otherValue = __orderValueOf__(other)
+        return NotImplemented if otherValue is None else self.__orderValue__() >= otherValue
+
+    def __str__(self):
+        """
+        Returns the hex string for the color object
+        """
+        return self.hex
+
+    def __repr__(self):
+        """
+        Returns an evaluatable string representation of the hex string for the color object
+        """
+        return repr(self.hex)
+
+    def __copy__(self):
+        """
+        FrozenColor objects are immutable, so the object itself is returned
+        """
+        return self
+
+    def __deepcopy__(self, memo):
+        """
+        FrozenColor objects are immutable, so the object itself is returned
+        """
+        return self
+
+    @property
+    def rgb(self):
+        """
+        Returns the RGB values as a tuple
+        """
+        return h.__unpackRGB__(self.__value__)
+
+    @property
+    def rgba(self):
+        """
+        Returns the RGBA values as a tuple
+        """
+        return h.__unpackRGBA__(self.__value__)
+
+    @property
+    def hex(self):
+        """
+        Returns the color value in hex format. Colors that are not opaque are
+        formatted as '#RRGGBBAA'.
+        """
+        if self.__value__ <= 0xFFFFFF:
+            return '#%06X' % self.__value__
+        else:
+            return '#%06X%02X' % (self.__value__ & 0xFFFFFF, DEFAULT_ALPHA_VALUE - (self.__value__ >> 24))
+
+    @property
+    def red(self):
+        """
+        Returns the red color value
+        """
+        return (self.__value__ >> 16) & 0xFF
+
+    @property
+    def green(self):
+        """
+        Returns the green color value
+        """
+        return (self.__value__ >> 8) & 0xFF
+
+    @property
+    def blue(self):
+        """
+        Returns the blue color value
+        """
+        return self.__value__ & 0xFF
+
+    @property
+    def alpha(self):
+        """
+        Returns the alpha value, from 0 (transparent) to 255 (opaque)
+        """
+        return DEFAULT_ALPHA_VALUE - (self.__value__ >> 24)
+
+    @property
+    def hsl(self):
+        """
+        Returns the color as an HSL tuple. The hue is in degrees (0 - 360), and
+        the saturation and lightness are between 0 and 1.
+        """
+        import colorSpaces as sp
+        return sp.__rgbToHSL__(self.rgb)
+
+    @property
+    def hsv(self):
+        """
+        Returns the color as an HSV tuple. The hue is in degrees (0 - 360), and
+        the saturation and value are between 0 and 1.
+        """
+        import colorSpaces as sp
+        return sp.__rgbToHSV__(self.rgb)
+
+    @property
+    def xyz(self):
+        """
+        Returns the color as a CIE XYZ tuple, using the D65 reference white
+        """
+        import colorSpaces as sp
+        return sp.__rgbToXYZ__(self.rgb)
+
+    @property
+    def lab(self):
+        """
+        Returns the color as a CIE Lab tuple
+        """
+        import colorSpaces as sp
+        return sp.__rgbToLab__(self.rgb)
+
+    @property
+    def lch(self):
+        """
+        Returns the color as a CIE LCh tuple, with the hue in degrees (0 - 360)
+        """
+        import colorSpaces as sp
+        return sp.__rgbToLCh__(self.rgb)
+
+    def nearest_name(self, palette = None, metric = h.DEFAULT_METRIC):
+        """
+        Returns the name of the nearest color in COLORS, or the nearest entry
+        in the provided palette. The palette and metric are the same as the
+        ones used by a ColorIndex.
+        """
+        import colorSearch as cs
+        return cs.__getIndex__(palette, metric).nearest(self.rgb)
+
+    def blend(self, other, mode = h.DEFAULT_BLEND_MODE, alpha = 1.0):
+        """
+        Returns a new FrozenColor with the other color blended onto this one.
+        It takes the same modes and alpha as Color.blend.
+        """
+        import colorBlend as cb
+        rgba = cb.__blendRGBA__(h.__rgbaFromColor__(self), h.__rgbaFromColor__(other), mode, alpha)
+        return FrozenColor.fromInt(h.__packRGB__(rgba[:3]), rgba[3])
+
+    def delta_e(self, other, formula = h.DEFAULT_DELTA_E_FORMULA):
+        """
+        Returns the delta-E between this color and the other color, with the
+        same formulas as Color.delta_e
+        """
+        import colorDifference as cd
+        return cd.__deltaE__(self.rgb, h.__rgbFromColor__(other), formula)
+
 
 # Add all of the imports, except for the ignored names
 __all__ = sorted(set(locals().keys()) - _ignoredNames)
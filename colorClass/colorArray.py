@@ -0,0 +1,644 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Creates the ColorArray class, which stores many colors in a NumPy array.
+NumPy is optional. It is only imported when a ColorArray is first created,
+since importing it is slow.
+"""
+import helpers as h
+import colorSpaces as sp
+from color import Color, FrozenColor
+from colorBuffer import ColorBuffer
+
+# NumPy, once it has been imported by __requireNumpy__
+numpy = None
+
+# Upper case hex digits, used to format hex strings
+HEX_DIGITS = b'0123456789ABCDEF'
+
+
+def __requireNumpy__():
+    """
+    Imports NumPy the first time it's needed, and returns it. Raises an
+    ImportError if NumPy is not installed.
+    """
+    global numpy
+    if numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError('NumPy is required to use a ColorArray!')
+    return numpy
+
+
+def __hexDigitTable__():
+    """
+    Returns a 256-item array that maps an ASCII character code to its hex
+    digit value. Characters that are not hex digits are mapped to 16.
+    """
+    digitTable = numpy.full(256, 16, dtype = numpy.uint8)
+    for digitValue, digit in enumerate('0123456789ABCDEF'):
+        digitTable[ord(digit)] = digitValue
+        digitTable[ord(digit.lower())] = digitValue
+    return digitTable
+
+
+def __colorIntsFromArray__(values, isAlpha = False):
+    """
+    Returns a uint8 array from a numeric array, following the same rules as
+    __getColorInt__. Floats between 0 and 1 are percentages, and other values
+    are truncated to an integer. Values that are not between 0 and 255 are 0.
+    Note that every value in a float array is treated as a float, so a 1 in a
+    list that also has floats is read as 100%.
+    Alpha percentages are rounded half up instead, like __toAlphaInt__.
+    """
+    if values.dtype.kind in 'biu':
+        values = values.astype(numpy.int64)
+        return numpy.where((values >= 0) & (values <= 255), values, 0).astype(numpy.uint8)
+
+    values = values.astype(numpy.float64)
+    with numpy.errstate(invalid = 'ignore'):
+        isPercent = (values >= 0.0) & (values <= 1.0)
+        percentValues = numpy.floor(values * 255 + 0.5) if isAlpha else values * 255
+        values = numpy.trunc(numpy.where(isPercent, percentValues, values))
+        isValid = (values >= 0.0) & (values <= 255.0)
+    return numpy.where(isValid, values, 0).astype(numpy.uint8)
+
+
+def __channelIntsFromArray__(values):
+    """
+    Returns __colorIntsFromArray__ for an (N, channels) numeric array, with
+    the alpha rules for a fourth column
+    """
+    channelValues = __colorIntsFromArray__(values)
+    if values.shape[1] >= 4 and values.dtype.kind not in 'biu':
+        channelValues[:, 3] = __colorIntsFromArray__(values[:, 3], isAlpha = True)
+    return channelValues
+
+
+def __withAlpha__(rgb, alpha):
+    """
+    Returns the (N, 3) uint8 array of RGB values, or an (N, 4) RGBA array if
+    there is an array of alpha values. Opaque colors don't need one.
+    """
+    if alpha is None:
+        return rgb
+    else:
+        return numpy.column_stack((rgb, alpha))
+
+
+def __pixelsFromNumericArray__(values):
+    """
+    Returns an (N, 3) uint8 array from an (N, 1), (N, 2) or (N, 3) numeric
+    array, or an (N, 4) RGBA array from an (N, 4) array. Missing green or
+    blue columns are 0.
+    """
+    rgb = numpy.zeros((values.shape[0], max(values.shape[1], 3)), dtype = numpy.uint8)
+    rgb[:, :values.shape[1]] = __channelIntsFromArray__(values)
+    return rgb
+
+
+def __pixelsFromStringArray__(values):
+    """
+    Returns an (N, 3) uint8 array from a 1-D array of strings, or an (N, 4)
+    RGBA array if any of them have an alpha value. Hex strings are decoded
+    in a single vectorized pass, following the same patterns as
+    HEX_STRING_PATTERN and HEX_ALPHA_PATTERN. Everything else, like color
+    names or comma separated values, is parsed once per unique string.
+    """
+    rgb = numpy.zeros((len(values), 3), dtype = numpy.uint8)
+    alpha = None
+    if len(values) == 0:
+        return rgb
+
+    # View each string as a row of character codes. Strings are padded with 0,
+    # and an extra padding column is added so every row ends with a 0.
+    if values.dtype.kind == 'U':
+        width = values.dtype.itemsize // 4
+        codeType = numpy.uint32
+    else:
+        width = values.dtype.itemsize
+        codeType = numpy.uint8
+    codes = numpy.zeros((len(values), width + 1), dtype = numpy.uint32)
+    codes[:, :width] = numpy.ascontiguousarray(values).view(codeType).reshape(len(values), width)
+    # Anything outside of ASCII can't be a hex digit, whitespace or a hash
+    codes[codes > 127] = 127
+
+    blankTable = numpy.zeros(128, dtype = bool)
+    blankTable[[0, 9, 10, 11, 12, 13, 32]] = True
+    isBlank = blankTable[codes]
+    # isBlankToEnd[row, column] is True if every character from column onwards is blank
+    isBlankToEnd = numpy.logical_and.accumulate(isBlank[:, ::-1], axis = 1)[:, ::-1]
+
+    rows = numpy.arange(len(values))[:, numpy.newaxis]
+    firstCharacter = numpy.argmin(isBlank, axis = 1)
+    digitStart = firstCharacter + (codes[rows[:, 0], firstCharacter] == ord('#'))
+    digits = __hexDigitTable__()[codes]
+
+    isParsed = numpy.zeros(len(values), dtype = bool)
+    for digitCount in (2, 3, 4, 6, 8):
+        columns = numpy.minimum(digitStart[:, numpy.newaxis] + numpy.arange(digitCount), width)
+        rowDigits = digits[rows, columns].astype(numpy.uint16)
+        isHex = (rowDigits < 16).all(axis = 1) & isBlankToEnd[rows[:, 0], numpy.minimum(digitStart + digitCount, width)]
+        if not isHex.any():
+            continue
+
+        rowDigits = rowDigits[isHex]
+        if digitCount == 2:
+            rgb[isHex, 0] = rowDigits[:, 0] * 16 + rowDigits[:, 1]
+        elif digitCount in (3, 4):
+            rgb[isHex] = rowDigits[:, :3] * 17
+        else:
+            rgb[isHex] = rowDigits[:, 0:6:2] * 16 + rowDigits[:, 1:6:2]
+
+        # The alpha array is only created once a string has an alpha value
+        if digitCount in (4, 8):
+            if alpha is None:
+                alpha = numpy.full(len(values), h.DEFAULT_ALPHA_VALUE, dtype = numpy.uint8)
+            alpha[isHex] = rowDigits[:, 3] * 17 if digitCount == 4 else rowDigits[:, 6] * 16 + rowDigits[:, 7]
+        isParsed |= isHex
+
+    if not isParsed.all():
+        uniqueValues, uniqueIndexes = numpy.unique(values[~isParsed], return_inverse = True)
+        uniqueRGBA = numpy.zeros((len(uniqueValues), 4), dtype = numpy.uint8)
+        for uniqueIndex, value in enumerate(uniqueValues):
+            if isinstance(value, bytes):
+                value = value.decode('ascii', 'replace')
+            uniqueRGBA[uniqueIndex] = h.__rgbaFromColor__(value)
+        rgb[~isParsed] = uniqueRGBA[uniqueIndexes, :3]
+
+        if (uniqueRGBA[:, 3] != h.DEFAULT_ALPHA_VALUE).any():
+            if alpha is None:
+                alpha = numpy.full(len(values), h.DEFAULT_ALPHA_VALUE, dtype = numpy.uint8)
+            alpha[~isParsed] = uniqueRGBA[uniqueIndexes, 3]
+
+    return __withAlpha__(rgb, alpha)
+
+
+def __pixelsFromObjects__(values):
+    """
+    Returns an (N, 3) uint8 array from a sequence of any values that the Color
+    class accepts, or an (N, 4) RGBA array if any of them have an alpha value.
+    Each value is parsed on its own.
+    """
+    rgba = numpy.zeros((len(values), 4), dtype = numpy.uint8)
+    for colorIndex, value in enumerate(values):
+        rgba[colorIndex] = h.__rgbaFromColor__(value)
+
+    if (rgba[:, 3] == h.DEFAULT_ALPHA_VALUE).all():
+        return numpy.ascontiguousarray(rgba[:, :3])
+    else:
+        return rgba
+
+
+def __pixelArray__(pixels, channels, keepAlpha = False):
+    """
+    Returns an (N, 3) uint8 array of the RGB values of the pixels, and the
+    shape of the pixels without their channels. Pixels can be a ColorArray,
+    a ColorBuffer, which has its own number of channels, a NumPy array whose
+    last axis has the channels, any buffer of bytes with the channels of each
+    pixel in order, or a list of colors. Any channels after red, green and
+    blue, like alpha, are ignored, unless keepAlpha is True. Then pixels that
+    have an alpha channel return an (N, 4) RGBA array.
+    """
+    if channels < 3:
+        raise ValueError('The pixels must have at least 3 channels!')
+    lastChannel = 4 if keepAlpha else 3
+
+    if isinstance(pixels, ColorArray):
+        return (pixels.__pixels__ if keepAlpha else pixels.rgb), (len(pixels),)
+
+    if isinstance(pixels, ColorBuffer):
+        return pixels.pixels[:, :lastChannel], (len(pixels),)
+
+    if isinstance(pixels, numpy.ndarray):
+        if pixels.ndim < 2 or pixels.shape[-1] != channels:
+            raise ValueError('The last axis of the pixel array must have %i channels!' % channels)
+        rgb = pixels.reshape(-1, channels)[:, :lastChannel]
+        if rgb.dtype != numpy.uint8:
+            rgb = __channelIntsFromArray__(rgb)
+        return rgb, pixels.shape[:-1]
+
+    if isinstance(pixels, (bytes, bytearray, memoryview)) or hasattr(pixels, 'buffer_info'):
+        try:
+            values = numpy.frombuffer(pixels, dtype = numpy.uint8)
+        except (AttributeError, TypeError, ValueError):
+            values = numpy.frombuffer(memoryview(pixels).tobytes(), dtype = numpy.uint8)
+        if len(values) % channels != 0:
+            raise ValueError('The length of the pixel buffer must be a multiple of %i!' % channels)
+        rgb = values.reshape(-1, channels)[:, :lastChannel]
+        return rgb, (len(rgb),)
+
+    colors = ColorArray(pixels)
+    rgb = colors.__pixels__ if keepAlpha else colors.rgb
+    return rgb, (len(rgb),)
+
+
+def __isSingleColor__(value):
+    """
+    Returns True if the value is a single color, like 'red', (255, 0, 0) or a
+    Color, rather than an array of pixels
+    """
+    return not isinstance(value, (ColorArray, numpy.ndarray)) and (
+        hasattr(value, 'rgb') or h.__isStringType__(value) or h.__isTupleType__(value)
+    )
+
+
+# The channels of (chroma, second largest value, 0) that are red, green and
+# blue, for each 60 degree sector of the hue
+HUE_SECTOR_CHANNELS = ((0, 1, 2), (1, 0, 2), (2, 0, 1), (2, 1, 0), (1, 2, 0), (0, 2, 1))
+
+
+def __toChannelArray__(values):
+    """
+    Returns a uint8 array from an array of channel values between 0 and 1,
+    rounded and clamped the same way as __toChannel__.
+    """
+    return numpy.clip(numpy.floor(values * 255 + 0.5), 0, 255).astype(numpy.uint8)
+
+
+def __hueArray__(rgbValues, maxValue, delta):
+    """
+    Returns an array of hues, in degrees, from an (N, 3) array of RGB values
+    between 0 and 1.
+    """
+    red, green, blue = rgbValues[:, 0], rgbValues[:, 1], rgbValues[:, 2]
+    with numpy.errstate(divide = 'ignore', invalid = 'ignore'):
+        hue = numpy.where(
+            maxValue == red, ((green - blue) / delta) % 6,
+            numpy.where(maxValue == green, (blue - red) / delta + 2, (red - green) / delta + 4)
+        )
+    return numpy.where(delta == 0, 0.0, hue * 60 % 360)
+
+
+def __rgbArrayFromHue__(hue, chroma, minValue):
+    """
+    Returns an (N, 3) uint8 array from arrays of hues in degrees, chroma, and
+    the smallest channel values.
+    """
+    hue = (hue % 360) / 60.0
+    components = numpy.zeros((len(hue), 3))
+    components[:, 0] = chroma
+    components[:, 1] = chroma * (1 - numpy.abs(hue % 2 - 1))
+    sectors = numpy.clip(numpy.floor(hue).astype(numpy.int64), 0, 5)
+    channels = numpy.array(HUE_SECTOR_CHANNELS)[sectors]
+    rgbValues = components[numpy.arange(len(hue))[:, numpy.newaxis], channels]
+    return __toChannelArray__(rgbValues + minValue[:, numpy.newaxis])
+
+
+def __hslFromRGBArray__(rgb):
+    """
+    Returns an (N, 3) array of HSL values from an (N, 3) uint8 array
+    """
+    rgbValues = rgb / 255.0
+    maxValue = rgbValues.max(axis = 1)
+    minValue = rgbValues.min(axis = 1)
+    delta = maxValue - minValue
+    lightness = (maxValue + minValue) / 2
+    with numpy.errstate(divide = 'ignore', invalid = 'ignore'):
+        saturation = numpy.where(delta == 0, 0.0, delta / (1 - numpy.abs(2 * lightness - 1)))
+    return numpy.column_stack((__hueArray__(rgbValues, maxValue, delta), saturation, lightness))
+
+
+def __rgbArrayFromHSL__(hsl):
+    """
+    Returns an (N, 3) uint8 array from an (N, 3) array of HSL values
+    """
+    hue, saturation, lightness = hsl[:, 0], hsl[:, 1], hsl[:, 2]
+    chroma = (1 - numpy.abs(2 * lightness - 1)) * saturation
+    return __rgbArrayFromHue__(hue, chroma, lightness - chroma / 2)
+
+
+def __hsvFromRGBArray__(rgb):
+    """
+    Returns an (N, 3) array of HSV values from an (N, 3) uint8 array
+    """
+    rgbValues = rgb / 255.0
+    maxValue = rgbValues.max(axis = 1)
+    delta = maxValue - rgbValues.min(axis = 1)
+    with numpy.errstate(divide = 'ignore', invalid = 'ignore'):
+        saturation = numpy.where(maxValue == 0, 0.0, delta / maxValue)
+    return numpy.column_stack((__hueArray__(rgbValues, maxValue, delta), saturation, maxValue))
+
+
+def __rgbArrayFromHSV__(hsv):
+    """
+    Returns an (N, 3) uint8 array from an (N, 3) array of HSV values
+    """
+    hue, saturation, value = hsv[:, 0], hsv[:, 1], hsv[:, 2]
+    chroma = value * saturation
+    return __rgbArrayFromHue__(hue, chroma, value - chroma)
+
+
+def __xyzFromRGBArray__(rgb):
+    """
+    Returns an (N, 3) array of CIE XYZ values from an (N, 3) uint8 array,
+    using the sRGB linearization table.
+    """
+    linearValues = numpy.array(sp.SRGB_TO_LINEAR)[rgb]
+    return linearValues.dot(numpy.array(sp.RGB_TO_XYZ).T)
+
+
+def __rgbArrayFromXYZ__(xyz):
+    """
+    Returns an (N, 3) uint8 array from an (N, 3) array of CIE XYZ values. The
+    linear values are converted back with the same thresholds as
+    __delinearize__.
+    """
+    linearValues = xyz.dot(numpy.array(sp.XYZ_TO_RGB).T)
+    return numpy.searchsorted(numpy.array(sp.LINEAR_THRESHOLDS), linearValues, side = 'right').astype(numpy.uint8)
+
+
+def __labFromRGBArray__(rgb):
+    """
+    Returns an (N, 3) array of CIE Lab values from an (N, 3) uint8 array
+    """
+    relativeXYZ = __xyzFromRGBArray__(rgb) / numpy.array(sp.REFERENCE_WHITE)
+    transformed = numpy.where(
+        relativeXYZ > sp.LAB_EPSILON,
+        numpy.abs(relativeXYZ) ** (1 / 3.0),
+        relativeXYZ / (3 * (6 / 29.0) ** 2) + 4 / 29.0
+    )
+    x, y, z = transformed[:, 0], transformed[:, 1], transformed[:, 2]
+    return numpy.column_stack((116 * y - 16, 500 * (x - y), 200 * (y - z)))
+
+
+def __rgbArrayFromLab__(lab):
+    """
+    Returns an (N, 3) uint8 array from an (N, 3) array of CIE Lab values
+    """
+    y = (lab[:, 0] + 16) / 116.0
+    transformed = numpy.column_stack((y + lab[:, 1] / 500.0, y, y - lab[:, 2] / 200.0))
+    relativeXYZ = numpy.where(
+        transformed > 6 / 29.0,
+        transformed ** 3,
+        3 * (6 / 29.0) ** 2 * (transformed - 4 / 29.0)
+    )
+    return __rgbArrayFromXYZ__(relativeXYZ * numpy.array(sp.REFERENCE_WHITE))
+
+
+def __lchFromRGBArray__(rgb):
+    """
+    Returns an (N, 3) array of CIE LCh values from an (N, 3) uint8 array
+    """
+    lab = __labFromRGBArray__(rgb)
+    return numpy.column_stack((
+        lab[:, 0],
+        numpy.hypot(lab[:, 1], lab[:, 2]),
+        numpy.degrees(numpy.arctan2(lab[:, 2], lab[:, 1])) % 360
+    ))
+
+
+def __rgbArrayFromLCh__(lch):
+    """
+    Returns an (N, 3) uint8 array from an (N, 3) array of CIE LCh values
+    """
+    hue = numpy.radians(lch[:, 2])
+    return __rgbArrayFromLab__(numpy.column_stack((lch[:, 0], lch[:, 1] * numpy.cos(hue), lch[:, 1] * numpy.sin(hue))))
+
+
+# The functions that convert an (N, 3) uint8 array to each color space, and back
+ARRAY_COLOR_SPACES = {
+    'hsl': (__hslFromRGBArray__, __rgbArrayFromHSL__),
+    'hsv': (__hsvFromRGBArray__, __rgbArrayFromHSV__),
+    'xyz': (__xyzFromRGBArray__, __rgbArrayFromXYZ__),
+    'lab': (__labFromRGBArray__, __rgbArrayFromLab__),
+    'lch': (__lchFromRGBArray__, __rgbArrayFromLCh__)
+}
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+class ColorArray(object):
+    """
+    Stores many colors in an (N, 3) uint8 NumPy array. A ColorArray can be
+    created from a list of hex strings, color names, RGB tuples of integers
+    (0 - 255) or floats (0 - 1), Color objects, or an existing array.
+    Lists of strings and lists of tuples are converted in one vectorized pass,
+    and an (N, 3) uint8 array is used as-is, without copying it.
+    Colors with alpha values are stored as an (N, 4) RGBA array instead, so
+    each color is still a single 32-bit row. An (N, 4) uint8 array is also
+    used as-is. Arrays of opaque colors have no alpha column. A ColorBuffer
+    with 3 or 4 channels also shares its bytes with the ColorArray.
+    Indexing a ColorArray returns a Color, and slicing it returns a ColorArray
+    that shares the same array.
+        ColorArray(['#FFF', 'red', '0, 0, 128']).hex   => ['#FFFFFF', '#FF0000', '#000080']
+        ColorArray([(0, 178, 0), (0.5, 0.5, 0.5)]).rgb => [[0, 178, 0], [127, 127, 127]]
+        ColorArray(['#FF000080', 'blue']).alpha         => [128, 255]
+    """
+    __slots__ = ['__pixels__']
+
+    def __init__(self, values = None):
+        __requireNumpy__()
+
+        if values is None:
+            pixels = numpy.zeros((0, 3), dtype = numpy.uint8)
+
+        elif isinstance(values, ColorArray):
+            pixels = values.__pixels__.copy()
+
+        elif isinstance(values, ColorBuffer):
+            pixels = values.pixels if values.channels <= 4 else values.pixels[:, :3]
+
+        elif h.__isStringType__(values):
+            pixels = __pixelsFromStringArray__(numpy.array([values]))
+
+        else:
+            try:
+                arrayValues = numpy.asarray(values)
+            except ValueError:
+                arrayValues = None
+
+            if arrayValues is None or arrayValues.dtype.kind not in 'biufSU':
+                pixels = __pixelsFromObjects__(list(values))
+
+            elif arrayValues.dtype.kind in 'SU' and arrayValues.ndim == 1:
+                pixels = __pixelsFromStringArray__(arrayValues)
+
+            elif arrayValues.dtype.kind in 'biuf' and arrayValues.ndim == 2 and 1 <= arrayValues.shape[1] <= 4:
+                if arrayValues.dtype == numpy.uint8 and arrayValues.shape[1] >= 3:
+                    pixels = arrayValues
+                else:
+                    pixels = __pixelsFromNumericArray__(arrayValues)
+
+            elif arrayValues.dtype.kind in 'biuf' and arrayValues.ndim == 1 and len(arrayValues) == 0:
+                pixels = numpy.zeros((0, 3), dtype = numpy.uint8)
+
+            else:
+                pixels = __pixelsFromObjects__(list(values))
+
+        self.__pixels__ = pixels
+
+    @classmethod
+    def fromPacked(cls, packedValues):
+        """
+        Returns a ColorArray from a sequence of integers packed as 0xRRGGBB
+        """
+        __requireNumpy__()
+        packedValues = numpy.asarray(packedValues, dtype = numpy.uint32)
+        rgb = numpy.empty((len(packedValues), 3), dtype = numpy.uint8)
+        rgb[:, 0] = packedValues >> 16
+        rgb[:, 1] = packedValues >> 8
+        rgb[:, 2] = packedValues
+        return cls(rgb)
+
+    @classmethod
+    def fromSpace(cls, values, space):
+        """
+        Returns a ColorArray from an (N, 3) array of values in one of the
+        color spaces of the Color class: 'hsl', 'hsv', 'xyz', 'lab' or 'lch'.
+        Colors outside of the RGB range are clamped.
+            ColorArray.fromSpace([(0, 1, 0.5), (240, 1, 0.5)], 'hsl').hex  => ['#FF0000', '#0000FF']
+        """
+        __requireNumpy__()
+        if space not in ARRAY_COLOR_SPACES:
+            raise ValueError('The color space must be one of: %s' % ', '.join(sorted(ARRAY_COLOR_SPACES.keys())))
+        values = numpy.asarray(values, dtype = numpy.float64).reshape(-1, 3)
+        return cls(ARRAY_COLOR_SPACES[space][1](values))
+
+    def __len__(self):
+        """
+        Returns the number of colors
+        """
+        return len(self.__pixels__)
+
+    def __getitem__(self, index):
+        """
+        Returns a Color for an integer index. Any other index, like a slice,
+        returns a ColorArray.
+        """
+        if h.__isIntType__(index) or isinstance(index, numpy.integer):
+            return Color(tuple(int(item) for item in self.__pixels__[index]))
+        else:
+            return ColorArray(self.__pixels__[index])
+
+    def __iter__(self):
+        """
+        Returns each color as a Color object
+        """
+        for colorIndex in range(len(self)):
+            yield self[colorIndex]
+
+    def __str__(self):
+        """
+        Returns the hex strings for the colors
+        """
+        return str(list(self.hex))
+
+    def __repr__(self):
+        """
+        Returns a representation of the hex strings for the colors
+        """
+        return 'ColorArray(%r)' % list(self.hex)
+
+    @property
+    def rgb(self):
+        """
+        Returns the (N, 3) uint8 array of RGB values. This is the array used by
+        the ColorArray, or a view of its RGB columns, not a copy.
+        """
+        if self.__pixels__.shape[1] == 3:
+            return self.__pixels__
+        else:
+            return self.__pixels__[:, :3]
+
+    @property
+    def alpha(self):
+        """
+        Returns a uint8 array of alpha values, from 0 (transparent) to 255
+        (opaque). For colors that are stored with an alpha column, this is a
+        view of that column, not a copy.
+        """
+        if self.__pixels__.shape[1] == 3:
+            return numpy.full(len(self), h.DEFAULT_ALPHA_VALUE, dtype = numpy.uint8)
+        else:
+            return self.__pixels__[:, 3]
+
+    @property
+    def rgba(self):
+        """
+        Returns an (N, 4) uint8 array of RGBA values. For colors that are
+        stored with an alpha column, this is the array used by the ColorArray.
+        """
+        if self.__pixels__.shape[1] == 3:
+            return __withAlpha__(self.__pixels__, self.alpha)
+        else:
+            return self.__pixels__
+
+    @property
+    def hex(self):
+        """
+        Returns an array of hex strings, formatted as '#RRGGBB', or as
+        '#RRGGBBAA' for colors that are not opaque
+        """
+        hexDigits = numpy.frombuffer(HEX_DIGITS, dtype = numpy.uint8)
+        channels = self.__pixels__.shape[1]
+        characters = numpy.zeros((len(self), channels * 2 + 1), dtype = numpy.uint8)
+        characters[:, 0] = ord('#')
+        characters[:, 1::2] = hexDigits[self.__pixels__ >> 4]
+        characters[:, 2::2] = hexDigits[self.__pixels__ & 0x0F]
+        if channels == 4:
+            # Trailing zero bytes are dropped from each string
+            characters[self.__pixels__[:, 3] == h.DEFAULT_ALPHA_VALUE, 7:] = 0
+        return characters.view('S%i' % (channels * 2 + 1)).ravel().astype(str)
+
+    @property
+    def percent(self):
+        """
+        Returns an (N, 3) float array of RGB values between 0 and 1
+        """
+        return self.rgb / 255.0
+
+    @property
+    def hsl(self):
+        """
+        Returns an (N, 3) float array of HSL values, with the hue in degrees
+        """
+        return __hslFromRGBArray__(self.rgb)
+
+    @property
+    def hsv(self):
+        """
+        Returns an (N, 3) float array of HSV values, with the hue in degrees
+        """
+        return __hsvFromRGBArray__(self.rgb)
+
+    @property
+    def xyz(self):
+        """
+        Returns an (N, 3) float array of CIE XYZ values
+        """
+        return __xyzFromRGBArray__(self.rgb)
+
+    @property
+    def lab(self):
+        """
+        Returns an (N, 3) float array of CIE Lab values
+        """
+        return __labFromRGBArray__(self.rgb)
+
+    @property
+    def lch(self):
+        """
+        Returns an (N, 3) float array of CIE LCh values, with the hue in degrees
+        """
+        return __lchFromRGBArray__(self.rgb)
+
+    @property
+    def packed(self):
+        """
+        Returns a uint32 array with each color packed as 0xRRGGBB
+        """
+        rgb = self.rgb.astype(numpy.uint32)
+        return (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
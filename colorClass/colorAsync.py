@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Runs parsing, palette extraction and nearest name lookups for asyncio code,
+like an aiohttp service, without blocking the event loop. The work runs on a
+bounded executor, and identical requests that are running at the same time
+share one job.
+asyncio and concurrent.futures are only imported when a ColorService is
+first created. On Python 2, they are provided by the trollius and futures
+packages.
+"""
+import collections
+import helpers as h
+import colorParallel as cp
+import colorQuantize as cq
+import colorSearch as cs
+from color import FrozenColor
+
+# asyncio, once it has been imported by __requireAsyncio__
+asyncio = None
+
+# The number of jobs that run at the same time by default
+DEFAULT_WORKERS = 4
+
+# The number of jobs that can wait for a worker by default, before new
+# requests are refused
+DEFAULT_MAX_PENDING = 64
+
+
+def __requireAsyncio__():
+    """
+    Imports asyncio the first time it's needed, and returns it. Raises an
+    ImportError if neither asyncio nor trollius is installed.
+    """
+    global asyncio
+    if asyncio is None:
+        try:
+            import asyncio
+        except ImportError:
+            try:
+                import trollius as asyncio
+            except ImportError:
+                raise ImportError('asyncio is required to use a ColorService! On Python 2, it is provided by the trollius package.')
+    return asyncio
+
+
+def __parseJob__(value):
+    """
+    Returns the FrozenColor of a value
+    """
+    return FrozenColor(value)
+
+
+def __extractPaletteJob__(pixels, colors, method, channels, sample, seed):
+    """
+    Returns the quantized palette of the pixels, as FrozenColor objects
+    """
+    palette = cq.quantize(pixels, colors = colors, method = method, sample = sample, channels = channels, seed = seed)[0]
+    return [FrozenColor(color) for color in palette]
+
+
+def __nearestNameJob__(color, palette, metric):
+    """
+    Returns the name of the nearest color in the palette
+    """
+    return cs.__getIndex__(palette, metric).nearest(h.__rgbFromColor__(color))
+
+
+class __ServiceJob__(object):
+    """
+    A function call that one or more requests are waiting for. Each request
+    has its own asyncio future, so that cancelling one request doesn't
+    cancel the others.
+    """
+    __slots__ = ['key', 'function', 'args', 'requests', 'isStarted']
+
+    def __init__(self, key, function, args):
+        self.key = key
+        self.function = function
+        self.args = args
+        self.requests = []
+        self.isStarted = False
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+class ColorService(object):
+    """
+    Runs color work for asyncio code. Each method returns an asyncio future,
+    which a coroutine awaits for the result:
+        service = ColorService(workers = 4)
+        palette = await service.extract_palette(imageBytes, colors = 8)
+    At most workers jobs run at the same time, on a thread pool, or on the
+    provided concurrent.futures executor. Up to maxPending more jobs wait for
+    a worker, and after that new requests fail with asyncio.QueueFull right
+    away, so an overloaded service can turn requests away instead of piling
+    them up.
+    Requests with the same arguments share a job while it's waiting or
+    running, if the arguments are hashable. Cancelling a request only
+    cancels the job if no other request is waiting for it. A job that has
+    already started runs to the end, and its result is dropped.
+    The methods must be called from the thread that runs the event loop.
+    """
+    def __init__(self, workers = DEFAULT_WORKERS, maxPending = DEFAULT_MAX_PENDING, executor = None):
+        if not h.__isIntType__(workers) or workers < 1:
+            raise ValueError('The number of workers must be an integer of at least 1!')
+        if not h.__isIntType__(maxPending) or maxPending < 0:
+            raise ValueError('maxPending must be an integer of at least 0!')
+
+        __requireAsyncio__()
+        self.workers = workers
+        self.maxPending = maxPending
+        self.__ownsExecutor__ = executor is None
+        self.__executor__ = cp.__requireFutures__().ThreadPoolExecutor(max_workers = workers) if executor is None else executor
+        self.__jobs__ = dict()
+        self.__waitingJobs__ = collections.deque()
+        self.__runningCount__ = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    @property
+    def pending(self):
+        """
+        Returns the number of jobs that are waiting for a worker
+        """
+        return len(self.__waitingJobs__)
+
+    @property
+    def running(self):
+        """
+        Returns the number of jobs that are running
+        """
+        return self.__runningCount__
+
+    def __submit__(self, key, function, *args):
+        """
+        Returns an asyncio future for the result of the function. The
+        request joins the job with the same key, if there is one. Keys that
+        are None or can't be hashed are never shared.
+        """
+        request = asyncio.Future()
+        try:
+            hash(key)
+        except TypeError:
+            key = None
+
+        job = self.__jobs__.get(key) if key is not None else None
+        if job is None:
+            if self.__runningCount__ >= self.workers and len(self.__waitingJobs__) >= self.maxPending:
+                request.set_exception(asyncio.QueueFull())
+                return request
+
+            job = __ServiceJob__(key, function, args)
+            if key is not None:
+                self.__jobs__[key] = job
+            self.__waitingJobs__.append(job)
+
+        job.requests.append(request)
+        request.add_done_callback(lambda request: self.__requestDone__(job, request))
+        self.__startJobs__()
+        return request
+
+    def __startJobs__(self):
+        """
+        Starts waiting jobs, while there are free workers
+        """
+        loop = asyncio.get_event_loop()
+        while self.__waitingJobs__ and self.__runningCount__ < self.workers:
+            job = self.__waitingJobs__.popleft()
+            job.isStarted = True
+            self.__runningCount__ += 1
+            jobFuture = loop.run_in_executor(self.__executor__, job.function, *job.args)
+            jobFuture.add_done_callback(lambda jobFuture, job = job: self.__jobDone__(job, jobFuture))
+
+    def __jobDone__(self, job, jobFuture):
+        """
+        Passes the result of a job to its requests, and starts the next job
+        """
+        self.__runningCount__ -= 1
+        if job.key is not None and self.__jobs__.get(job.key) is job:
+            del self.__jobs__[job.key]
+
+        for request in job.requests:
+            if request.done():
+                continue
+            elif jobFuture.cancelled():
+                request.cancel()
+            elif jobFuture.exception() is not None:
+                request.set_exception(jobFuture.exception())
+            else:
+                request.set_result(jobFuture.result())
+
+        self.__startJobs__()
+
+    def __requestDone__(self, job, request):
+        """
+        Drops a cancelled request from its job, and drops the job if it
+        hasn't started and no other requests are waiting for it
+        """
+        if not request.cancelled() or request not in job.requests:
+            return
+
+        job.requests.remove(request)
+        if not job.requests and not job.isStarted:
+            self.__waitingJobs__.remove(job)
+            if job.key is not None and self.__jobs__.get(job.key) is job:
+                del self.__jobs__[job.key]
+
+    def parse(self, value):
+        """
+        Returns a future for the FrozenColor of the value
+            await service.parse('rgba(255, 0, 0, 0.5)')    => '#FF000080'
+        """
+        valueKey = h.__cacheKey__((value,))
+        return self.__submit__(None if valueKey is None else ('parse', valueKey), __parseJob__, value)
+
+    def extract_palette(self, pixels, colors = cq.DEFAULT_PALETTE_SIZE, method = cq.DEFAULT_QUANTIZE_METHOD, channels = 3, sample = None, seed = None):
+        """
+        Returns a future for the palette of the pixels, as a list of
+        FrozenColor objects sorted from the most to the least common. The
+        arguments are the same as quantize. Requests for the same bytes
+        share a job.
+            await service.extract_palette(imageBytes, colors = 2)  => ['#FF0000', '#0000FF']
+        """
+        key = ('extract_palette', pixels, colors, method, channels, sample, seed)
+        return self.__submit__(key, __extractPaletteJob__, pixels, colors, method, channels, sample, seed)
+
+    def nearest_name(self, color, palette = None, metric = cs.DEFAULT_METRIC):
+        """
+        Returns a future for the name of the nearest color in COLORS, or in
+        the provided palette, like Color.nearest_name
+            await service.nearest_name('#FE0101')  => 'Red'
+        """
+        colorKey = h.__cacheKey__((color,))
+        key = None if colorKey is None else ('nearest_name', colorKey, palette, metric)
+        return self.__submit__(key, __nearestNameJob__, color, palette, metric)
+
+    def close(self, wait = True):
+        """
+        Cancels the requests that are waiting for a worker, and shuts down
+        the executor if the service created it
+        """
+        while self.__waitingJobs__:
+            job = self.__waitingJobs__.popleft()
+            requests, job.requests = job.requests, []
+            for request in requests:
+                request.cancel()
+        self.__jobs__.clear()
+
+        if self.__ownsExecutor__:
+            self.__executor__.shutdown(wait = wait)
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
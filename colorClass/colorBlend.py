@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Blends colors with the usual compositing modes: over, multiply, screen,
+overlay, darken and lighten. The source color is blended onto the backdrop,
+and covers it by the source's own alpha times the alpha (0 - 1), like
+source-over compositing. Translucent backdrops keep an alpha of their own.
+Channels are blended as integers between 0 and 255, rounded to the nearest
+integer, so blending single colors and blending arrays of pixels give the
+same results. Arrays of pixels are blended with NumPy, which is only imported
+when they are first used.
+"""
+import math
+import helpers as h
+
+# NumPy, once it has been imported by __requireColorArray__
+numpy = None
+
+
+def __requireColorArray__():
+    """
+    Returns the colorArray module, and imports NumPy the first time it's
+    needed. colorArray is imported here instead of at the top, since it
+    imports the color module, which imports this one.
+    """
+    global numpy
+    import colorArray
+    numpy = colorArray.__requireNumpy__()
+    return colorArray
+
+
+def __over__(backdrop, source):
+    """
+    The source replaces the backdrop
+    """
+    return source
+
+
+def __multiply__(backdrop, source):
+    """
+    Multiplies the channels, which always darkens the backdrop
+        (255, 128) => 128
+    """
+    return (backdrop * source + 127) // 255
+
+
+def __screen__(backdrop, source):
+    """
+    Multiplies the inverted channels, which always lightens the backdrop
+        (0, 128) => 128
+    """
+    return 255 - __multiply__(255 - backdrop, 255 - source)
+
+
+def __overlay__(backdrop, source):
+    """
+    Multiplies dark backdrop channels, and screens light ones
+    """
+    if backdrop <= 127:
+        return __multiply__(2 * backdrop, source)
+    else:
+        return __screen__(2 * backdrop - 255, source)
+
+
+def __overlayArray__(backdrop, source):
+    """
+    Returns __overlay__ for arrays of channels
+    """
+    return numpy.where(backdrop <= 127, __multiply__(2 * backdrop, source), __screen__(2 * backdrop - 255, source))
+
+
+def __darkenArray__(backdrop, source):
+    """
+    Returns the smaller of each pair of channels
+    """
+    return numpy.minimum(backdrop, source)
+
+
+def __lightenArray__(backdrop, source):
+    """
+    Returns the larger of each pair of channels
+    """
+    return numpy.maximum(backdrop, source)
+
+
+# Blend mode => the functions that blend a pair of channels, and a pair of
+# int32 arrays of channels
+BLEND_MODES = {
+    'over': (__over__, __over__),
+    'multiply': (__multiply__, __multiply__),
+    'screen': (__screen__, __screen__),
+    'overlay': (__overlay__, __overlayArray__),
+    'darken': (min, __darkenArray__),
+    'lighten': (max, __lightenArray__)
+}
+
+DEFAULT_BLEND_MODE = h.DEFAULT_BLEND_MODE
+
+
+def __getBlendMode__(mode):
+    """
+    Returns the blend functions of a mode
+    """
+    if mode not in BLEND_MODES:
+        raise ValueError('The blend mode must be one of: %s' % ', '.join(sorted(BLEND_MODES.keys())))
+    return BLEND_MODES[mode]
+
+
+def __checkAlpha__(alpha):
+    """
+    Raises a ValueError if the alpha is not a number between 0 and 1
+    """
+    if not h.__isNumericType__(alpha) or not 0 <= alpha <= 1:
+        raise ValueError('The alpha must be a number between 0 and 1!')
+
+
+def __blendRGBA__(backdrop, source, mode = DEFAULT_BLEND_MODE, alpha = 1.0):
+    """
+    Returns the RGBA tuple of the source composited onto the backdrop. The
+    source is blended with the backdrop by the mode, then covers it by its
+    own alpha times alpha. Where the backdrop is translucent, the source
+    shows through unblended, and the alphas combine like source-over.
+        ((0, 0, 255, 255), (255, 0, 0, 128), 'over')        => (128, 0, 127, 255)
+        ((0, 0, 255, 0), (255, 0, 0, 128), 'over')          => (255, 0, 0, 128)
+    """
+    blendChannel = __getBlendMode__(mode)[0]
+    __checkAlpha__(alpha)
+
+    backdropAlpha = backdrop[3] / 255.0
+    sourceAlpha = source[3] / 255.0 * alpha
+    resultAlpha = 1 - (1 - sourceAlpha) * (1 - backdropAlpha)
+    weight = sourceAlpha / resultAlpha if resultAlpha else 0.0
+
+    rgba = []
+    for backdropChannel, sourceChannel in zip(backdrop[:3], source[:3]):
+        blended = blendChannel(backdropChannel, sourceChannel)
+        blended = blended + (sourceChannel - blended) * (1 - backdropAlpha)
+        rgba.append(int(math.floor(backdropChannel + (blended - backdropChannel) * weight + 0.5)))
+    rgba.append(int(math.floor(resultAlpha * 255 + 0.5)))
+    return tuple(rgba)
+
+
+def __blendRGB__(backdrop, source, mode = DEFAULT_BLEND_MODE, alpha = 1.0):
+    """
+    Returns the RGB tuple of an opaque source blended onto an opaque backdrop
+        ((255, 255, 255), (255, 0, 0), 'multiply')      => (255, 0, 0)
+        ((0, 0, 255), (255, 0, 0), 'over', 0.5)         => (128, 0, 128)
+    """
+    opaque = (h.DEFAULT_ALPHA_VALUE,)
+    return __blendRGBA__(tuple(backdrop[:3]) + opaque, tuple(source[:3]) + opaque, mode, alpha)[:3]
+
+
+def __blendArray__(backdrop, source, blendArray, alpha):
+    """
+    Returns __blendRGBA__ for an (N, 3) or (N, 4) uint8 array of backdrop
+    pixels, and a (1, 4) or (N, 4) int32 array of source pixels. alpha is a
+    float, or an (N, 1) float array. The result has an alpha column if the
+    backdrop does.
+    """
+    backdropRGB = backdrop[:, :3].astype(numpy.int32)
+    backdropAlpha = backdrop[:, 3:] / 255.0 if backdrop.shape[1] == 4 else 1.0
+    sourceRGB = source[:, :3]
+    sourceAlpha = source[:, 3:] / 255.0 * alpha
+    resultAlpha = 1 - (1 - sourceAlpha) * (1 - backdropAlpha)
+    hasAlpha = resultAlpha > 0
+    weight = numpy.where(hasAlpha, sourceAlpha / numpy.where(hasAlpha, resultAlpha, 1.0), 0.0)
+
+    blended = blendArray(backdropRGB, sourceRGB)
+    blended = blended + (sourceRGB - blended) * (1 - backdropAlpha)
+    rgb = numpy.floor(backdropRGB + (blended - backdropRGB) * weight + 0.5).astype(numpy.uint8)
+    if backdrop.shape[1] == 3:
+        return rgb
+
+    alphaValues = numpy.floor(resultAlpha * 255 + 0.5).astype(numpy.uint8)
+    return numpy.column_stack((rgb, numpy.broadcast_to(alphaValues, (len(rgb), 1))))
+
+
+def __alphaArray__(alpha, pixelCount):
+    """
+    Returns the alpha as a float, or as a float array with one row per pixel.
+    A uint8 array of alphas is read as 0 - 255.
+    """
+    if h.__isNumericType__(alpha):
+        __checkAlpha__(alpha)
+        return alpha
+
+    alpha = numpy.asarray(alpha)
+    if alpha.dtype == numpy.uint8:
+        alpha = alpha / 255.0
+    alpha = alpha.astype(numpy.float64).reshape(-1)
+    if len(alpha) != pixelCount:
+        raise ValueError('There must be one alpha for each pixel!')
+    if (alpha < 0).any() or (alpha > 1).any():
+        raise ValueError('The alpha must be a number between 0 and 1!')
+    return alpha[:, numpy.newaxis]
+
+
+def __writePixels__(out, pixels, colorArray):
+    """
+    Copies a uint8 array of RGB or RGBA pixels into out, which can be a
+    ColorArray, a ColorBuffer, a NumPy array, or a writable buffer with the
+    same number of bytes.
+    """
+    channels = pixels.shape[-1]
+    if isinstance(out, colorArray.ColorArray):
+        out = out.__pixels__[:, :channels]
+    elif isinstance(out, colorArray.ColorBuffer):
+        out = out.pixels[:, :channels]
+
+    if isinstance(out, numpy.ndarray):
+        if out.size != pixels.size:
+            raise ValueError('The output must have the same number of channels as the pixels!')
+        out[...] = pixels.reshape(out.shape)
+        return
+
+    try:
+        outValues = numpy.frombuffer(out, dtype = numpy.uint8)
+    except (AttributeError, TypeError, ValueError):
+        outValues = None
+
+    if outValues is not None and len(outValues) != pixels.size:
+        raise ValueError('The output must have the same number of channels as the pixels!')
+    elif outValues is not None and outValues.flags.writeable:
+        outValues[:] = pixels.reshape(-1)
+    elif len(out) != pixels.size:
+        raise ValueError('The output must have the same number of channels as the pixels!')
+    else:
+        out[:] = pixels.tobytes()
+
+
+def __channelCount__(pixels, channels):
+    """
+    Returns the number of channels of each pixel. By default, NumPy arrays
+    have the channels of their last axis, and buffers have 3.
+    """
+    if channels is not None:
+        return channels
+    elif isinstance(pixels, numpy.ndarray) and pixels.ndim >= 2:
+        return pixels.shape[-1]
+    else:
+        return 3
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+def blend_many(backdrop, source, mode = DEFAULT_BLEND_MODE, alpha = 1.0, out = None, channels = None):
+    """
+    Blends an array of source pixels onto an array of backdrop pixels, in one
+    vectorized pass. Pixels can be a ColorArray, a ColorBuffer, a uint8 NumPy
+    array whose last axis is RGB or RGBA, like an (H, W, 4) image, a buffer
+    of bytes, or a list of colors. The source can also be a single color,
+    like 'red' or (255, 0, 0, 128), which is blended onto every pixel.
+    channels is the number of channels of each pixel in buffers and NumPy
+    arrays. By default, NumPy arrays use their last axis, and buffers have 3.
+    The alpha of each source pixel is multiplied by alpha, which is a number
+    between 0 and 1, or an array with an alpha for each pixel, as floats
+    between 0 and 1 or as uint8 values.
+    Returns the blended pixels as a uint8 array with the shape of the
+    backdrop, or as a ColorArray if the backdrop is one. Backdrops with an
+    alpha channel keep it, with the source alpha composited onto it. If out
+    is provided, the pixels are written into it, and out is returned. out
+    can be the backdrop, to blend in place.
+        blend_many(ColorArray(['white', 'gray']), 'red', 'multiply').hex    => ['#FF0000', '#800000']
+        blend_many(ColorArray(['blue']), '#FF000080').hex                   => ['#80007F']
+    """
+    colorArray = __requireColorArray__()
+    blendArray = __getBlendMode__(mode)[1]
+    backdropValues, pixelShape = colorArray.__pixelArray__(backdrop, __channelCount__(backdrop, channels), keepAlpha = True)
+
+    if colorArray.__isSingleColor__(source):
+        sourceValues = numpy.array([h.__rgbaFromColor__(source)], dtype = numpy.int32)
+    else:
+        sourceValues = colorArray.__pixelArray__(source, __channelCount__(source, channels), keepAlpha = True)[0]
+        if len(sourceValues) != len(backdropValues):
+            raise ValueError('The source must have the same number of pixels as the backdrop!')
+        if sourceValues.shape[1] == 3:
+            sourceValues = colorArray.__withAlpha__(sourceValues, numpy.full(len(sourceValues), h.DEFAULT_ALPHA_VALUE, dtype = numpy.uint8))
+        sourceValues = sourceValues.astype(numpy.int32)
+
+    alpha = __alphaArray__(alpha, len(backdropValues))
+    blended = __blendArray__(backdropValues, sourceValues, blendArray, alpha)
+
+    pixels = blended.reshape(tuple(pixelShape) + (blended.shape[1],))
+    if out is not None:
+        __writePixels__(out, pixels, colorArray)
+        return out
+    elif isinstance(backdrop, colorArray.ColorArray):
+        return colorArray.ColorArray(blended)
+    else:
+        return pixels
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
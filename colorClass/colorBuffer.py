@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Stores a sequence of colors as packed bytes, with channels bytes for each
+color, in any object that has the buffer protocol: a bytearray, bytes, an
+array('B'), an mmap, or a uint8 NumPy array. The bytes are never copied, so
+pixels can be passed from a decoder to the color tools, and back, without
+building a list of tuples. Colors are only created when they're read.
+"""
+import struct
+import helpers as h
+from color import Color, FrozenColor
+
+# The Python 2 buffer type, which wraps objects like array('B') and mmap that
+# only have the old buffer interface. Python 3 doesn't need it.
+try:
+    oldBuffer = buffer
+except NameError:
+    oldBuffer = None
+
+# Number of channels => the struct that reads or writes one color
+__channelStructs__ = dict()
+
+
+def __requireColorArray__():
+    """
+    Returns the colorArray module, and imports NumPy the first time it's
+    needed. colorArray is imported here instead of at the top, since it
+    imports this module.
+    """
+    import colorArray
+    colorArray.__requireNumpy__()
+    return colorArray
+
+
+def __channelStruct__(channels):
+    """
+    Returns the struct that reads or writes the channels of one color
+    """
+    channelStruct = __channelStructs__.get(channels)
+    if channelStruct is None:
+        channelStruct = __channelStructs__[channels] = struct.Struct('%iB' % channels)
+    return channelStruct
+
+
+def __byteSource__(source):
+    """
+    Returns a flat object with one byte per item over the same memory as the
+    source, and a memoryview of it. Raises a TypeError if the source doesn't
+    have the buffer protocol, and a ValueError if its items aren't bytes.
+    Multidimensional NumPy arrays are flattened, which only copies them if
+    they aren't C-contiguous.
+    On Python 2, array('B') and mmap only have the old buffer interface, so
+    the memoryview is of a read-only buffer over them. The object itself is
+    still returned, and struct writes into it directly.
+    """
+    if getattr(source, 'ndim', 1) != 1 and hasattr(source, 'reshape'):
+        source = source.reshape(-1)
+
+    try:
+        view = memoryview(source)
+    except TypeError:
+        if oldBuffer is None:
+            raise
+        view = memoryview(oldBuffer(source))
+
+    if view.itemsize != 1:
+        raise ValueError('The buffer must have one byte for each channel!')
+    elif view.ndim != 1 or view.format != 'B':
+        if not hasattr(view, 'cast'):
+            raise ValueError('The buffer must be a flat buffer of bytes!')
+        source = view = view.cast('B')
+    return source, view
+
+
+def __isSingleColor__(value):
+    """
+    Returns True if the value is one color, like 'red', (255, 0, 0) or a
+    Color, rather than a sequence of colors or a buffer. On Python 2, str is
+    also bytes, so it's only one color if it's a color name, a hex string or
+    an rgb() call.
+    """
+    if isinstance(value, (Color, FrozenColor)):
+        return True
+    elif isinstance(value, tuple):
+        return len(value) > 0 and all(h.__isNumericType__(item) for item in value)
+    elif isinstance(value, bytes) and not isinstance(value, str):
+        return False
+    elif isinstance(value, h.STRING_TYPES):
+        return not isinstance(value, bytes) or h.__rgbaFromColorString__(value) is not None
+    else:
+        return False
+
+
+def __packColors__(colors, channels):
+    """
+    Returns a bytearray of the channels of each color. Channels after alpha
+    are 0.
+        (['red', '#0000FF80'], 4)   => bytearray(b'\\xff\\x00\\x00\\xff\\x00\\x00\\xff\\x80')
+    """
+    padding = bytearray(max(channels - 4, 0))
+    packedBytes = bytearray()
+    for value in colors:
+        rgba = h.__rgbaFromColor__(value)
+        packedBytes.extend(rgba if channels >= 4 else rgba[:3])
+        packedBytes.extend(padding)
+    return packedBytes
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+class ColorBuffer(object):
+    """
+    A sequence of colors stored as packed bytes, with channels bytes for each
+    color: red, green, blue, then alpha if there are at least 4 channels. Any
+    more channels are ignored.
+    source can be any object with the buffer protocol, like bytes, a
+    bytearray, an array('B'), an mmap or a uint8 NumPy array, which is used
+    without copying it. It can also be a number of colors, for a new buffer
+    of black colors, or a list of colors, which are parsed into a new
+    bytearray.
+    Indexing a ColorBuffer returns a FrozenColor, which is only created when
+    it's read, and colors can be set if the source is writable. Slicing it
+    returns a ColorBuffer that shares the same bytes.
+    The view property is a memoryview of the bytes, and on Python 3.12 and
+    later, a ColorBuffer has the buffer protocol itself. On Python 2, the
+    view of an array('B') or an mmap is read-only, but colors can still be
+    set through the ColorBuffer.
+        ColorBuffer(b'\\xff\\x00\\x00\\x00\\x00\\xff')[1]          => '#0000FF'
+        ColorBuffer(['red', 'blue']).view.tobytes()         => b'\\xff\\x00\\x00\\x00\\x00\\xff'
+    """
+    __slots__ = ['channels', '__source__', '__view__', '__offset__', '__count__', '__struct__']
+
+    def __init__(self, source = None, channels = 3):
+        if not h.__isIntType__(channels) or channels < 3:
+            raise ValueError('The pixels must have at least 3 channels!')
+
+        if source is None:
+            source = bytearray()
+        elif h.__isIntType__(source):
+            source = bytearray(source * channels)
+        elif __isSingleColor__(source):
+            raise ValueError('The source must be a buffer, a number of colors or a list of colors, not a single color!')
+
+        try:
+            source, view = __byteSource__(source)
+        except TypeError:
+            source, view = __byteSource__(__packColors__(source, channels))
+
+        if len(view) % channels != 0:
+            raise ValueError('The length of the pixel buffer must be a multiple of %i!' % channels)
+
+        self.channels = channels
+        self.__source__ = source
+        self.__view__ = view
+        self.__offset__ = 0
+        self.__count__ = len(view) // channels
+        self.__struct__ = __channelStruct__(channels)
+
+    def __len__(self):
+        """
+        Returns the number of colors
+        """
+        return self.__count__
+
+    def __byteOffset__(self, index):
+        """
+        Returns the offset of the first byte of a color
+        """
+        if not h.__isIntType__(index):
+            index = int(index)
+        if index < 0:
+            index += self.__count__
+        if not 0 <= index < self.__count__:
+            raise IndexError('ColorBuffer index out of range')
+        return self.__offset__ + index * self.channels
+
+    def __getitem__(self, index):
+        """
+        Returns a FrozenColor for an integer index. A slice returns a
+        ColorBuffer that shares the same bytes, and must have a step of 1.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__count__)
+            if step != 1:
+                raise ValueError('ColorBuffer slices must have a step of 1!')
+
+            colorBuffer = ColorBuffer.__new__(ColorBuffer)
+            colorBuffer.channels = self.channels
+            colorBuffer.__source__ = self.__source__
+            colorBuffer.__view__ = self.__view__
+            colorBuffer.__offset__ = self.__offset__ + start * self.channels
+            colorBuffer.__count__ = max(stop - start, 0)
+            colorBuffer.__struct__ = self.__struct__
+            return colorBuffer
+
+        channelValues = self.__struct__.unpack_from(self.__source__, self.__byteOffset__(index))
+        red, green, blue = channelValues[:3]
+        alpha = channelValues[3] if self.channels >= 4 else h.DEFAULT_ALPHA_VALUE
+        return FrozenColor.fromInt((red << 16) | (green << 8) | blue, alpha)
+
+    def __setitem__(self, index, value):
+        """
+        Sets the color at an integer index from any color value. Channels
+        after alpha are left as they are. The bytes are written into the
+        source itself, so this works for every writable source, including
+        array('B') and mmap on Python 2.
+        """
+        offset = self.__byteOffset__(index)
+        rgba = h.__rgbaFromColor__(value)
+        channelValues = rgba if self.channels >= 4 else rgba[:3]
+        __channelStruct__(len(channelValues)).pack_into(self.__source__, offset, *channelValues)
+
+    def __iter__(self):
+        """
+        Returns each color as a FrozenColor
+        """
+        for colorIndex in range(self.__count__):
+            yield self[colorIndex]
+
+    def __repr__(self):
+        """
+        Returns a representation of the hex strings for the colors
+        """
+        return 'ColorBuffer(%r)' % [color.hex for color in self]
+
+    def __buffer__(self, flags):
+        """
+        Returns the view, for the buffer protocol on Python 3.12 and later
+        """
+        return self.view
+
+    @property
+    def view(self):
+        """
+        Returns a memoryview of the bytes of the colors, without copying them
+        """
+        return self.__view__[self.__offset__:self.__offset__ + self.__count__ * self.channels]
+
+    @property
+    def pixels(self):
+        """
+        Returns an (N, channels) uint8 NumPy array over the same bytes. It
+        is read-only if the source is.
+        """
+        numpy = __requireColorArray__().numpy
+        values = numpy.frombuffer(self.__source__, dtype = numpy.uint8, count = self.__count__ * self.channels, offset = self.__offset__)
+        return values.reshape(-1, self.channels)
+
+    def tobytes(self):
+        """
+        Returns a copy of the bytes of the colors
+        """
+        return self.view.tobytes()
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Measures how different two colors look, as a delta-E between their CIE Lab
+values, with the CIE76, CIE94 or CIEDE2000 formula. Single pairs of colors
+are compared in pure Python, and arrays of colors are compared with NumPy,
+which is only imported when they are first used.
+Each color is converted to Lab once: single colors through a small cache,
+and arrays of colors before any pairs are compared.
+"""
+from __future__ import division
+import math
+import helpers as h
+import colorSpaces as sp
+
+# NumPy, once it has been imported by __requireColorArray__
+numpy = None
+
+# The number of Lab values kept for single colors. The cache is emptied once
+# it is full, which is cheaper than tracking the least recently used color.
+LAB_CACHE_SIZE = 4096
+
+# The number of distances delta_e_matrix computes at a time, which limits the
+# size of the arrays it needs
+DELTA_E_CHUNK_SIZE = 1 << 20
+
+# CIE94 constants, for graphic arts
+CIE94_K1 = 0.045
+CIE94_K2 = 0.015
+
+# 25 ** 7, used by CIEDE2000
+POW25_7 = 25 ** 7
+
+# Packed 0xRRGGBB value => Lab tuple
+__labCache__ = dict()
+
+
+def __requireColorArray__():
+    """
+    Returns the colorArray module, and imports NumPy the first time it's
+    needed. colorArray is imported here instead of at the top, since it
+    imports the color module, which imports this one.
+    """
+    global numpy
+    import colorArray
+    numpy = colorArray.__requireNumpy__()
+    return colorArray
+
+
+def __cachedLab__(rgb):
+    """
+    Returns the Lab tuple of an RGB tuple, from the cache if it's there
+    """
+    packedValue = h.__packRGB__(rgb)
+    lab = __labCache__.get(packedValue)
+    if lab is None:
+        if len(__labCache__) >= LAB_CACHE_SIZE:
+            __labCache__.clear()
+        lab = __labCache__[packedValue] = sp.__rgbToLab__(rgb)
+    return lab
+
+
+def __cie76__(lab, otherLab):
+    """
+    Returns the CIE76 delta-E, the straight-line distance between two Lab
+    tuples
+    """
+    return math.sqrt(sum((value - otherValue) ** 2 for value, otherValue in zip(lab, otherLab)))
+
+
+def __cie94__(lab, otherLab):
+    """
+    Returns the CIE94 delta-E between two Lab tuples, using the graphic arts
+    constants. The first color is the reference, so the result can change
+    if the colors are swapped.
+    """
+    lightness, a, b = lab
+    otherLightness, otherA, otherB = otherLab
+    chroma = math.hypot(a, b)
+    deltaChroma = chroma - math.hypot(otherA, otherB)
+    deltaHueSquared = max((a - otherA) ** 2 + (b - otherB) ** 2 - deltaChroma ** 2, 0.0)
+    return math.sqrt(
+        (lightness - otherLightness) ** 2
+        + (deltaChroma / (1 + CIE94_K1 * chroma)) ** 2
+        + deltaHueSquared / (1 + CIE94_K2 * chroma) ** 2
+    )
+
+
+def __ciede2000__(lab, otherLab):
+    """
+    Returns the CIEDE2000 delta-E between two Lab tuples, following Sharma,
+    Wu and Dalal's implementation notes
+        ((50, 2.6772, -79.7751), (50, 0, -82.7485))    => 2.0425
+    """
+    lightness, a, b = lab
+    otherLightness, otherA, otherB = otherLab
+
+    meanChroma = (math.hypot(a, b) + math.hypot(otherA, otherB)) / 2
+    g = 0.5 * (1 - math.sqrt(meanChroma ** 7 / (meanChroma ** 7 + POW25_7)))
+    a, otherA = a * (1 + g), otherA * (1 + g)
+    chroma, otherChroma = math.hypot(a, b), math.hypot(otherA, otherB)
+    hue = math.degrees(math.atan2(b, a)) % 360 if chroma else 0.0
+    otherHue = math.degrees(math.atan2(otherB, otherA)) % 360 if otherChroma else 0.0
+
+    hueDifference = otherHue - hue
+    if chroma * otherChroma == 0:
+        hueDifference = 0.0
+    elif hueDifference > 180:
+        hueDifference -= 360
+    elif hueDifference < -180:
+        hueDifference += 360
+
+    deltaLightness = otherLightness - lightness
+    deltaChroma = otherChroma - chroma
+    deltaHue = 2 * math.sqrt(chroma * otherChroma) * math.sin(math.radians(hueDifference) / 2)
+
+    meanLightness = (lightness + otherLightness) / 2
+    meanChroma = (chroma + otherChroma) / 2
+    meanHue = hue + otherHue
+    if chroma * otherChroma != 0:
+        if abs(hue - otherHue) <= 180:
+            meanHue /= 2
+        elif meanHue < 360:
+            meanHue = (meanHue + 360) / 2
+        else:
+            meanHue = (meanHue - 360) / 2
+
+    t = (
+        1 - 0.17 * math.cos(math.radians(meanHue - 30)) + 0.24 * math.cos(math.radians(2 * meanHue))
+        + 0.32 * math.cos(math.radians(3 * meanHue + 6)) - 0.20 * math.cos(math.radians(4 * meanHue - 63))
+    )
+    rotation = 30 * math.exp(-((meanHue - 275) / 25) ** 2)
+    chromaRotation = 2 * math.sqrt(meanChroma ** 7 / (meanChroma ** 7 + POW25_7))
+    lightnessWeight = 1 + 0.015 * (meanLightness - 50) ** 2 / math.sqrt(20 + (meanLightness - 50) ** 2)
+    chromaWeight = 1 + 0.045 * meanChroma
+    hueWeight = 1 + 0.015 * meanChroma * t
+    rotationTerm = -math.sin(math.radians(2 * rotation)) * chromaRotation
+
+    return math.sqrt(max(
+        (deltaLightness / lightnessWeight) ** 2 + (deltaChroma / chromaWeight) ** 2 + (deltaHue / hueWeight) ** 2
+        + rotationTerm * (deltaChroma / chromaWeight) * (deltaHue / hueWeight),
+        0.0
+    ))
+
+
+def __cie76Array__(lab, otherLab):
+    """
+    Returns __cie76__ for arrays of Lab values, whose last axis is L, a and b
+    """
+    return numpy.sqrt(((lab - otherLab) ** 2).sum(axis = -1))
+
+
+def __cie94Array__(lab, otherLab):
+    """
+    Returns __cie94__ for arrays of Lab values
+    """
+    chroma = numpy.hypot(lab[..., 1], lab[..., 2])
+    deltaChroma = chroma - numpy.hypot(otherLab[..., 1], otherLab[..., 2])
+    deltaHueSquared = numpy.maximum(((lab[..., 1:] - otherLab[..., 1:]) ** 2).sum(axis = -1) - deltaChroma ** 2, 0.0)
+    return numpy.sqrt(
+        (lab[..., 0] - otherLab[..., 0]) ** 2
+        + (deltaChroma / (1 + CIE94_K1 * chroma)) ** 2
+        + deltaHueSquared / (1 + CIE94_K2 * chroma) ** 2
+    )
+
+
+def __ciede2000Array__(lab, otherLab):
+    """
+    Returns __ciede2000__ for arrays of Lab values
+    """
+    lightness, a, b = lab[..., 0], lab[..., 1], lab[..., 2]
+    otherLightness, otherA, otherB = otherLab[..., 0], otherLab[..., 1], otherLab[..., 2]
+
+    meanChroma = (numpy.hypot(a, b) + numpy.hypot(otherA, otherB)) / 2
+    g = 0.5 * (1 - numpy.sqrt(meanChroma ** 7 / (meanChroma ** 7 + POW25_7)))
+    a, otherA = a * (1 + g), otherA * (1 + g)
+    chroma, otherChroma = numpy.hypot(a, b), numpy.hypot(otherA, otherB)
+    hue = numpy.where(chroma > 0, numpy.degrees(numpy.arctan2(b, a)) % 360, 0.0)
+    otherHue = numpy.where(otherChroma > 0, numpy.degrees(numpy.arctan2(otherB, otherA)) % 360, 0.0)
+
+    hasChroma = chroma * otherChroma != 0
+    hueDifference = otherHue - hue
+    hueDifference = numpy.where(hueDifference > 180, hueDifference - 360, numpy.where(hueDifference < -180, hueDifference + 360, hueDifference))
+    hueDifference = numpy.where(hasChroma, hueDifference, 0.0)
+
+    deltaLightness = otherLightness - lightness
+    deltaChroma = otherChroma - chroma
+    deltaHue = 2 * numpy.sqrt(chroma * otherChroma) * numpy.sin(numpy.radians(hueDifference) / 2)
+
+    meanLightness = (lightness + otherLightness) / 2
+    meanChroma = (chroma + otherChroma) / 2
+    hueSum = hue + otherHue
+    meanHue = numpy.where(
+        ~hasChroma, hueSum,
+        numpy.where(numpy.abs(hue - otherHue) <= 180, hueSum / 2, numpy.where(hueSum < 360, (hueSum + 360) / 2, (hueSum - 360) / 2))
+    )
+
+    t = (
+        1 - 0.17 * numpy.cos(numpy.radians(meanHue - 30)) + 0.24 * numpy.cos(numpy.radians(2 * meanHue))
+        + 0.32 * numpy.cos(numpy.radians(3 * meanHue + 6)) - 0.20 * numpy.cos(numpy.radians(4 * meanHue - 63))
+    )
+    rotation = 30 * numpy.exp(-((meanHue - 275) / 25) ** 2)
+    chromaRotation = 2 * numpy.sqrt(meanChroma ** 7 / (meanChroma ** 7 + POW25_7))
+    lightnessWeight = 1 + 0.015 * (meanLightness - 50) ** 2 / numpy.sqrt(20 + (meanLightness - 50) ** 2)
+    chromaWeight = 1 + 0.045 * meanChroma
+    hueWeight = 1 + 0.015 * meanChroma * t
+    rotationTerm = -numpy.sin(numpy.radians(2 * rotation)) * chromaRotation
+
+    return numpy.sqrt(numpy.maximum(
+        (deltaLightness / lightnessWeight) ** 2 + (deltaChroma / chromaWeight) ** 2 + (deltaHue / hueWeight) ** 2
+        + rotationTerm * (deltaChroma / chromaWeight) * (deltaHue / hueWeight),
+        0.0
+    ))
+
+
+# Formula name => the functions that compare a pair of Lab tuples, and a pair
+# of arrays of Lab values
+DELTA_E_FORMULAS = {
+    'cie76': (__cie76__, __cie76Array__),
+    'cie94': (__cie94__, __cie94Array__),
+    'ciede2000': (__ciede2000__, __ciede2000Array__)
+}
+
+DEFAULT_DELTA_E_FORMULA = h.DEFAULT_DELTA_E_FORMULA
+
+
+def __getDeltaEFormula__(formula):
+    """
+    Returns the delta-E functions of a formula
+    """
+    if formula not in DELTA_E_FORMULAS:
+        raise ValueError('The formula must be one of: %s' % ', '.join(sorted(DELTA_E_FORMULAS.keys())))
+    return DELTA_E_FORMULAS[formula]
+
+
+def __deltaE__(rgb, otherRGB, formula = DEFAULT_DELTA_E_FORMULA):
+    """
+    Returns the delta-E between two RGB tuples
+        ((255, 0, 0), (255, 0, 0))          => 0.0
+        ((0, 0, 0), (255, 255, 255), 'cie76')   => 100.0...
+    """
+    return __getDeltaEFormula__(formula)[0](__cachedLab__(rgb), __cachedLab__(otherRGB))
+
+
+def __labArray__(colors, colorArray):
+    """
+    Returns an array of the Lab values of the colors, with the shape of the
+    colors without their channels, and that shape. A single color, like
+    'red', returns a single Lab row with the shape ().
+    """
+    if colorArray.__isSingleColor__(colors):
+        return numpy.array(__cachedLab__(h.__rgbFromColor__(colors))), tuple()
+
+    rgb, pixelShape = colorArray.__pixelArray__(colors, 3)
+    return colorArray.__labFromRGBArray__(rgb), tuple(pixelShape)
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+def delta_e_many(colors, others, formula = DEFAULT_DELTA_E_FORMULA):
+    """
+    Returns a float array with the delta-E between each color and the other
+    color at the same position, in one vectorized pass. Colors can be a
+    ColorArray, a uint8 NumPy array whose last axis is RGB, like an (H, W, 3)
+    image, a buffer of RGB bytes, or a list of colors. Either side can also
+    be a single color, which is compared to every color on the other side.
+    The result has the shape of the colors without their channels.
+    formula is 'cie76', 'cie94' or 'ciede2000'.
+        delta_e_many(['red', 'blue'], ['red', 'navy'], 'cie76')    => [0.0, 56.92...]
+        delta_e_many(image, reference)                              => (H, W) array
+    """
+    colorArray = __requireColorArray__()
+    compareArrays = __getDeltaEFormula__(formula)[1]
+    lab, shape = __labArray__(colors, colorArray)
+    otherLab, otherShape = __labArray__(others, colorArray)
+
+    if shape and otherShape and len(lab) != len(otherLab):
+        raise ValueError('Both sides must have the same number of colors, or a single color!')
+
+    distances = compareArrays(lab, otherLab)
+    return distances.reshape(shape or otherShape)
+
+
+def delta_e_matrix(colors, others = None, formula = DEFAULT_DELTA_E_FORMULA):
+    """
+    Returns an (N, M) float array with the delta-E between every one of the N
+    colors and every one of the M other colors, like the distance from each
+    color of a rendered image to each color of a reference palette. If
+    others is None, the colors are compared to each other.
+    The colors take the same values as delta_e_many. Each side is converted
+    to Lab once, and the distances are computed a block of rows at a time,
+    so large matrices don't need a large amount of extra memory.
+        delta_e_matrix(['red', 'blue'], formula = 'cie76')     => [[0.0, 176.3...], [176.3..., 0.0]]
+    """
+    colorArray = __requireColorArray__()
+    compareArrays = __getDeltaEFormula__(formula)[1]
+    lab = __labArray__(colors, colorArray)[0].reshape(-1, 3)
+    otherLab = lab if others is None else __labArray__(others, colorArray)[0].reshape(-1, 3)
+
+    distances = numpy.empty((len(lab), len(otherLab)))
+    chunkRows = max(1, DELTA_E_CHUNK_SIZE // max(len(otherLab), 1))
+    for start in range(0, len(lab), chunkRows):
+        distances[start:start + chunkRows] = compareArrays(lab[start:start + chunkRows, numpy.newaxis], otherLab[numpy.newaxis])
+    return distances
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
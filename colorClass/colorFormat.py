@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Formats many colors as hex strings at once, into a single string or into a
+preallocated buffer. With NumPy, the colors are formatted in one pass, without
+creating a string for each color.
+"""
+import array
+import helpers as h
+import colorArray as ca
+from color import FrozenColor
+
+# The text written around the hex strings for each output style, as
+# (opening, quote, separator, closing)
+HEX_STYLES = dict(
+    lines = (b'', b'', b'\n', b''),
+    csv = (b'', b'', b',', b''),
+    json = (b'[', b'"', b',', b']')
+)
+
+DEFAULT_HEX_STYLE = 'lines'
+
+
+def __getHexStyle__(style):
+    """
+    Returns the (opening, quote, separator, closing) tuple for an output style
+    """
+    if style not in HEX_STYLES:
+        raise ValueError('The style must be one of: %s' % ', '.join(sorted(HEX_STYLES.keys())))
+    return HEX_STYLES[style]
+
+
+def __hexOutputSize__(count, style):
+    """
+    Returns the number of bytes needed to format count colors in the style
+    """
+    opening, quote, separator, closing = __getHexStyle__(style)
+    itemsSize = count * (len(quote) * 2 + len('#RRGGBB') + len(separator)) - len(separator) if count > 0 else 0
+    return len(opening) + itemsSize + len(closing)
+
+
+def __packColors__(colors):
+    """
+    Returns an array of the colors, each packed as 0xRRGGBB. FrozenColor
+    objects are already packed, and any other value is parsed. Alpha values
+    are dropped.
+    """
+    return array.array('l', [
+        colorValue.__value__ & 0xFFFFFF if colorValue.__class__ is FrozenColor else h.__packRGB__(h.__rgbFromColor__(colorValue))
+        for colorValue in colors
+    ])
+
+
+def __rgbFromPacked__(packedValues):
+    """
+    Returns a new (N, 3) uint8 array of the channels of an array of packed
+    colors. The packed values are read through a NumPy view of the array,
+    but shifting and masking out each channel allocates new arrays.
+    """
+    numpy = ca.numpy
+    if len(packedValues) == 0:
+        return numpy.zeros((0, 3), dtype = numpy.uint8)
+    return ca.ColorArray.fromPacked(numpy.frombuffer(packedValues, dtype = numpy.dtype(packedValues.typecode))).rgb
+
+
+def __formatHexBytes__(packedValues, style):
+    """
+    Returns the packed colors formatted in the style, as bytes. This is used
+    when NumPy is not installed.
+    """
+    opening, quote, separator, closing = __getHexStyle__(style)
+    itemFormat = quote + b'#%06X' + quote
+    return opening + separator.join([itemFormat % packedValue for packedValue in packedValues]) + closing
+
+
+def __writeHexRows__(rows, rgb, quote, separator):
+    """
+    Writes an (N, 3) uint8 array of RGB values into an (N, width) uint8 array
+    of characters, with each row formatted as quote, hex string, quote and
+    separator.
+    """
+    numpy = ca.numpy
+    hexDigits = numpy.frombuffer(ca.HEX_DIGITS, dtype = numpy.uint8)
+    digitsStart = len(quote) + 1
+
+    rows[:, :len(quote)] = numpy.frombuffer(quote, dtype = numpy.uint8)
+    rows[:, len(quote)] = ord('#')
+    rows[:, digitsStart:digitsStart + 6:2] = hexDigits[rgb >> 4]
+    rows[:, digitsStart + 1:digitsStart + 6:2] = hexDigits[rgb & 0x0F]
+    rows[:, digitsStart + 6:digitsStart + 6 + len(quote)] = numpy.frombuffer(quote, dtype = numpy.uint8)
+    rows[:, digitsStart + 6 + len(quote):] = numpy.frombuffer(separator, dtype = numpy.uint8)
+
+
+def __formatHexArray__(rgb, style, characters):
+    """
+    Writes an (N, 3) uint8 array of RGB values, formatted in the style, into a
+    1-D uint8 array of characters, in one vectorized pass.
+    """
+    numpy = ca.numpy
+    opening, quote, separator, closing = __getHexStyle__(style)
+    itemWidth = len(quote) * 2 + len('#RRGGBB') + len(separator)
+    count = len(rgb)
+
+    characters[:len(opening)] = numpy.frombuffer(opening, dtype = numpy.uint8)
+    position = len(opening)
+    if count > 0:
+        # Every row but the last is followed by a separator
+        lastRow = position + (count - 1) * itemWidth
+        __writeHexRows__(characters[position:lastRow].reshape(count - 1, itemWidth), rgb[:-1], quote, separator)
+        __writeHexRows__(characters[lastRow:lastRow + itemWidth - len(separator)].reshape(1, itemWidth - len(separator)), rgb[-1:], quote, b'')
+        position = lastRow + itemWidth - len(separator)
+    characters[position:] = numpy.frombuffer(closing, dtype = numpy.uint8)
+
+
+def __arrayView__(out, offset, size):
+    """
+    Returns a writable uint8 array that shares the memory of out, from offset
+    to offset + size, or None if out can't be shared that way.
+    """
+    numpy = ca.numpy
+    try:
+        characters = numpy.frombuffer(out, dtype = numpy.uint8, count = size, offset = offset)
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return characters if characters.flags.writeable else None
+
+
+def __writeOutput__(out, offset, data):
+    """
+    Copies data into out, starting at offset. Some buffers, like mmap objects
+    on Python 2, only accept strings.
+    """
+    try:
+        out[offset:offset + len(data)] = data
+    except (TypeError, IndexError):
+        out[offset:offset + len(data)] = bytes(data)
+
+
+def __decodeOutput__(data):
+    """
+    Returns the formatted bytes as a str
+    """
+    if bytes is str:
+        return bytes(data)
+    else:
+        return bytes(data).decode('ascii')
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+def format_hex_many(colors, out = None, style = DEFAULT_HEX_STYLE, offset = 0):
+    """
+    Formats a sequence of colors as '#RRGGBB' hex strings, all at once. The
+    colors can be any values that the Color class accepts, or a ColorArray or
+    an (N, 3) NumPy array, which are formatted in one vectorized pass.
+    Other sequences are packed into an array of integers first, and are also
+    formatted in one pass if NumPy is installed.
+    The style sets the text around the hex strings:
+        'lines' => #FF0000\\n#0000FF    (one color per line)
+        'csv'   => #FF0000,#0000FF     (a single CSV row)
+        'json'  => ["#FF0000","#0000FF"]
+    If out is None, the formatted colors are returned as a single string.
+    Otherwise they are written into out, starting at offset, and the number
+    of bytes written is returned. out can be a bytearray, a memoryview, an
+    mmap, or any other writable buffer, and must already be large enough;
+    hex_output_size returns the size that's needed.
+        format_hex_many(['red', (0, 0, 255)], style = 'json')   => '["#FF0000","#0000FF"]'
+        format_hex_many(['red', (0, 0, 255)], bytearray(15))   => 15
+    """
+    __getHexStyle__(style)
+    if offset < 0:
+        raise ValueError('The offset must be a positive integer, or 0!')
+
+    if isinstance(colors, ca.ColorArray):
+        rgb = colors.rgb
+    elif ca.numpy is not None and isinstance(colors, ca.numpy.ndarray):
+        rgb = ca.ColorArray(colors).rgb
+    else:
+        packedValues = __packColors__(colors)
+        try:
+            ca.__requireNumpy__()
+            rgb = __rgbFromPacked__(packedValues)
+        except ImportError:
+            rgb = None
+
+    size = __hexOutputSize__(len(packedValues) if rgb is None else len(rgb), style)
+    if out is not None and offset + size > len(out):
+        raise ValueError('The output buffer is too small! %i bytes are needed.' % (offset + size))
+
+    if rgb is None:
+        buffer = __formatHexBytes__(packedValues, style)
+
+    else:
+        characters = __arrayView__(out, offset, size) if out is not None else None
+        if characters is not None:
+            __formatHexArray__(rgb, style, characters)
+            return size
+
+        characters = ca.numpy.empty(size, dtype = ca.numpy.uint8)
+        __formatHexArray__(rgb, style, characters)
+        buffer = characters.tobytes()
+
+    if out is None:
+        return __decodeOutput__(buffer)
+    else:
+        __writeOutput__(out, offset, buffer)
+        return size
+
+
+def hex_output_size(count, style = DEFAULT_HEX_STYLE):
+    """
+    Returns the number of bytes format_hex_many writes for count colors in
+    the style, so that the output buffer can be allocated up front.
+        hex_output_size(2, 'json')  => 21
+    """
+    return __hexOutputSize__(count, style)
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
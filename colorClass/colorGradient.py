@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Builds gradients across any number of color stops, interpolated in sRGB,
+linear RGB or CIE Lab. A gradient can be iterated one Color at a time, or
+built as a ColorArray in one vectorized pass, which needs NumPy.
+"""
+from __future__ import division
+import bisect, math
+import helpers as h
+import colorArray as ca
+import colorSpaces as sp
+from color import Color, FrozenColor
+
+# The number of intervals in each easing table. Eased values between the
+# table entries are interpolated linearly.
+EASING_TABLE_SIZE = 1024
+
+
+def __easeIn__(position):
+    """
+    Starts slowly, and speeds up towards the end of the stop
+    """
+    return position ** 3
+
+
+def __easeOut__(position):
+    """
+    Starts quickly, and slows down towards the end of the stop
+    """
+    return 1 - (1 - position) ** 3
+
+
+def __easeInOut__(position):
+    """
+    Starts and ends slowly
+    """
+    if position < 0.5:
+        return 4 * position ** 3
+    else:
+        return 1 - 4 * (1 - position) ** 3
+
+
+# Built-in easing name => easing function. Each function maps the position
+# between two stops, from 0 to 1, to how far the color has moved between them.
+EASINGS = {
+    'linear': None,
+    'ease_in': __easeIn__,
+    'ease_out': __easeOut__,
+    'ease_in_out': __easeInOut__
+}
+
+DEFAULT_EASING = 'linear'
+
+# Easing function => its table, once it has been built
+__easingTables__ = dict()
+
+
+def __getEasingTable__(easing):
+    """
+    Returns the table of an easing name or function, with EASING_TABLE_SIZE + 1
+    evenly spaced values, or None for linear easing. The table is built the
+    first time the easing is used, so each step of a gradient costs the same
+    whatever the easing function is.
+    """
+    if h.__isStringType__(easing):
+        if easing not in EASINGS:
+            raise ValueError('The easing must be a function, or one of: %s' % ', '.join(sorted(EASINGS.keys())))
+        easing = EASINGS[easing]
+    elif not callable(easing):
+        raise ValueError('The easing must be a function, or one of: %s' % ', '.join(sorted(EASINGS.keys())))
+
+    if easing is None:
+        return None
+
+    easingTable = __easingTables__.get(easing)
+    if easingTable is None:
+        easingTable = __easingTables__[easing] = tuple(float(easing(index / EASING_TABLE_SIZE)) for index in range(EASING_TABLE_SIZE + 1))
+    return easingTable
+
+
+def __ease__(easingTable, position):
+    """
+    Returns the eased value of a position between 0 and 1 from an easing table
+    """
+    if easingTable is None:
+        return position
+
+    tablePosition = position * EASING_TABLE_SIZE
+    tableIndex = min(int(tablePosition), EASING_TABLE_SIZE - 1)
+    return easingTable[tableIndex] + (easingTable[tableIndex + 1] - easingTable[tableIndex]) * (tablePosition - tableIndex)
+
+
+def __isStop__(stopValue):
+    """
+    Returns True if the value is a (position, color) pair, instead of a color
+    """
+    return (
+        h.__isTupleType__(stopValue) and len(stopValue) == 2
+        and h.__isNumericType__(stopValue[0])
+        and not h.__isNumericType__(stopValue[1])
+    )
+
+
+def __parseStops__(stops):
+    """
+    Returns the positions and RGB tuples of the gradient stops. Stops can be
+    colors, which are spaced evenly, or (position, color) pairs with positions
+    between 0 and 1, in order.
+        ['red', 'blue']                 => [0.0, 1.0], [(255, 0, 0), (0, 0, 255)]
+        [(0, 'red'), (0.25, 'blue')]    => [0.0, 0.25], [(255, 0, 0), (0, 0, 255)]
+    """
+    stops = list(stops)
+    if len(stops) == 0:
+        raise ValueError('A gradient needs at least one color stop!')
+
+    if all(__isStop__(stopValue) for stopValue in stops):
+        positions = [float(position) for position, colorValue in stops]
+        colorValues = [colorValue for position, colorValue in stops]
+        if any(position < 0 or position > 1 for position in positions) or positions != sorted(positions):
+            raise ValueError('The stop positions must be between 0 and 1, in order!')
+    else:
+        positions = [index / max(len(stops) - 1, 1) for index in range(len(stops))]
+        colorValues = stops
+
+    return positions, [h.__rgbFromColor__(colorValue) for colorValue in colorValues]
+
+
+def __toLinear__(rgb):
+    """
+    Returns the linear light values of an RGB tuple
+    """
+    return tuple(sp.SRGB_TO_LINEAR[item] for item in rgb)
+
+
+def __fromLinear__(linearValues):
+    """
+    Returns an RGB tuple from linear light values
+    """
+    return tuple(sp.__delinearize__(item) for item in linearValues)
+
+
+def __fromRGB__(rgbValues):
+    """
+    Returns an RGB tuple of integers from RGB values that are not whole numbers
+    """
+    return tuple(min(max(int(math.floor(item + 0.5)), 0), 255) for item in rgbValues)
+
+
+def __rgbArrayFromRGB__(rgbValues):
+    """
+    Returns an (N, 3) uint8 array from an array of RGB values
+    """
+    numpy = ca.numpy
+    return numpy.clip(numpy.floor(rgbValues + 0.5), 0, 255).astype(numpy.uint8)
+
+
+def __rgbArrayFromLinear__(linearValues):
+    """
+    Returns an (N, 3) uint8 array from an array of linear light values
+    """
+    numpy = ca.numpy
+    return numpy.searchsorted(numpy.array(sp.LINEAR_THRESHOLDS), linearValues, side = 'right').astype(numpy.uint8)
+
+
+# The color spaces a gradient can be interpolated in, with the functions that
+# convert an RGB tuple to the space, the interpolated values back to an RGB
+# tuple, and an array of interpolated values back to a uint8 array
+GRADIENT_SPACES = {
+    'rgb': (tuple, __fromRGB__, __rgbArrayFromRGB__),
+    'linear': (__toLinear__, __fromLinear__, __rgbArrayFromLinear__),
+    'lab': (sp.__rgbToLab__, sp.__labToRGB__, ca.__rgbArrayFromLab__)
+}
+
+DEFAULT_GRADIENT_SPACE = 'rgb'
+
+
+def __getGradientSpace__(space):
+    """
+    Returns the conversion functions of a gradient color space
+    """
+    if space not in GRADIENT_SPACES:
+        raise ValueError('The space must be one of: %s' % ', '.join(sorted(GRADIENT_SPACES.keys())))
+    return GRADIENT_SPACES[space]
+
+
+def __gradientPosition__(step, steps):
+    """
+    Returns the position, from 0 to 1, of a step of the gradient
+    """
+    return step / (steps - 1) if steps > 1 else 0.0
+
+
+def __iterGradient__(positions, rgbValues, steps, toSpace, fromSpace, easingTable, colorClass):
+    """
+    Yields each step of a gradient, from the parsed stops
+    """
+    spaceValues = [toSpace(rgb) for rgb in rgbValues]
+    for step in range(steps):
+        position = __gradientPosition__(step, steps)
+        if position <= positions[0]:
+            rgb = rgbValues[0]
+        elif position >= positions[-1]:
+            rgb = rgbValues[-1]
+        else:
+            stopIndex = bisect.bisect_right(positions, position) - 1
+            startPosition, endPosition = positions[stopIndex], positions[stopIndex + 1]
+            amount = __ease__(easingTable, (position - startPosition) / (endPosition - startPosition))
+            startValues, endValues = spaceValues[stopIndex], spaceValues[stopIndex + 1]
+            rgb = fromSpace(tuple(startValue + (endValue - startValue) * amount for startValue, endValue in zip(startValues, endValues)))
+
+        yield colorClass.fromInt(h.__packRGB__(rgb))
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+def iter_gradient(stops, steps, space = DEFAULT_GRADIENT_SPACE, easing = DEFAULT_EASING, frozen = False):
+    """
+    Returns an iterator of the colors of a gradient with the provided number of
+    steps. The first step is the first stop, and the last step is the last
+    stop. Stops can be colors, which are spaced evenly, or (position, color)
+    pairs with positions between 0 and 1.
+    space is 'rgb', 'linear' for linear RGB, or 'lab' for CIE Lab. easing is
+    one of EASINGS, or a function that maps the position between two stops
+    (0 - 1) to how far the color has moved between them. It is applied
+    between each pair of stops.
+    Each step is a Color, or a FrozenColor if frozen is True.
+        list(iter_gradient(['red', 'blue'], 3))                 => ['#FF0000', '#800080', '#0000FF']
+        list(iter_gradient([(0, 'black'), (0.5, 'white')], 3))  => ['#000000', '#FFFFFF', '#FFFFFF']
+    """
+    toSpace, fromSpace, fromSpaceArray = __getGradientSpace__(space)
+    positions, rgbValues = __parseStops__(stops)
+    return __iterGradient__(positions, rgbValues, steps, toSpace, fromSpace, __getEasingTable__(easing), FrozenColor if frozen else Color)
+
+
+def gradient_array(stops, steps, space = DEFAULT_GRADIENT_SPACE, easing = DEFAULT_EASING):
+    """
+    Returns a ColorArray with the colors of a gradient, built in one vectorized
+    pass. It takes the same stops, space and easing as iter_gradient, and
+    returns the same colors.
+        gradient_array(['red', 'blue'], 3).hex  => ['#FF0000', '#800080', '#0000FF']
+    """
+    numpy = ca.__requireNumpy__()
+    toSpace, fromSpace, fromSpaceArray = __getGradientSpace__(space)
+    easingTable = __getEasingTable__(easing)
+    positions, rgbValues = __parseStops__(stops)
+    spaceValues = numpy.array([toSpace(rgb) for rgb in rgbValues], dtype = numpy.float64)
+
+    stepPositions = numpy.arange(steps) / float(max(steps - 1, 1))
+    if len(positions) == 1:
+        return ca.ColorArray(numpy.tile(numpy.array(rgbValues, dtype = numpy.uint8), (steps, 1)))
+
+    positions = numpy.array(positions)
+    stopIndexes = numpy.clip(numpy.searchsorted(positions, stepPositions, side = 'right') - 1, 0, len(positions) - 2)
+    startPositions, endPositions = positions[stopIndexes], positions[stopIndexes + 1]
+    with numpy.errstate(divide = 'ignore', invalid = 'ignore'):
+        amounts = numpy.clip(numpy.where(endPositions > startPositions, (stepPositions - startPositions) / (endPositions - startPositions), 1.0), 0, 1)
+
+    if easingTable is not None:
+        amounts = numpy.interp(amounts, numpy.linspace(0, 1, EASING_TABLE_SIZE + 1), numpy.array(easingTable))
+
+    startValues, endValues = spaceValues[stopIndexes], spaceValues[stopIndexes + 1]
+    rgb = fromSpaceArray(startValues + (endValues - startValues) * amounts[:, numpy.newaxis])
+
+    # Steps on or outside of the first and last stops are exactly those colors
+    rgb[stepPositions <= positions[0]] = rgbValues[0]
+    rgb[stepPositions >= positions[-1]] = rgbValues[-1]
+    return ca.ColorArray(rgb)
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
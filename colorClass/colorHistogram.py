@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Counts the unique colors of an image, straight from a raw buffer of pixels.
+With NumPy, each pixel is packed into a 0xRRGGBB integer and the unique values
+are counted in one vectorized pass. Without NumPy, the channels are sliced out
+of the buffer and the pixels are counted in a dictionary. Color objects are
+only created for the colors that are returned.
+"""
+import heapq
+import itertools
+from collections import defaultdict
+import helpers as h
+import colorArray as ca
+import colorQuantize as cq
+from color import Color
+
+# Pairs the channels up lazily, in Python 2 and 3
+izip = getattr(itertools, 'izip', zip)
+
+
+def __checkSize__(pixelCount, width, height):
+    """
+    Raises a ValueError if the image size is invalid, or doesn't match the
+    number of pixels
+    """
+    if not h.__isIntType__(width) or not h.__isIntType__(height) or width < 0 or height < 0:
+        raise ValueError('The width and height must be integers of at least 0!')
+    if pixelCount != width * height:
+        raise ValueError('The buffer must have width * height pixels!')
+
+
+def __histogramArray__(pixels, width, height, channels, top):
+    """
+    Returns the packed colors and their counts, from the most to the least
+    common, with NumPy
+    """
+    numpy = ca.numpy
+    rgb = ca.__pixelArray__(pixels, channels)[0]
+    __checkSize__(len(rgb), width, height)
+
+    packedValues, counts = numpy.unique(cq.__packArray__(rgb), return_counts = True)
+    if top is not None and 0 < top < len(counts):
+        # Only the colors that are at least as common as the top-th color are
+        # sorted, and ties are broken by the packed value, like the sort below
+        threshold = numpy.partition(counts, len(counts) - top)[len(counts) - top]
+        isCandidate = counts >= threshold
+        packedValues, counts = packedValues[isCandidate], counts[isCandidate]
+
+    # The packed values are already sorted, so a stable sort by count keeps
+    # them in order for colors with the same count
+    order = numpy.argsort(-counts, kind = 'mergesort')[:top]
+    return packedValues[order].astype(int).tolist(), counts[order].astype(int).tolist()
+
+
+def __histogramBytes__(pixels, width, height, channels, top):
+    """
+    Returns the packed colors and their counts, from the most to the least
+    common, without NumPy
+    """
+    if not isinstance(pixels, bytearray):
+        pixels = bytearray(pixels)
+    if len(pixels) % channels != 0:
+        raise ValueError('The length of the pixel buffer must be a multiple of %i!' % channels)
+    __checkSize__(len(pixels) // channels, width, height)
+
+    counts = defaultdict(int)
+    for rgb in izip(pixels[0::channels], pixels[1::channels], pixels[2::channels]):
+        counts[rgb] += 1
+
+    items = counts.items()
+    sortKey = lambda item: (-item[1], item[0])
+    items = sorted(items, key = sortKey) if top is None else heapq.nsmallest(top, items, key = sortKey)
+    return [h.__packRGB__(rgb) for rgb, count in items], [count for rgb, count in items]
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+def color_histogram(buffer, width, height, channels = 3, top = None, asColors = True):
+    """
+    Returns the unique colors of a width x height image, and the number of
+    pixels with each color, as two lists sorted from the most to the least
+    common color. Colors with the same count are sorted by their 0xRRGGBB
+    value. If top is set, only that many of the most common colors are
+    returned.
+    buffer is a raw buffer of bytes, with channels bytes for each pixel, and
+    any channels after red, green and blue are ignored. NumPy arrays and
+    ColorArrays are also accepted when NumPy is installed.
+    The colors are Color objects, or packed 0xRRGGBB integers if asColors is
+    False.
+        color_histogram(b'\\xff\\x00\\x00\\x00\\x00\\xff\\xff\\x00\\x00', 3, 1)  => (['#FF0000', '#0000FF'], [2, 1])
+    """
+    if channels < 3:
+        raise ValueError('The pixels must have at least 3 channels!')
+    if top is not None and (not h.__isIntType__(top) or top < 0):
+        raise ValueError('top must be an integer of at least 0!')
+
+    try:
+        ca.__requireNumpy__()
+        countColors = __histogramArray__
+    except ImportError:
+        countColors = __histogramBytes__
+
+    packedValues, counts = countColors(buffer, width, height, channels, top)
+
+    if asColors:
+        return [Color.fromInt(packedValue) for packedValue in packedValues], counts
+    else:
+        return packedValues, counts
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Reads and writes palettes in a compact binary format, which is loaded with
+mmap so that even very large palettes open instantly.
+
+The format is little-endian:
+    * A 16-byte header: the PALETTE_MAGIC bytes, the format version (uint16),
+      flags (uint16), the number of colors (uint32), and 4 reserved bytes.
+    * The packed RGB values, 3 bytes per color.
+    * If the palette has names, padding to a multiple of 4 bytes, followed by:
+        * The offset of each name in the name data, plus the end offset
+          of the last name (uint32, number of colors + 1).
+        * The color indexes, sorted by their lower-cased name (uint32,
+          number of colors). Names are found with a binary search over these.
+        * The UTF-8 encoded names.
+"""
+import mmap, struct, weakref
+import helpers as h
+from color import FrozenColor
+from colorArray import ColorArray, __requireNumpy__
+
+PALETTE_MAGIC = b'CCPL'
+PALETTE_VERSION = 1
+
+# Header flags
+HAS_NAMES = 0x1
+
+HEADER_FORMAT = '<4sHHII'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+OFFSET_FORMAT = '<I'
+OFFSET_SIZE = struct.calcsize(OFFSET_FORMAT)
+
+
+def __encodeName__(colorName):
+    """
+    Returns the provided name as UTF-8 encoded bytes
+    """
+    if isinstance(colorName, bytes):
+        return colorName
+    else:
+        return colorName.encode('utf-8')
+
+
+def __decodeName__(nameBytes):
+    """
+    Returns the provided UTF-8 encoded name as a string. In Python 2, ASCII
+    names are returned as str.
+    """
+    colorName = nameBytes.decode('utf-8')
+    try:
+        return str(colorName)
+    except UnicodeEncodeError:
+        return colorName
+
+
+def __paletteEntries__(colors):
+    """
+    Returns a tuple of (names, packed RGB bytes) from the provided colors.
+    Names is None if the colors don't have names.
+    """
+    if isinstance(colors, h.__const__):
+        colors = colors.__colorValues__
+
+    if isinstance(colors, ColorArray):
+        return None, colors.rgb.tobytes()
+
+    if h.__isMappingType__(colors):
+        names = sorted(colors.keys(), key = lambda item: h.__cleanString__(item))
+        colors = [colors[colorName] for colorName in names]
+    elif isinstance(colors, Palette):
+        names = [colors.name(colorIndex) for colorIndex in range(len(colors))] if colors.hasNames else None
+    else:
+        names = None
+
+    rgbBytes = bytearray()
+    for colorValue in colors:
+        rgbBytes.extend(h.__rgbFromColor__(colorValue))
+
+    return names, bytes(rgbBytes)
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+def write_palette(path, colors):
+    """
+    Writes the provided colors to a binary palette file. The colors can be a
+    dictionary of names and color values, the COLORS constant (including any
+    colors that have been added to it), a Palette, a ColorArray, or a
+    sequence of any values that the Color class accepts.
+    """
+    names, rgbBytes = __paletteEntries__(colors)
+    colorCount = len(rgbBytes) // 3
+    flags = HAS_NAMES if names is not None else 0
+
+    with open(path, 'wb') as paletteFile:
+        paletteFile.write(struct.pack(HEADER_FORMAT, PALETTE_MAGIC, PALETTE_VERSION, flags, colorCount, 0))
+        paletteFile.write(rgbBytes)
+
+        if names is not None:
+            paletteFile.write(b'\0' * (-len(rgbBytes) % 4))
+
+            encodedNames = [__encodeName__(colorName) for colorName in names]
+            nameOffsets = [0]
+            for encodedName in encodedNames:
+                nameOffsets.append(nameOffsets[-1] + len(encodedName))
+            sortedIndexes = sorted(range(colorCount), key = lambda colorIndex: (__encodeName__(h.__cleanString__(names[colorIndex])), colorIndex))
+
+            paletteFile.write(struct.pack('<%iI' % len(nameOffsets), *nameOffsets))
+            paletteFile.write(struct.pack('<%iI' % colorCount, *sortedIndexes))
+            paletteFile.write(b''.join(encodedNames))
+
+
+def load_palette(path):
+    """
+    Returns a read-only Palette, memory-mapped from a binary palette file
+    """
+    return Palette(path)
+
+
+class Palette(object):
+    """
+    A read-only palette, memory-mapped from a file written by write_palette.
+    Colors are read from the file as they are used, so opening a palette
+    takes the same time regardless of its size.
+    Indexing a palette with an integer returns a FrozenColor, and indexing
+    it with a string returns the color with that name (case does not
+    matter). Slicing it returns a Palette that shares the same file.
+        palette = load_palette('colors.palette')
+        palette[0]          => FrozenColor
+        palette['red']      => FrozenColor
+        palette[10:20]      => Palette
+    Call close(), or use the palette in a with statement, to release the file.
+    """
+    __slots__ = ['__paletteFile__', '__map__', '__views__', '__count__', '__namesOffset__', '__start__', '__step__', '__length__', 'hasNames']
+
+    def __init__(self, path):
+        self.__views__ = []
+        self.__paletteFile__ = open(path, 'rb')
+        try:
+            self.__map__ = mmap.mmap(self.__paletteFile__.fileno(), 0, access = mmap.ACCESS_READ)
+        except:
+            self.__paletteFile__.close()
+            raise
+
+        if len(self.__map__) < HEADER_SIZE:
+            self.close()
+            raise ValueError('The file is not a palette!')
+
+        magic, version, flags, colorCount, reserved = struct.unpack_from(HEADER_FORMAT, self.__map__, 0)
+        if magic != PALETTE_MAGIC:
+            self.close()
+            raise ValueError('The file is not a palette!')
+        elif version > PALETTE_VERSION:
+            self.close()
+            raise ValueError('Palette version %i is not supported!' % version)
+
+        self.__count__ = colorCount
+        self.hasNames = bool(flags & HAS_NAMES)
+        rgbEnd = HEADER_SIZE + colorCount * 3
+        self.__namesOffset__ = rgbEnd + (-rgbEnd % 4) if self.hasNames else None
+
+        self.__start__ = 0
+        self.__step__ = 1
+        self.__length__ = colorCount
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the memory map and the file. Slices of the palette share the
+        same file, so they are closed too. If arrays from toColorArray are
+        still in use, the memory map stays open until they are deleted, since
+        closing it would free the memory they read.
+        """
+        if not any(viewReference() is not None for viewReference in self.__views__):
+            self.__map__.close()
+        self.__paletteFile__.close()
+
+    def __len__(self):
+        """
+        Returns the number of colors
+        """
+        return self.__length__
+
+    def __fileIndex__(self, colorIndex):
+        """
+        Returns the index in the file of the provided index in this palette
+        """
+        if colorIndex < 0:
+            colorIndex += self.__length__
+        if not 0 <= colorIndex < self.__length__:
+            raise IndexError('Palette index out of range')
+        return self.__start__ + colorIndex * self.__step__
+
+    def __packedValue__(self, fileIndex):
+        """
+        Returns the packed 0xRRGGBB value of the color at the file index
+        """
+        red, green, blue = struct.unpack_from('<3B', self.__map__, HEADER_SIZE + fileIndex * 3)
+        return (red << 16) | (green << 8) | blue
+
+    def __nameBytes__(self, fileIndex):
+        """
+        Returns the encoded name of the color at the file index
+        """
+        nameStart, nameEnd = struct.unpack_from('<2I', self.__map__, self.__namesOffset__ + fileIndex * OFFSET_SIZE)
+        nameDataOffset = self.__namesOffset__ + (self.__count__ * 2 + 1) * OFFSET_SIZE
+        return self.__map__[nameDataOffset + nameStart:nameDataOffset + nameEnd]
+
+    def __findFileIndex__(self, colorName):
+        """
+        Returns the file index of the color with the provided name, using a
+        binary search over the sorted names. Returns None if the name can't be
+        found.
+        """
+        if not self.hasNames:
+            return None
+
+        searchName = __encodeName__(h.__cleanString__(colorName))
+        sortedOffset = self.__namesOffset__ + (self.__count__ + 1) * OFFSET_SIZE
+        low, high = 0, self.__count__
+        while low < high:
+            middle = (low + high) // 2
+            fileIndex = struct.unpack_from(OFFSET_FORMAT, self.__map__, sortedOffset + middle * OFFSET_SIZE)[0]
+            if __encodeName__(h.__cleanString__(__decodeName__(self.__nameBytes__(fileIndex)))) < searchName:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < self.__count__:
+            fileIndex = struct.unpack_from(OFFSET_FORMAT, self.__map__, sortedOffset + low * OFFSET_SIZE)[0]
+            if __encodeName__(h.__cleanString__(__decodeName__(self.__nameBytes__(fileIndex)))) == searchName:
+                return fileIndex
+
+        return None
+
+    def __getitem__(self, index):
+        """
+        Returns a FrozenColor for an integer index or a color name, or a
+        Palette for a slice.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__length__)
+            palette = object.__new__(Palette)
+            for slotName in ['__paletteFile__', '__map__', '__views__', '__count__', '__namesOffset__', 'hasNames']:
+                setattr(palette, slotName, getattr(self, slotName))
+            palette.__start__ = self.__start__ + start * self.__step__
+            palette.__step__ = self.__step__ * step
+            palette.__length__ = max(0, (stop - start + step - (1 if step > 0 else -1)) // step)
+            return palette
+
+        elif h.__isStringType__(index):
+            fileIndex = self.__findFileIndex__(index)
+            if fileIndex is None:
+                raise KeyError(index)
+            return FrozenColor.fromInt(self.__packedValue__(fileIndex))
+
+        else:
+            return FrozenColor.fromInt(self.__packedValue__(self.__fileIndex__(index)))
+
+    def __iter__(self):
+        """
+        Returns each color as a FrozenColor
+        """
+        for colorIndex in range(self.__length__):
+            yield self[colorIndex]
+
+    def __contains__(self, colorName):
+        """
+        Returns True if the palette has a color with the provided name
+        """
+        return self.__findFileIndex__(colorName) is not None
+
+    def name(self, index):
+        """
+        Returns the name of the color at the index, or None if the palette
+        does not have names.
+        """
+        if self.hasNames:
+            return __decodeName__(self.__nameBytes__(self.__fileIndex__(index)))
+        else:
+            return None
+
+    def get(self, colorName, defaultValue = None):
+        """
+        Returns the color with the provided name, or the default value
+        """
+        fileIndex = self.__findFileIndex__(colorName)
+        if fileIndex is None:
+            return defaultValue
+        else:
+            return FrozenColor.fromInt(self.__packedValue__(fileIndex))
+
+    def toColorArray(self):
+        """
+        Returns a ColorArray of the colors. It reads the memory-mapped file
+        directly, without copying it, and keeps the memory map open after
+        the palette is closed, for as long as the ColorArray is used.
+        """
+        numpy = __requireNumpy__()
+        mappedValues = numpy.frombuffer(self.__map__, dtype = numpy.uint8, count = self.__count__ * 3, offset = HEADER_SIZE)
+        self.__views__[:] = [viewReference for viewReference in self.__views__ if viewReference() is not None]
+        self.__views__.append(weakref.ref(mappedValues))
+        rgb = mappedValues.reshape(self.__count__, 3)
+        return ColorArray(rgb[self.__start__::self.__step__][:self.__length__])
+
+    def register(self):
+        """
+        Adds the named colors to COLORS, skipping names that COLORS already has.
+        Returns the number of colors that were added.
+        """
+        addedCount = 0
+        if self.hasNames:
+            for colorIndex in range(self.__length__):
+                colorName = self.name(colorIndex)
+                if colorName not in h.COLORS:
+                    h.COLORS[colorName] = self[colorIndex].hex
+                    addedCount += 1
+        return addedCount
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
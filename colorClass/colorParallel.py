@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Parses large batches of color values across several processes.
+concurrent.futures is needed to use more than one process. On Python 2, it
+is provided by the futures package. It is only imported when it's first
+needed, to keep importing colorClass fast.
+"""
+import array
+import helpers as h
+from color import FrozenColor
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+# concurrent.futures, once it has been imported by __requireFutures__
+futures = None
+
+# The packed value of a color that could not be parsed
+INVALID_PACKED_VALUE = -1
+
+# The number of chunks each worker gets by default, so that slow chunks even out
+CHUNKS_PER_WORKER = 4
+
+
+def __requireFutures__():
+    """
+    Imports concurrent.futures the first time it's needed, and returns it.
+    Raises an ImportError if it is not installed.
+    """
+    global futures
+    if futures is None:
+        try:
+            from concurrent import futures
+        except ImportError:
+            raise ImportError('concurrent.futures is required to parse with more than one worker!')
+    return futures
+
+
+def __parseChunk__(values):
+    """
+    Returns an array of the provided values, each packed as 0xRRGGBB. Values
+    that can't be parsed are INVALID_PACKED_VALUE. Workers return this array
+    instead of Color objects, since it pickles as a single string of bytes.
+    """
+    packedValues = array.array('l')
+    for value in values:
+        try:
+            packedValues.append(h.__packRGB__(h.__rgbFromValue__(value)))
+        except Exception:
+            packedValues.append(INVALID_PACKED_VALUE)
+    return packedValues
+
+
+def __parsePickledChunk__(pickledValues):
+    """
+    Returns __parseChunk__ for a pickled list of values. Chunks are pickled
+    before they're sent to a worker, so that values that can't be pickled
+    are found right away instead of stalling the pool.
+    """
+    return __parseChunk__(pickle.loads(pickledValues))
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+def parse_many(values, workers = None, chunksize = None, packed = False):
+    """
+    Parses a sequence of color values, split into chunks across a pool of
+    worker processes, and returns a list of FrozenColor objects in the same
+    order. Values that can't be parsed are None. A chunk that can't be sent
+    to a worker, for example because it has values that can't be pickled,
+    is parsed in this process instead, so one bad chunk doesn't stop the
+    rest of the batch.
+    workers defaults to the number of CPUs, and with one worker the values
+    are parsed in this process. chunksize defaults to splitting the values
+    into CHUNKS_PER_WORKER chunks per worker.
+    If packed is True, an array of integers packed as 0xRRGGBB is returned
+    instead, with INVALID_PACKED_VALUE for values that can't be parsed.
+        parse_many(['red', '#FFF', (0, 0, 128)], workers = 2)  => ['#FF0000', '#FFFFFF', '#000080']
+    """
+    if not h.__isListType__(values):
+        values = list(values)
+
+    if workers is None:
+        import multiprocessing
+        workers = multiprocessing.cpu_count()
+
+    if chunksize is None:
+        chunksize = max(1, -(-len(values) // (max(workers, 1) * CHUNKS_PER_WORKER)))
+    elif chunksize < 1:
+        raise ValueError('The chunksize must be at least 1!')
+
+    chunks = [values[start:start + chunksize] for start in range(0, len(values), chunksize)]
+
+    packedValues = array.array('l')
+    if workers <= 1 or len(chunks) <= 1:
+        for chunk in chunks:
+            packedValues.extend(__parseChunk__(chunk))
+
+    else:
+        __requireFutures__()
+        with futures.ProcessPoolExecutor(max_workers = min(workers, len(chunks))) as executor:
+            pendingChunks = []
+            for chunk in chunks:
+                try:
+                    pendingChunks.append(executor.submit(__parsePickledChunk__, pickle.dumps(chunk, pickle.HIGHEST_PROTOCOL)))
+                except Exception:
+                    pendingChunks.append(None)
+
+            for chunk, pendingChunk in zip(chunks, pendingChunks):
+                chunkValues = None
+                if pendingChunk is not None:
+                    try:
+                        chunkValues = pendingChunk.result()
+                    except Exception:
+                        chunkValues = None
+
+                if chunkValues is None:
+                    chunkValues = __parseChunk__(chunk)
+                packedValues.extend(chunkValues)
+
+    if packed:
+        return packedValues
+    else:
+        return [None if packedValue == INVALID_PACKED_VALUE else FrozenColor.fromInt(packedValue) for packedValue in packedValues]
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+An opt-in profiler for the parsing helpers. It counts the calls to each
+profiled function, adds up their time, and counts the types of the values
+they were called with.
+The profiler replaces the functions with timed versions when it is enabled,
+and puts the original functions back when it is disabled, so it costs
+nothing while it is off.
+"""
+import threading, timeit
+import helpers as h
+
+# The helpers functions that are profiled. The parser functions are listed in
+# the order they're called, and __fallbackRGB__ is called when a string can't
+# be parsed, and black is used instead. __getColorInt__ and __getHexString__
+# convert the channels that are set on a Color, and __rgbToHex__ and
+# __rgbaToHex__ format the hex strings of colors.
+PROFILED_FUNCTIONS = [
+    '__rgbaFromValue__', '__rgbFromValue__', '__parseValue__', '__flatten__', '__rgbaFromString__',
+    '__rgbaFromFunctionArguments__', '__rgbaFromValues__', '__toColorInt__', '__toAlphaInt__', '__fallbackRGB__',
+    '__getColorInt__', '__getHexString__', '__rgbToHex__', '__rgbaToHex__'
+]
+
+# The COLORS methods that are profiled
+PROFILED_METHODS = ['__getitem__', '__getattr__', 'get_key', 'has_key', 'get_names']
+
+
+def __inputType__(arguments):
+    """
+    Returns the name of the type of the value a function was called with.
+    Calls with several arguments, like Color(255, 0, 0), are 'arguments'.
+    """
+    if len(arguments) == 1:
+        inputValue = arguments[0]
+        # __rgbaFromValue__ gets its arguments as a tuple
+        while inputValue.__class__ is tuple and len(inputValue) == 1:
+            inputValue = inputValue[0]
+        return type(inputValue).__name__
+    elif len(arguments) == 0:
+        return 'none'
+    else:
+        return 'arguments'
+
+
+class __profiler__(object):
+    """
+    Profiles the functions in PROFILED_FUNCTIONS and the COLORS methods in
+    PROFILED_METHODS. It can be used in a with statement to profile a block
+    of code.
+    """
+    __slots__ = ['__originals__', '__stats__', '__lock__']
+
+    def __init__(self):
+        self.__originals__ = dict()
+        self.__stats__ = dict()
+        self.__lock__ = threading.Lock()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.disable()
+
+    @property
+    def isEnabled(self):
+        """
+        Returns True if the profiler is enabled
+        """
+        return len(self.__originals__) > 0
+
+    def __record__(self, functionName, arguments, elapsedTime):
+        """
+        Adds a call to the function's statistics
+        """
+        inputType = __inputType__(arguments)
+        with self.__lock__:
+            functionStats = self.__stats__.get(functionName)
+            if functionStats is None:
+                functionStats = self.__stats__[functionName] = dict(calls = 0, time = 0.0, types = dict())
+            functionStats['calls'] += 1
+            functionStats['time'] += elapsedTime
+            functionStats['types'][inputType] = functionStats['types'].get(inputType, 0) + 1
+
+    def __profiled__(self, functionName, function, isMethod = False):
+        """
+        Returns a version of the function that records each of its calls. The
+        self argument of a method is left out of its input type.
+        """
+        profiler = self
+        timer = timeit.default_timer
+
+        def profiledFunction(*arguments, **keywordArguments):
+            startTime = timer()
+            try:
+                return function(*arguments, **keywordArguments)
+            finally:
+                profiler.__record__(functionName, arguments[1:] if isMethod else arguments, timer() - startTime)
+
+        profiledFunction.__name__ = function.__name__
+        profiledFunction.__doc__ = function.__doc__
+        return profiledFunction
+
+    def enable(self):
+        """
+        Starts profiling. Statistics are kept from any earlier profiling,
+        until reset is called. The functions are replaced while holding the
+        lock, so that enable and disable can be called from any thread.
+        """
+        with self.__lock__:
+            if self.isEnabled:
+                return
+
+            for functionName in PROFILED_FUNCTIONS:
+                function = getattr(h, functionName)
+                self.__originals__[(h, functionName)] = function
+                setattr(h, functionName, self.__profiled__(functionName, function))
+
+            for methodName in PROFILED_METHODS:
+                method = h.__const__.__dict__[methodName]
+                self.__originals__[(h.__const__, methodName)] = method
+                setattr(h.__const__, methodName, self.__profiled__('COLORS.%s' % methodName, method, isMethod = True))
+
+    def disable(self):
+        """
+        Stops profiling, and restores the original functions
+        """
+        with self.__lock__:
+            for (owner, functionName), function in self.__originals__.items():
+                setattr(owner, functionName, function)
+            self.__originals__.clear()
+
+    def reset(self):
+        """
+        Clears the statistics
+        """
+        with self.__lock__:
+            self.__stats__.clear()
+
+    def stats(self):
+        """
+        Returns a dictionary with the statistics of each function that has
+        been called. Each has the number of calls, the total time in seconds
+        (including the time of any profiled functions it called), and the
+        number of calls for each input type.
+            {'__rgbaFromValue__': {'calls': 2, 'time': 0.00002, 'types': {'str': 1, 'tuple': 1}}}
+        """
+        with self.__lock__:
+            return dict(
+                (functionName, dict(calls = functionStats['calls'], time = functionStats['time'], types = dict(functionStats['types'])))
+                for functionName, functionStats in self.__stats__.items()
+            )
+
+    def report(self):
+        """
+        Returns the statistics as a table, with the slowest functions first
+        """
+        lines = ['%-22s %10s %12s %12s  %s' % ('Function', 'Calls', 'Total (ms)', 'Per call (us)', 'Input types')]
+        for functionName, functionStats in sorted(self.stats().items(), key = lambda item: -item[1]['time']):
+            inputTypes = ', '.join('%s: %i' % (inputType, count) for inputType, count in sorted(functionStats['types'].items(), key = lambda item: -item[1]))
+            lines.append('%-22s %10i %12.3f %12.3f  %s' % (
+                functionName,
+                functionStats['calls'],
+                functionStats['time'] * 1000,
+                functionStats['time'] * 1000000 / functionStats['calls'],
+                inputTypes
+            ))
+        return '\n'.join(lines)
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+PROFILER = __profiler__()
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Reduces the colors of an image to a small palette, with median cut or
+mini-batch k-means. Pixels are read straight from a raw RGB buffer or a NumPy
+array, and each unique color is only handled once, so an image never has to
+be turned into Color objects.
+NumPy is required, and is only imported when an image is first quantized.
+"""
+import helpers as h
+import colorArray as ca
+from color import Color
+
+# The number of unique colors that are matched to the palette at a time, which
+# limits the size of the distance matrix
+NEAREST_CHUNK_SIZE = 8192
+
+DEFAULT_PALETTE_SIZE = 16
+MAX_PALETTE_SIZE = 256
+
+# The number of mini-batches k-means runs, and the number of pixels in each
+DEFAULT_ITERATIONS = 20
+DEFAULT_BATCH_SIZE = 1024
+
+
+def __packArray__(rgb):
+    """
+    Returns a uint32 array with each RGB row packed as 0xRRGGBB
+    """
+    rgb = rgb.astype(ca.numpy.uint32)
+    return (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+
+def __unpackArray__(packedValues):
+    """
+    Returns an (N, 3) uint8 array from an array of colors packed as 0xRRGGBB
+    """
+    numpy = ca.numpy
+    rgb = numpy.empty((len(packedValues), 3), dtype = numpy.uint8)
+    rgb[:, 0] = packedValues >> 16
+    rgb[:, 1] = packedValues >> 8
+    rgb[:, 2] = packedValues
+    return rgb
+
+
+def __nearestIndexes__(rgb, palette):
+    """
+    Returns the index of the nearest palette color to each row of rgb, by
+    squared RGB distance. Ties go to the first palette color.
+    """
+    numpy = ca.numpy
+    palette = numpy.asarray(palette, dtype = numpy.float64)
+    paletteNorms = (palette ** 2).sum(axis = 1)
+    nearest = numpy.empty(len(rgb), dtype = numpy.intp)
+    for start in range(0, len(rgb), NEAREST_CHUNK_SIZE):
+        chunk = rgb[start:start + NEAREST_CHUNK_SIZE].astype(numpy.float64)
+        distances = paletteNorms - 2 * chunk.dot(palette.T)
+        nearest[start:start + NEAREST_CHUNK_SIZE] = distances.argmin(axis = 1)
+    return nearest
+
+
+def __boxSplit__(rgb, box):
+    """
+    Returns the channel with the largest range in the box, and that range
+    """
+    boxColors = rgb[box]
+    ranges = boxColors.max(axis = 0).astype(int) - boxColors.min(axis = 0)
+    channel = int(ranges.argmax())
+    return channel, int(ranges[channel])
+
+
+def __medianCut__(rgb, counts, paletteSize, options):
+    """
+    Returns up to paletteSize float RGB colors for the unique colors in rgb,
+    which appear counts times. The box with the largest range in any channel
+    is split at the median pixel along that channel, until there are enough
+    boxes or none can be split, and each box becomes the mean of its pixels.
+    """
+    numpy = ca.numpy
+    fullBox = numpy.arange(len(rgb))
+    boxes = [(fullBox,) + __boxSplit__(rgb, fullBox)]
+
+    while len(boxes) < paletteSize:
+        boxIndex = max(range(len(boxes)), key = lambda index: boxes[index][2])
+        box, channel, channelRange = boxes[boxIndex]
+        if channelRange == 0:
+            break
+
+        # The pixels are counted for each value of the channel, instead of
+        # sorting the box. The median is kept below the largest value, so
+        # both halves have colors, and the pixels of the median value go to
+        # whichever half keeps the halves closest in size.
+        values = rgb[box, channel]
+        valueCounts = numpy.cumsum(numpy.bincount(values, weights = counts[box], minlength = 256))
+        halfCount = valueCounts[-1] / 2.0
+        medianValue = min(int(numpy.searchsorted(valueCounts, halfCount)), int(values.max()) - 1)
+        if medianValue > 0 and abs(valueCounts[medianValue - 1] - halfCount) <= abs(valueCounts[medianValue] - halfCount):
+            medianValue -= 1
+
+        isLower = values <= medianValue
+        lowerBox, upperBox = box[isLower], box[~isLower]
+        boxes[boxIndex] = (lowerBox,) + __boxSplit__(rgb, lowerBox)
+        boxes.append((upperBox,) + __boxSplit__(rgb, upperBox))
+
+    return numpy.array([
+        (rgb[box] * counts[box, numpy.newaxis]).sum(axis = 0) / float(counts[box].sum())
+        for box, channel, channelRange in boxes
+    ])
+
+
+def __miniBatchKMeans__(rgb, counts, paletteSize, options):
+    """
+    Returns up to paletteSize float RGB colors for the unique colors in rgb,
+    which appear counts times. The centers start at the median cut palette,
+    and each iteration moves them towards the mean of a random batch of
+    pixels, by less each time as they settle.
+    """
+    numpy = ca.numpy
+    centers = __medianCut__(rgb, counts, paletteSize, options)
+    centerCounts = numpy.zeros(len(centers))
+    random = numpy.random.RandomState(options['seed'])
+    probabilities = counts / float(counts.sum())
+
+    for iteration in range(options['iterations']):
+        batch = rgb[random.choice(len(rgb), options['batchSize'], p = probabilities)].astype(numpy.float64)
+        nearest = __nearestIndexes__(batch, centers)
+
+        batchCounts = numpy.bincount(nearest, minlength = len(centers)).astype(numpy.float64)
+        batchSums = numpy.column_stack([numpy.bincount(nearest, weights = batch[:, channel], minlength = len(centers)) for channel in range(3)])
+        centerCounts += batchCounts
+
+        isMoved = batchCounts > 0
+        centers[isMoved] += (batchSums[isMoved] - batchCounts[isMoved, numpy.newaxis] * centers[isMoved]) / centerCounts[isMoved, numpy.newaxis]
+
+    return centers
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+# Quantization method => function that builds the palette
+QUANTIZE_METHODS = dict(
+    median_cut = __medianCut__,
+    kmeans = __miniBatchKMeans__
+)
+
+DEFAULT_QUANTIZE_METHOD = 'median_cut'
+
+
+def quantize(pixels, colors = DEFAULT_PALETTE_SIZE, method = DEFAULT_QUANTIZE_METHOD, sample = None, channels = 3, iterations = DEFAULT_ITERATIONS, batchSize = DEFAULT_BATCH_SIZE, seed = None):
+    """
+    Reduces the pixels to a palette of at most colors (1 - 256) colors.
+    Returns the palette, as a list of Color objects sorted from the most to
+    the least common, and a uint8 array with the palette index of each pixel.
+    For a NumPy array of pixels, the index array has the same shape without
+    the channel axis, so an (H, W, 3) image gets (H, W) indexes.
+    pixels can be a raw buffer of bytes, a NumPy array, a ColorArray, or a
+    list of colors. channels is the number of bytes of each pixel, and any
+    channels after red, green and blue are ignored.
+    method is 'median_cut', or 'kmeans' for mini-batch k-means, which starts
+    from the median cut palette and runs iterations batches of batchSize
+    pixels. If sample is set, the palette is built from that many randomly
+    chosen pixels, which is much faster for large images. Every pixel is
+    still matched to the palette. seed makes the random choices repeatable.
+        quantize(b'\\xff\\x00\\x00\\xfe\\x00\\x00\\x00\\x00\\xff', colors = 2)  => (['#FF0000', '#0000FF'], [0, 0, 1])
+    """
+    numpy = ca.__requireNumpy__()
+    if method not in QUANTIZE_METHODS:
+        raise ValueError('The method must be one of: %s' % ', '.join(sorted(QUANTIZE_METHODS.keys())))
+    if not h.__isIntType__(colors) or not 1 <= colors <= MAX_PALETTE_SIZE:
+        raise ValueError('The number of colors must be between 1 and %i!' % MAX_PALETTE_SIZE)
+    if sample is not None and (not h.__isIntType__(sample) or sample < 1):
+        raise ValueError('sample must be an integer of at least 1!')
+
+    rgb, indexShape = ca.__pixelArray__(pixels, channels)
+    if len(rgb) == 0:
+        return [], numpy.zeros(indexShape, dtype = numpy.uint8)
+
+    # Every unique color is matched to the palette once
+    uniqueValues, pixelIndexes = numpy.unique(__packArray__(rgb), return_inverse = True)
+    if sample is not None and sample < len(rgb):
+        sampleIndexes = numpy.random.RandomState(seed).choice(len(rgb), sample, replace = False)
+        counts = numpy.bincount(pixelIndexes[sampleIndexes], minlength = len(uniqueValues))
+    else:
+        counts = numpy.bincount(pixelIndexes, minlength = len(uniqueValues))
+
+    isSampled = counts > 0
+    options = dict(iterations = iterations, batchSize = batchSize, seed = seed)
+    palette = QUANTIZE_METHODS[method](__unpackArray__(uniqueValues[isSampled]), counts[isSampled], colors, options)
+    palette = numpy.clip(numpy.floor(palette + 0.5), 0, 255)
+
+    uniqueRGB = __unpackArray__(uniqueValues)
+    nearest = __nearestIndexes__(uniqueRGB, palette)
+
+    # Sort the palette by the number of pixels that use each color, and drop
+    # colors that no pixels use
+    paletteCounts = numpy.bincount(nearest[pixelIndexes], minlength = len(palette))
+    paletteOrder = numpy.argsort(-paletteCounts, kind = 'mergesort')
+    paletteOrder = paletteOrder[paletteCounts[paletteOrder] > 0]
+    newIndexes = numpy.zeros(len(palette), dtype = numpy.uint8)
+    newIndexes[paletteOrder] = numpy.arange(len(paletteOrder))
+
+    indexes = newIndexes[nearest][pixelIndexes].reshape(indexShape)
+    return [Color(tuple(int(item) for item in palette[paletteIndex])) for paletteIndex in paletteOrder], indexes
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
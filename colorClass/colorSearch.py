@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Finds the nearest named color, using a KD-tree over a palette of colors.
+"""
+import math
+import helpers as h
+import colorSpaces as cs
+
+# Weights of the red, green and blue distances for the 'weighted' metric
+WEIGHTED_RGB = (2, 4, 3)
+
+# Each metric maps an RGB tuple to a point, where the distance between two
+# points is the straight-line (Euclidean) distance.
+METRICS = {
+    # Euclidean distance between RGB values
+    'rgb': lambda rgb: (rgb[0], rgb[1], rgb[2]),
+    # Euclidean distance, with each channel weighted by WEIGHTED_RGB
+    'weighted': lambda rgb: tuple(rgb[index] * math.sqrt(WEIGHTED_RGB[index]) for index in range(3)),
+    # CIE76 delta-E, the Euclidean distance between CIE Lab values
+    'lab': cs.__rgbToLab__
+}
+
+DEFAULT_METRIC = h.DEFAULT_METRIC
+
+
+def __buildTree__(points, depth = 0):
+    """
+    Returns a KD-tree from a list of (point, entry index) tuples. Each node
+    is a tuple of (point, entry index, split axis, left node, right node).
+    The list is sorted in-place.
+    """
+    if len(points) == 0:
+        return None
+
+    axis = depth % 3
+    points.sort(key = lambda item: (item[0][axis], item[1]))
+    median = len(points) // 2
+
+    return (
+        points[median][0],
+        points[median][1],
+        axis,
+        __buildTree__(points[:median], depth + 1),
+        __buildTree__(points[median + 1:], depth + 1)
+    )
+
+
+def __nearestInTree__(tree, point):
+    """
+    Returns the entry index of the point in the KD-tree that is nearest to the
+    provided point. Ties go to the lowest entry index.
+    """
+    bestDistance = float('inf')
+    bestIndex = None
+
+    # Each item is a node, and the squared distance from the point to the node's region
+    pendingNodes = [(tree, 0.0)]
+    while pendingNodes:
+        node, regionDistance = pendingNodes.pop()
+        if node is None or regionDistance > bestDistance:
+            continue
+
+        nodePoint, nodeIndex, axis, leftNode, rightNode = node
+        distance = (point[0] - nodePoint[0]) ** 2 + (point[1] - nodePoint[1]) ** 2 + (point[2] - nodePoint[2]) ** 2
+        if distance < bestDistance or (distance == bestDistance and nodeIndex < bestIndex):
+            bestDistance = distance
+            bestIndex = nodeIndex
+
+        axisDistance = point[axis] - nodePoint[axis]
+        if axisDistance < 0:
+            nearNode, farNode = leftNode, rightNode
+        else:
+            nearNode, farNode = rightNode, leftNode
+
+        # The near side is searched first, since it is added last
+        pendingNodes.append((farNode, axisDistance ** 2))
+        pendingNodes.append((nearNode, 0.0))
+
+    return bestIndex
+
+
+# The index over COLORS for each metric, with the number of colors it was built from
+__defaultIndexes__ = dict()
+
+
+def __getIndex__(palette = None, metric = DEFAULT_METRIC):
+    """
+    Returns a ColorIndex for the palette. A ColorIndex is returned as-is. The
+    index over COLORS is built once per metric, and rebuilt if colors have
+    been added to COLORS since.
+    """
+    if hasattr(palette, 'nearest_many'):
+        return palette
+
+    elif palette is None:
+        colorCount = len(h.COLORS.__colorValues__)
+        colorCountAndIndex = __defaultIndexes__.get(metric)
+        if colorCountAndIndex is None or colorCountAndIndex[0] != colorCount:
+            colorCountAndIndex = (colorCount, ColorIndex(None, metric))
+            __defaultIndexes__[metric] = colorCountAndIndex
+        return colorCountAndIndex[1]
+
+    else:
+        return ColorIndex(palette, metric)
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+class ColorIndex(object):
+    """
+    A spatial index (KD-tree) over a palette of colors, used to find the
+    palette entry nearest to a color. The palette can be a dictionary of
+    names and color values, or a sequence of color values. If no palette is
+    provided, the COLORS constant is used.
+    The metric is one of METRICS:
+        'rgb'       Euclidean distance between RGB values
+        'weighted'  Euclidean distance, weighted by WEIGHTED_RGB
+        'lab'       CIE76 delta-E, the distance between CIE Lab values
+    Nearest entries are returned as their palette name for dictionaries, or
+    as the palette value itself for sequences. Entries with the same color
+    are stored once, and the first sorted name is returned for them.
+        ColorIndex().nearest('#FE0101')                         => 'Red'
+        ColorIndex({'dark': '#111', 'light': '#EEE'}).nearest('#333')   => 'dark'
+        ColorIndex(['#111', '#EEE'], 'lab').nearest('#CCC')     => '#EEE'
+    """
+    __slots__ = ['__entries__', '__tree__', '__transform__', 'metric']
+
+    def __init__(self, palette = None, metric = DEFAULT_METRIC):
+        if metric not in METRICS:
+            raise ValueError('The metric must be one of: %s' % ', '.join(sorted(METRICS.keys())))
+
+        if palette is None:
+            palette = dict(h.COLORS.__colorValues__)
+
+        if h.__isMappingType__(palette):
+            entries = sorted(palette.items(), key = lambda item: str(item[0]))
+        else:
+            entries = [(colorValue, colorValue) for colorValue in palette]
+
+        self.metric = metric
+        self.__transform__ = METRICS[metric]
+
+        # Store each distinct color once, with the first entry that has it
+        self.__entries__ = []
+        seenValues = set()
+        points = []
+        for entryName, colorValue in entries:
+            rgb = h.__rgbFromColor__(colorValue)
+            if rgb not in seenValues:
+                seenValues.add(rgb)
+                points.append((self.__transform__(rgb), len(self.__entries__)))
+                self.__entries__.append(entryName)
+
+        self.__tree__ = __buildTree__(points)
+
+    def __len__(self):
+        """
+        Returns the number of distinct colors in the index
+        """
+        return len(self.__entries__)
+
+    def nearest(self, colorValue):
+        """
+        Returns the palette entry nearest to the provided color value, or None
+        if the palette is empty.
+        """
+        entryIndex = __nearestInTree__(self.__tree__, self.__transform__(h.__rgbFromColor__(colorValue)))
+        if entryIndex is None:
+            return None
+        else:
+            return self.__entries__[entryIndex]
+
+    def nearest_many(self, colorValues):
+        """
+        Returns a list of the palette entries nearest to each of the provided
+        color values. Each distinct color is only searched for once. A
+        ColorArray is read from its packed values, without creating Color
+        objects.
+        """
+        if hasattr(colorValues, 'packed'):
+            rgbValues = (h.__unpackRGB__(int(packedValue)) for packedValue in colorValues.packed)
+        else:
+            rgbValues = (h.__rgbFromColor__(colorValue) for colorValue in colorValues)
+
+        nearestIndexes = dict()
+        nearestEntries = []
+        for rgb in rgbValues:
+            if rgb not in nearestIndexes:
+                nearestIndexes[rgb] = __nearestInTree__(self.__tree__, self.__transform__(rgb))
+            entryIndex = nearestIndexes[rgb]
+            nearestEntries.append(None if entryIndex is None else self.__entries__[entryIndex])
+
+        return nearestEntries
+
+
+def nearest_names(colorValues, palette = None, metric = DEFAULT_METRIC):
+    """
+    Returns a list of the palette entries nearest to each of the provided
+    color values. The palette can be a ColorIndex, a dictionary of names
+    and color values, or a sequence of color values. If it isn't provided,
+    the names in COLORS are returned. Build a ColorIndex once to reuse a
+    large palette across calls.
+        nearest_names(['#FE0101', (0, 0, 250)])  => ['Red', 'Blue']
+    """
+    return __getIndex__(palette, metric).nearest_many(colorValues)
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
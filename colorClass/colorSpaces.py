@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Converts RGB colors to and from other color spaces: HSL, HSV, CIE XYZ, CIE Lab
+and CIE LCh. RGB values are integers between 0 and 255.
+    HSL and HSV     hue in degrees (0 - 360), the other values between 0 and 1
+    XYZ             D65 reference white, with Y between 0 and 1
+    Lab             L between 0 and 100
+    LCh             L between 0 and 100, hue in degrees (0 - 360)
+Converting back to RGB rounds to the nearest integer, and clamps colors that
+are outside of the RGB range.
+"""
+from __future__ import division
+import bisect, math
+
+# D65 reference white, used by XYZ and Lab
+REFERENCE_WHITE = (0.95047, 1.0, 1.08883)
+
+# Lab uses a linear segment below this value, instead of a cube root
+LAB_EPSILON = (6 / 29) ** 3
+
+
+def __linearize__(colorInt):
+    """
+    Returns the linear light value, between 0 and 1, of an sRGB channel value
+    between 0 and 255.
+    """
+    colorValue = colorInt / 255
+    if colorValue <= 0.04045:
+        return colorValue / 12.92
+    else:
+        return ((colorValue + 0.055) / 1.055) ** 2.4
+
+
+# The linear light value of every sRGB channel value
+SRGB_TO_LINEAR = tuple(__linearize__(colorInt) for colorInt in range(256))
+
+# The linear light values halfway between each sRGB channel value and the
+# next. The number of thresholds below a linear value is its sRGB value.
+LINEAR_THRESHOLDS = tuple(__linearize__(colorInt + 0.5) for colorInt in range(255))
+
+# Linear RGB => XYZ, and its inverse
+RGB_TO_XYZ = (
+    (0.4124564, 0.3575761, 0.1804375),
+    (0.2126729, 0.7151522, 0.0721750),
+    (0.0193339, 0.1191920, 0.9503041)
+)
+XYZ_TO_RGB = (
+    (3.2404542, -1.5371385, -0.4985314),
+    (-0.9692660, 1.8760108, 0.0415560),
+    (0.0556434, -0.2040259, 1.0572252)
+)
+
+
+def __delinearize__(linearValue):
+    """
+    Returns the sRGB channel value, between 0 and 255, of a linear light
+    value. Values outside of 0 to 1 are clamped.
+    """
+    return bisect.bisect_right(LINEAR_THRESHOLDS, linearValue)
+
+
+def __toChannel__(value):
+    """
+    Returns a channel value between 0 and 1 as an integer between 0 and 255.
+    Halves are rounded up, the same way in Python 2 and 3.
+    """
+    return min(max(int(math.floor(value * 255 + 0.5)), 0), 255)
+
+
+def __hue__(red, green, blue, maxValue, delta):
+    """
+    Returns the hue, in degrees, of RGB values between 0 and 1
+    """
+    if delta == 0:
+        return 0.0
+    elif maxValue == red:
+        hue = ((green - blue) / delta) % 6
+    elif maxValue == green:
+        hue = (blue - red) / delta + 2
+    else:
+        hue = (red - green) / delta + 4
+    return hue * 60 % 360
+
+
+def __rgbFromHue__(hue, chroma, minValue):
+    """
+    Returns an RGB tuple from a hue in degrees, the chroma and the smallest
+    channel value, which are between 0 and 1.
+    """
+    hue = (hue % 360) / 60
+    secondValue = chroma * (1 - abs(hue % 2 - 1))
+    if hue < 1:
+        rgb = (chroma, secondValue, 0)
+    elif hue < 2:
+        rgb = (secondValue, chroma, 0)
+    elif hue < 3:
+        rgb = (0, chroma, secondValue)
+    elif hue < 4:
+        rgb = (0, secondValue, chroma)
+    elif hue < 5:
+        rgb = (secondValue, 0, chroma)
+    else:
+        rgb = (chroma, 0, secondValue)
+    return tuple(__toChannel__(item + minValue) for item in rgb)
+
+
+def __rgbToHSL__(rgb):
+    """
+    Returns an HSL tuple from an RGB tuple. Missing values are treated as 0.
+        (255, 0, 0)     => (0.0, 1.0, 0.5)
+    """
+    red, green, blue = [(item or 0) / 255 for item in rgb]
+    maxValue = max(red, green, blue)
+    minValue = min(red, green, blue)
+    delta = maxValue - minValue
+    lightness = (maxValue + minValue) / 2
+    saturation = 0.0 if delta == 0 else delta / (1 - abs(2 * lightness - 1))
+    return (__hue__(red, green, blue, maxValue, delta), saturation, lightness)
+
+
+def __hslToRGB__(hsl):
+    """
+    Returns an RGB tuple from an HSL tuple
+        (120, 1, 0.25)  => (0, 128, 0)
+    """
+    hue, saturation, lightness = hsl
+    chroma = (1 - abs(2 * lightness - 1)) * saturation
+    return __rgbFromHue__(hue, chroma, lightness - chroma / 2)
+
+
+def __rgbToHSV__(rgb):
+    """
+    Returns an HSV tuple from an RGB tuple. Missing values are treated as 0.
+        (255, 0, 0)     => (0.0, 1.0, 1.0)
+    """
+    red, green, blue = [(item or 0) / 255 for item in rgb]
+    maxValue = max(red, green, blue)
+    delta = maxValue - min(red, green, blue)
+    saturation = 0.0 if maxValue == 0 else delta / maxValue
+    return (__hue__(red, green, blue, maxValue, delta), saturation, maxValue)
+
+
+def __hsvToRGB__(hsv):
+    """
+    Returns an RGB tuple from an HSV tuple
+        (240, 1, 1)     => (0, 0, 255)
+    """
+    hue, saturation, value = hsv
+    chroma = value * saturation
+    return __rgbFromHue__(hue, chroma, value - chroma)
+
+
+def __rgbToXYZ__(rgb):
+    """
+    Returns a CIE XYZ tuple from an RGB tuple. Missing values are treated as 0.
+    """
+    red, green, blue = [SRGB_TO_LINEAR[item or 0] for item in rgb]
+    return tuple(row[0] * red + row[1] * green + row[2] * blue for row in RGB_TO_XYZ)
+
+
+def __xyzToRGB__(xyz):
+    """
+    Returns an RGB tuple from a CIE XYZ tuple
+    """
+    x, y, z = xyz
+    return tuple(__delinearize__(row[0] * x + row[1] * y + row[2] * z) for row in XYZ_TO_RGB)
+
+
+def __labComponent__(value):
+    """
+    Returns the Lab transfer function of an XYZ value, relative to the reference white
+    """
+    if value > LAB_EPSILON:
+        return value ** (1 / 3)
+    else:
+        return value / (3 * (6 / 29) ** 2) + 4 / 29
+
+
+def __labComponentInverse__(value):
+    """
+    Returns the XYZ value, relative to the reference white, of a Lab transfer
+    function value
+    """
+    if value > 6 / 29:
+        return value ** 3
+    else:
+        return 3 * (6 / 29) ** 2 * (value - 4 / 29)
+
+
+def __xyzToLab__(xyz):
+    """
+    Returns a CIE Lab tuple from a CIE XYZ tuple
+    """
+    x, y, z = [__labComponent__(xyz[index] / REFERENCE_WHITE[index]) for index in range(3)]
+    return (116 * y - 16, 500 * (x - y), 200 * (y - z))
+
+
+def __labToXYZ__(lab):
+    """
+    Returns a CIE XYZ tuple from a CIE Lab tuple
+    """
+    lightness, a, b = lab
+    y = (lightness + 16) / 116
+    return tuple(
+        __labComponentInverse__(value) * REFERENCE_WHITE[index]
+        for index, value in enumerate((y + a / 500, y, y - b / 200))
+    )
+
+
+def __labToLCh__(lab):
+    """
+    Returns a CIE LCh tuple from a CIE Lab tuple
+    """
+    lightness, a, b = lab
+    return (lightness, math.hypot(a, b), math.degrees(math.atan2(b, a)) % 360)
+
+
+def __lchToLab__(lch):
+    """
+    Returns a CIE Lab tuple from a CIE LCh tuple
+    """
+    lightness, chroma, hue = lch
+    hue = math.radians(hue)
+    return (lightness, chroma * math.cos(hue), chroma * math.sin(hue))
+
+
+def __rgbToLab__(rgb):
+    """
+    Returns a CIE Lab tuple from an RGB tuple
+    """
+    return __xyzToLab__(__rgbToXYZ__(rgb))
+
+
+def __labToRGB__(lab):
+    """
+    Returns an RGB tuple from a CIE Lab tuple
+    """
+    return __xyzToRGB__(__labToXYZ__(lab))
+
+
+def __rgbToLCh__(rgb):
+    """
+    Returns a CIE LCh tuple from an RGB tuple
+    """
+    return __labToLCh__(__rgbToLab__(rgb))
+
+
+def __lchToRGB__(lch):
+    """
+    Returns an RGB tuple from a CIE LCh tuple
+    """
+    return __labToRGB__(__lchToLab__(lch))
+
+
+# The functions that convert an RGB tuple to each color space, and back
+COLOR_SPACES = {
+    'hsl': (__rgbToHSL__, __hslToRGB__),
+    'hsv': (__rgbToHSV__, __hsvToRGB__),
+    'xyz': (__rgbToXYZ__, __xyzToRGB__),
+    'lab': (__rgbToLab__, __labToRGB__),
+    'lch': (__rgbToLCh__, __lchToRGB__)
+}
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# pylint: disable=C0322,C0323
+"""
+Extracts colors from large text streams, like CSS, SVG or log files.
+"""
+import re
+import helpers as h
+from color import Color
+
+# The number of characters read from the stream at a time
+DEFAULT_CHUNK_SIZE = 65536
+
+# The longest argument list inside of an rgb() or rgba() call
+MAX_FUNCTION_ARGUMENTS_LENGTH = 64
+
+# The most whitespace before or after the arguments of an rgb() or rgba() call.
+# It's bounded, like the arguments, so that every token fits in the part of
+# the buffer that is held back for the next chunk.
+MAX_FUNCTION_PADDING = 16
+
+# Characters that are kept before the unscanned part of the buffer, so that
+# look-behinds still work across chunks
+LOOKBEHIND_CONTEXT = 1
+
+# Each token type is a named group. Names and hex literals can't be part of a
+# longer word or identifier.
+TOKEN_PATTERN_TEMPLATE = r'''(?i)
+    (?P<hex>\#(?:[0-9a-f]{8}|[0-9a-f]{6}|[0-9a-f]{4}|[0-9a-f]{3})(?![\w-]))
+    |(?<![\w-])(?P<function>rgba?)\(\s{0,%d}(?P<arguments>[^()]{0,%d}?)\s{0,%d}\)
+    |(?<![\w#-])(?P<name>%s)(?![\w-])
+'''
+
+
+def __tokenPattern__(colorNames):
+    """
+    Returns the compiled token pattern for the provided color names, and the
+    longest token it can match. Longer names are matched first.
+    """
+    colorNames = sorted(colorNames, key = lambda name: (-len(name), name))
+    namePattern = '|'.join(re.escape(name) for name in colorNames) or '(?!)'
+    pattern = re.compile(TOKEN_PATTERN_TEMPLATE % (MAX_FUNCTION_PADDING, MAX_FUNCTION_ARGUMENTS_LENGTH, MAX_FUNCTION_PADDING, namePattern), re.VERBOSE)
+
+    functionLength = len('rgba()') + MAX_FUNCTION_PADDING + MAX_FUNCTION_ARGUMENTS_LENGTH + MAX_FUNCTION_PADDING
+    maxTokenLength = max([functionLength, len('#FFFFFFFF')] + [len(name) for name in colorNames])
+    return pattern, maxTokenLength
+
+
+# The token pattern for the names in COLORS, with the number of colors it was built from
+__tokenPatterns__ = dict()
+
+
+def __getTokenPattern__():
+    """
+    Returns the token pattern for the names in COLORS, and the longest token
+    it can match. It is rebuilt if colors have been added to COLORS.
+    """
+    colorCount = len(h.COLORS.__colorValues__)
+    if __tokenPatterns__.get('colorCount') != colorCount:
+        __tokenPatterns__['pattern'] = __tokenPattern__(h.COLORS.__colorNames__.keys())
+        __tokenPatterns__['colorCount'] = colorCount
+    return __tokenPatterns__['pattern']
+
+
+def __colorFromToken__(tokenMatch):
+    """
+    Returns a Color for a match of the token pattern, or None if the token is
+    not a valid color.
+    """
+    if tokenMatch.group('hex') is not None:
+        return Color(tokenMatch.group('hex'))
+
+    elif tokenMatch.group('name') is not None:
+        return Color(tokenMatch.group('name').lower())
+
+    else:
+        rgba = h.__rgbaFromFunctionArguments__(tokenMatch.group('arguments'))
+        if rgba is None:
+            return None
+        else:
+            return Color(rgba)
+
+
+_allowedNames = set(['__name__', '__file__', '__doc__'])
+_ignoredNames = set()
+
+# Ignore everything else that's been set up so far, except for the allowed names
+_ignoredNames = set(locals().keys()) - _allowedNames
+
+
+def iter_colors(fileobj, chunkSize = DEFAULT_CHUNK_SIZE):
+    """
+    Reads the provided file object in chunks, and yields a tuple of
+    (offset, token, Color) for every color found in it. Hex literals ('#FFF',
+    '#FFFFFF', and '#FFFF' or '#FFFFFFFF' with an alpha value), CSS rgb() and
+    rgba() calls, and the names in COLORS are found. Only one chunk, and a small overlap, is held in memory at a time,
+    and tokens that are split across chunks are still found. rgb() and rgba()
+    calls can have up to MAX_FUNCTION_PADDING whitespace characters before
+    and after their arguments, so that every call is found the same way,
+    whatever the chunk size.
+    The offset is the position of the token in the stream. Binary streams
+    are read as Latin-1, so their offsets are byte offsets.
+        iter_colors(io.StringIO(u'a { color: red; background: #FFF }'))
+            => (11, 'red', '#FF0000'), (28, '#FFF', '#FFFFFF')
+    """
+    tokenPattern, maxTokenLength = __getTokenPattern__()
+    # A token that starts before the last holdBack characters is always complete
+    holdBack = maxTokenLength + 1
+    chunkSize = max(chunkSize, holdBack * 4)
+
+    buffer = ''
+    bufferOffset = 0
+    scanPosition = 0
+    isFinished = False
+
+    while not isFinished:
+        chunk = fileobj.read(chunkSize)
+        if isinstance(chunk, bytes) and not isinstance(chunk, str):
+            chunk = chunk.decode('latin-1')
+
+        isFinished = len(chunk) == 0
+        buffer = buffer + chunk
+
+        scanLimit = len(buffer) if isFinished else len(buffer) - holdBack
+        if scanLimit <= scanPosition:
+            continue
+
+        for tokenMatch in tokenPattern.finditer(buffer, scanPosition):
+            if tokenMatch.start() >= scanLimit:
+                break
+
+            tokenColor = __colorFromToken__(tokenMatch)
+            if tokenColor is not None:
+                yield (bufferOffset + tokenMatch.start(), tokenMatch.group(0), tokenColor)
+            scanPosition = tokenMatch.end()
+
+        # Drop everything that has been scanned, except for the look-behind context
+        scanPosition = max(scanPosition, scanLimit)
+        carryStart = max(scanPosition - LOOKBEHIND_CONTEXT, 0)
+        buffer = buffer[carryStart:]
+        bufferOffset += carryStart
+        scanPosition -= carryStart
+
+
+# Add all of the imports, except for the ignored names
+__all__ = sorted(set(locals().keys()) - _ignoredNames)
+del _allowedNames
+del _ignoredNames
@@ -3,7 +3,8 @@
 """
 Provides a set of helper functions to validate and manipulate object types
 """
-import collections, copy, inspect, re, string, sys
+import collections, copy, math, re, string, sys, threading, types
+from collections import OrderedDict
 from definedColors import __definedColors__
 
 
@@ -11,10 +12,24 @@ from definedColors import __definedColors__
 DEFAULT_COLOR = '#000000'
 DEFAULT_HEX_VALUE = '00'
 DEFAULT_INT_VALUE = 0
+# Colors are opaque unless an alpha value is provided
+DEFAULT_ALPHA_VALUE = 255
 
 # A list of values, in order, that we'll look for when parsing iterables
 RGB_PARSER = ['r', 'g', 'b']
 RGB_NAMES = ['red', 'green', 'blue']
+RGBA_PARSER = RGB_PARSER + ['a']
+RGBA_NAMES = RGB_NAMES + ['alpha']
+
+# The number of parsed values the parse cache holds once enabled, if no size is given
+DEFAULT_CACHE_SIZE = 4096
+
+# The blend mode, delta-E formula and nearest color metric to use if none is
+# given. They're defined here, so that the Color methods can use them as
+# defaults without importing the modules that use them.
+DEFAULT_BLEND_MODE = 'over'
+DEFAULT_DELTA_E_FORMULA = 'ciede2000'
+DEFAULT_METRIC = 'rgb'
 
 # Non-whitespace characters that are turned into whitespace before splitting a potential RGB color string
 SEPARATORS = ','
@@ -24,15 +39,62 @@ VALID_HEX_CHARACTER = r'[0-9a-fA-F]'
 # Match hex strings of various lengths
 VALID_HEX_STRING_TEMPLATE = r'^\s*#?(%s{CHARACTERCOUNT})\s*$' % VALID_HEX_CHARACTER
 
+
+class __lazyPattern__(object):
+    """
+    A regular expression that is compiled the first time it's used, rather
+    than on import. Each attribute of the compiled pattern, like match, is
+    stored on the object once it has been looked up, so later uses don't go
+    through __getattr__.
+    """
+    def __init__(self, pattern, flags = 0):
+        self.pattern = pattern
+        self.flags = flags
+
+    def __getattr__(self, attributeName):
+        attributeValue = getattr(re.compile(self.pattern, self.flags), attributeName)
+        self.__dict__[attributeName] = attributeValue
+        return attributeValue
+
+
 HEX_PATTERNS = [
-    re.compile(VALID_HEX_STRING_TEMPLATE.replace('CHARACTERCOUNT', '2')),
-    re.compile(VALID_HEX_STRING_TEMPLATE.replace('CHARACTERCOUNT', '3')),
-    re.compile(VALID_HEX_STRING_TEMPLATE.replace('CHARACTERCOUNT', '6'))
+    __lazyPattern__(VALID_HEX_STRING_TEMPLATE.replace('CHARACTERCOUNT', '2')),
+    __lazyPattern__(VALID_HEX_STRING_TEMPLATE.replace('CHARACTERCOUNT', '3')),
+    __lazyPattern__(VALID_HEX_STRING_TEMPLATE.replace('CHARACTERCOUNT', '6'))
 ]
 
-# Python 2 vs 3 abstract collection class
+# Matches any of the HEX_PATTERNS in a single pass
+HEX_STRING_PATTERN = __lazyPattern__(VALID_HEX_STRING_TEMPLATE.replace('{CHARACTERCOUNT}', '{6}|%s{3}|%s{2}' % (VALID_HEX_CHARACTER, VALID_HEX_CHARACTER)))
+# Matches hex strings with an alpha value, as #RRGGBBAA or #RGBA
+HEX_ALPHA_PATTERN = __lazyPattern__(VALID_HEX_STRING_TEMPLATE.replace('{CHARACTERCOUNT}', '{8}|%s{4}' % VALID_HEX_CHARACTER))
+
+# Matches a CSS rgb() or rgba() call, and the separators between its arguments
+RGB_FUNCTION_PATTERN = __lazyPattern__(r'^\s*rgba?\(\s*([^()]*?)\s*\)\s*$', re.IGNORECASE)
+FUNCTION_ARGUMENT_SEPARATOR = __lazyPattern__(r'[\s,/]+')
+
+# Python 2 vs 3 abstract collection class and string types
 if tuple(sys.version_info)[0] == 3:
     collections = collections.abc
+    STRING_TYPES = (str, bytes)
+else:
+    STRING_TYPES = (str, unicode)
+
+# Types that the parser will not try to flatten
+SCALAR_TYPES = STRING_TYPES + (int, float, type(None))
+SEQUENCE_TYPES = (list, tuple)
+
+# Lookup tables for the per-channel conversions, built once on import.
+# Every color int => its upper case hex pair, and its percentage
+INT_TO_HEX = tuple('%02X' % colorInt for colorInt in range(256))
+INT_TO_PERCENT = tuple(colorInt / 255.0 for colorInt in range(256))
+# Every hex digit, in upper and lower case => its value
+HEX_DIGIT_TO_INT = dict((digit, int(digit, 16)) for digit in '0123456789abcdefABCDEF')
+# Every hex pair, in any mix of upper and lower case => its color int
+HEX_TO_INT = dict(
+    (firstDigit + secondDigit, HEX_DIGIT_TO_INT[firstDigit] * 16 + HEX_DIGIT_TO_INT[secondDigit])
+    for firstDigit in HEX_DIGIT_TO_INT
+    for secondDigit in HEX_DIGIT_TO_INT
+)
 
 
 def __isIntType__(obj):
@@ -81,7 +143,7 @@ def __isHexString__(inputValue):
     Returns True if the inputValue is a hex string.
     """
     if __isStringType__(inputValue):
-        return len([res for res in [patt.match(inputValue) for patt in HEX_PATTERNS] if res is not None]) > 0
+        return HEX_STRING_PATTERN.match(inputValue) is not None
     else:
         return False
 
@@ -100,7 +162,7 @@ def __isFunctionType__(obj):
     """
     Returns true if the provided object is a function
     """
-    return inspect.isfunction(obj)
+    return isinstance(obj, types.FunctionType)
 
 
 def __isIterableType__(obj):
@@ -194,6 +256,16 @@ def __getColorInt__(inputValue):
     """
     if __isColorInt__(inputValue):
         return inputValue
+
+    elif inputValue.__class__ is float:
+        # The same rules as below, without converting the value again
+        if 0.0 <= inputValue <= 1.0:
+            return int(inputValue * 255)
+        elif -1.0 < inputValue < 256.0:
+            return int(inputValue)
+        else:
+            return None
+
     else:
 
         if __isColorPercent__(__toFloat__(inputValue)):
@@ -215,7 +287,10 @@ def __intToHex__(inputValue):
     Returns DEFAULT_HEX_VALUE if the value cannot be converted.
     """
 
-    if __isHexString__(inputValue):
+    if inputValue.__class__ is int and 0 <= inputValue <= 255:
+        return INT_TO_HEX[inputValue]
+
+    elif __isHexString__(inputValue):
         return __getHexString__(inputValue)
 
     else:
@@ -264,6 +339,9 @@ def __getColorPercent__(inputValue):
     if __isColorPercent__(inputValue):
         return inputValue
 
+    elif inputValue.__class__ is int and 0 <= inputValue <= 255:
+        return INT_TO_PERCENT[inputValue]
+
     else:
         if __isColorInt__(inputValue) or __isColorInt__(__toInt__(inputValue)):
             returnValue = __toFloat__(inputValue / 255.0)
@@ -296,10 +374,10 @@ def __getHexString__(inputValue):
     """
     if __isStringType__(inputValue):
 
-        matchResults = __getElement__([res.groups()[0] for res in [patt.match(inputValue) for patt in HEX_PATTERNS] if res is not None])
+        hexMatch = HEX_STRING_PATTERN.match(inputValue)
 
-        if matchResults is not None:
-            hexString = matchResults.upper()
+        if hexMatch is not None:
+            hexString = hexMatch.group(1).upper()
 
             # Expand 3-character hex strings -> 6
             if len(hexString) == 3:
@@ -324,6 +402,8 @@ def __hexToInt__(inputValue):
 
     if __isColorInt__(inputValue):
         return inputValue
+    elif isinstance(inputValue, STRING_TYPES) and inputValue in HEX_TO_INT:
+        return HEX_TO_INT[inputValue]
     elif __isHexString__(inputValue):
         return __toInt__(__getHexString__(inputValue), 16)
     else:
@@ -348,6 +428,13 @@ def __rgbToHex__(values):
     """
     Returns a formatted hex string created from the provided RGB values
     """
+    # RGB tuples of color ints, like the ones from Color.rgb, are formatted
+    # with table lookups
+    if values.__class__ is tuple and len(values) == 3:
+        red, green, blue = values
+        if red.__class__ is int and green.__class__ is int and blue.__class__ is int and 0 <= red <= 255 and 0 <= green <= 255 and 0 <= blue <= 255:
+            return '#' + INT_TO_HEX[red] + INT_TO_HEX[green] + INT_TO_HEX[blue]
+
     returnValue = DEFAULT_COLOR
     if __isHexString__(values):
         returnValue = values
@@ -621,30 +708,517 @@ def __hexFromValue__(*inputValue):
     return __rgbToHex__(__rgbFromValue__(inputValue))
 
 
-def __rgbFromValue__(*inputValue):
+def __toColorInt__(inputValue):
     """
-    The main parsing function. Attempts to return an RGB tuple
-    from the provided values.
+    A faster equivalent of __getColorInt__, used by the parser. Returns an
+    integer between 0 and 255 from the provided value, or None if the value
+    cannot be converted.
     """
-    parseValue = __getValues__(inputValue)
+    if isinstance(inputValue, int) and 0 <= inputValue <= 255:
+        return inputValue
+
+    try:
+        floatValue = float(inputValue)
+        if 0.0 <= floatValue <= 1.0:
+            return int(floatValue * 255)
+        intValue = int(floatValue)
+    except:
+        return None
+
+    if 0 <= intValue <= 255:
+        return intValue
+    else:
+        return None
+
+
+def __roundChannel__(floatValue):
+    """
+    Returns a channel value rounded half up to an integer, the same way on
+    Python 2 and 3
+        127.5   => 128
+    """
+    return int(math.floor(floatValue + 0.5))
+
+
+def __toAlphaInt__(inputValue):
+    """
+    Returns an alpha between 0 and 255 from the provided value, or None if
+    the value cannot be converted. Like __toColorInt__, except fractions
+    between 0 and 1 are rounded instead of truncated, so that every way of
+    writing an alpha, like rgba(0, 0, 0, 0.5) and (0, 0, 0, 0.5), gives the
+    same value.
+        0.5     => 128
+    """
+    if isinstance(inputValue, int) and 0 <= inputValue <= 255:
+        return inputValue
+
+    try:
+        floatValue = float(inputValue)
+    except:
+        return None
+
+    if 0.0 <= floatValue <= 1.0:
+        return __roundChannel__(floatValue * 255)
+    else:
+        return __toColorInt__(inputValue)
+
+
+def __rgbFromHexDigits__(hexDigits):
+    """
+    Returns an RGB tuple from a string of 2, 3 or 6 hex digits, without a
+    leading hash symbol. A 2-digit string is used as the red value.
+    """
+    if len(hexDigits) == 6:
+        return (HEX_TO_INT[hexDigits[0:2]], HEX_TO_INT[hexDigits[2:4]], HEX_TO_INT[hexDigits[4:6]])
+    elif len(hexDigits) == 3:
+        return (HEX_DIGIT_TO_INT[hexDigits[0]] * 17, HEX_DIGIT_TO_INT[hexDigits[1]] * 17, HEX_DIGIT_TO_INT[hexDigits[2]] * 17)
+    else:
+        return (HEX_TO_INT[hexDigits], DEFAULT_INT_VALUE, DEFAULT_INT_VALUE)
+
+
+def __rgbaFromHexDigits__(hexDigits):
+    """
+    Returns an RGBA tuple from a string of 4 or 8 hex digits, without a
+    leading hash symbol
+    """
+    if len(hexDigits) == 8:
+        return (HEX_TO_INT[hexDigits[0:2]], HEX_TO_INT[hexDigits[2:4]], HEX_TO_INT[hexDigits[4:6]], HEX_TO_INT[hexDigits[6:8]])
+    else:
+        return tuple(HEX_DIGIT_TO_INT[hexDigit] * 17 for hexDigit in hexDigits)
+
+
+def __rgbaFromFunctionArguments__(arguments):
+    """
+    Returns an RGBA tuple from the arguments of a CSS rgb() or rgba() call, or
+    None if they can't be parsed. Values are numbers from 0 to 255, or
+    percentages, and are clamped to that range like CSS does. The alpha is a
+    number from 0 to 1, or a percentage, and is opaque if it's missing.
+        '255, 0, 128'       => (255, 0, 128, 255)
+        '100% 0% 50% / 0.5' => (255, 0, 128, 128)
+    """
+    values = [value for value in FUNCTION_ARGUMENT_SEPARATOR.split(arguments) if value]
+    if len(values) not in (3, 4):
+        return None
+
+    rgba = []
+    for valueIndex, value in enumerate(values):
+        # The alpha is read as a fraction of the largest channel value
+        scale = 1.0 if valueIndex < 3 else 255.0
+        try:
+            if value.endswith('%'):
+                colorValue = float(value[:-1]) * 255 / 100.0
+            else:
+                colorValue = float(value) * scale
+        except ValueError:
+            return None
+        rgba.append(__roundChannel__(min(max(colorValue, 0.0), 255.0)))
+
+    if len(rgba) == 3:
+        rgba.append(DEFAULT_ALPHA_VALUE)
+    return tuple(rgba)
+
+
+def __fallbackRGB__(stringValue):
+    """
+    Returns opaque black, for a string that is not a color name, a hex
+    string, or separated RGB values. This is its own function so that the
+    profiler can count how often it happens.
+    """
+    return (DEFAULT_INT_VALUE, DEFAULT_INT_VALUE, DEFAULT_INT_VALUE, DEFAULT_ALPHA_VALUE)
+
+
+def __rgbaFromString__(stringValue):
+    """
+    Returns an RGBA tuple from a hex string, a color name, a CSS rgb() or
+    rgba() call, or a string of separated RGB values, with an optional alpha
+    value after them. Strings that cannot be parsed return black.
+    """
+    # Color names, as they were defined or in lower case
+    packedValue = COLORS.__colorInts__.get(stringValue)
+    if packedValue is not None:
+        return __unpackRGBA__(packedValue)
+
+    hexMatch = HEX_STRING_PATTERN.match(stringValue)
+    if hexMatch is not None:
+        return __rgbFromHexDigits__(hexMatch.group(1)) + (DEFAULT_ALPHA_VALUE,)
+
+    cleanString = stringValue.strip().lower()
+    packedValue = COLORS.__colorInts__.get(cleanString)
+    if packedValue is not None:
+        return __unpackRGBA__(packedValue)
+
+    hexMatch = HEX_ALPHA_PATTERN.match(stringValue)
+    if hexMatch is not None:
+        return __rgbaFromHexDigits__(hexMatch.group(1))
+
+    if cleanString.startswith('rgb'):
+        functionMatch = RGB_FUNCTION_PATTERN.match(cleanString)
+        rgba = __rgbaFromFunctionArguments__(functionMatch.group(1)) if functionMatch is not None else None
+        return __fallbackRGB__(stringValue) if rgba is None else rgba
+
+    for separator in SEPARATORS:
+        cleanString = cleanString.replace(separator, ' ')
+    splitValues = cleanString.split()
+
+    if len(splitValues) <= 1:
+        return __fallbackRGB__(stringValue)
+
+    rgba = [DEFAULT_INT_VALUE, DEFAULT_INT_VALUE, DEFAULT_INT_VALUE, DEFAULT_ALPHA_VALUE]
+    for colorIndex, colorValue in enumerate(splitValues[:len(rgba)]):
+        colorValue = __toColorInt__(colorValue) if colorIndex < 3 else __toAlphaInt__(colorValue)
+        if colorValue is not None:
+            rgba[colorIndex] = colorValue
+
+    return tuple(rgba)
+
+
+def __rgbaFromColorString__(stringValue):
+    """
+    Returns an RGBA tuple from a color name, a hex string, or a CSS rgb() or
+    rgba() call. Unlike __rgbaFromString__, any other string returns None
+    instead of black.
+        '#FF000080'     => (255, 0, 0, 128)
+        'notacolor'     => None
+    """
+    cleanString = stringValue.strip().lower()
+    packedValue = COLORS.__colorInts__.get(cleanString)
+    if packedValue is not None:
+        return __unpackRGBA__(packedValue)
+
+    hexMatch = HEX_STRING_PATTERN.match(stringValue)
+    if hexMatch is not None:
+        return __rgbFromHexDigits__(hexMatch.group(1)) + (DEFAULT_ALPHA_VALUE,)
+
+    hexMatch = HEX_ALPHA_PATTERN.match(stringValue)
+    if hexMatch is not None:
+        return __rgbaFromHexDigits__(hexMatch.group(1))
+
+    functionMatch = RGB_FUNCTION_PATTERN.match(cleanString)
+    return __rgbaFromFunctionArguments__(functionMatch.group(1)) if functionMatch is not None else None
+
+
+def __rgbaFromValues__(values):
+    """
+    Returns an RGBA tuple from a flattened tuple of values. Single values are
+    assigned to red, green, blue and alpha by their position, and 2-item
+    tuples (from a dictionary) are assigned by the RGBA_PARSER name their key
+    starts with. Color values that cannot be converted are None, and the
+    alpha is opaque unless it's provided.
+    """
+    rgba = [None for item in RGBA_PARSER]
+
+    for colorIndex, item in enumerate(values):
+        if isinstance(item, SCALAR_TYPES):
+            if colorIndex < 3:
+                rgba[colorIndex] = __toColorInt__(item)
+            elif colorIndex == 3:
+                rgba[colorIndex] = __toAlphaInt__(item)
+
+        elif item.__class__ is tuple and len(item) == 2 and isinstance(item[0], SCALAR_TYPES) and isinstance(item[1], SCALAR_TYPES):
+            colorName = str(item[0]).strip().lower()
+            for parserIndex in range(len(RGBA_PARSER)):
+                if colorName.startswith(RGBA_PARSER[parserIndex]):
+                    rgba[parserIndex] = __toColorInt__(item[1]) if parserIndex < 3 else __toAlphaInt__(item[1])
+                    break
 
-    if __isRGB__(parseValue):
-        return parseValue
-    # Parse as a hex string, or as the red color of an RGB pair
-    elif len(parseValue) == 1:
-        parseValue = parseValue[0]
-        returnValue = __parseStringValue__(parseValue)
-        if returnValue is not None:
-            return __hexStringToRGB__(returnValue)
         else:
-            # If it's a number, we'll assume it's the red color of an RGB set
-            return __rgbFromValue__(__getColorInt__(parseValue), None, None)
+            # Anything unusual is handled by the generic element parser
+            colorName, colorValue = __getColorTupleFromElement__((colorIndex, item))
+            if colorName is not None:
+                rgba[RGB_PARSER.index(colorName)] = colorValue
+
+    if rgba[3] is None:
+        rgba[3] = DEFAULT_ALPHA_VALUE
+    return tuple(rgba)
+
+
+def __parseValue__(inputValue):
+    """
+    Parses the provided tuple of values into an RGBA tuple.
+    The input is classified once, and then parsed directly into an RGBA
+    tuple, without building intermediate hex strings.
+    """
+    parseValue = inputValue
+
+    # Unwrap single values, like the arguments from Color('#FFF')
+    while parseValue.__class__ in SEQUENCE_TYPES and len(parseValue) == 1:
+        parseValue = parseValue[0]
+
+    if isinstance(parseValue, STRING_TYPES):
+        return __rgbaFromString__(parseValue)
+
+    elif parseValue.__class__ in SEQUENCE_TYPES:
+        for item in parseValue:
+            if not isinstance(item, SCALAR_TYPES):
+                parseValue = __flatten__(parseValue)
+                break
+
+    elif __isMappingType__(parseValue):
+        parseValue = tuple(parseValue.items())
+
+    elif __isNonStringIterableType__(parseValue):
+        parseValue = __flatten__(parseValue)
+
+    elif __isStringType__(parseValue):
+        return __rgbaFromString__(parseValue)
+
+    else:
+        parseValue = (parseValue,)
+
+    if len(parseValue) == 1 and __isStringType__(parseValue[0]):
+        return __rgbaFromString__(parseValue[0])
+    else:
+        return __rgbaFromValues__(parseValue)
 
-    elif len(parseValue) > 1:
-        return __parseIterableValue__(parseValue)
 
+def __rgbaFromValue__(*inputValue):
+    """
+    The main parsing function. Attempts to return an RGBA tuple
+    from the provided values. The alpha is always an integer, and is
+    DEFAULT_ALPHA_VALUE unless one was provided.
+    If the parse cache is enabled, previously parsed values are returned
+    from the cache.
+    """
+    if PARSE_CACHE.maxSize > 0:
+        return PARSE_CACHE.get(inputValue)
     else:
-        return tuple([None, None, None])
+        return __parseValue__(inputValue)
+
+
+def __rgbFromValue__(*inputValue):
+    """
+    Attempts to return an RGB tuple from the provided values. Any alpha
+    value is parsed, and then dropped.
+    """
+    return __rgbaFromValue__(*inputValue)[:3]
+
+
+def __packRGB__(rgb):
+    """
+    Returns the provided RGB tuple packed into a single integer, as 0xRRGGBB.
+    Missing values are packed as DEFAULT_INT_VALUE.
+    """
+    red, green, blue = [DEFAULT_INT_VALUE if item is None else item for item in rgb]
+    return (red << 16) | (green << 8) | blue
+
+
+def __unpackRGB__(packedValue):
+    """
+    Returns an RGB tuple from an integer packed as 0xRRGGBB.
+    """
+    return ((packedValue >> 16) & 0xFF, (packedValue >> 8) & 0xFF, packedValue & 0xFF)
+
+
+def __packRGBA__(rgba):
+    """
+    Returns the provided RGBA tuple packed into a single 32-bit integer. The
+    top byte holds the transparency, 255 - alpha, so an opaque color packs
+    to the same 0xRRGGBB value as its RGB tuple, and any packed value above
+    0xFFFFFF is translucent.
+        (255, 0, 128, 255)  => 0x00FF0080
+        (255, 0, 128, 0)    => 0xFFFF0080
+    """
+    red, green, blue, alpha = rgba
+    packedValue = __packRGB__((red, green, blue))
+    if alpha == DEFAULT_ALPHA_VALUE:
+        return packedValue
+    else:
+        return ((DEFAULT_ALPHA_VALUE - alpha) << 24) | packedValue
+
+
+def __unpackRGBA__(packedValue):
+    """
+    Returns an RGBA tuple from an integer packed by __packRGBA__
+    """
+    return ((packedValue >> 16) & 0xFF, (packedValue >> 8) & 0xFF, packedValue & 0xFF, DEFAULT_ALPHA_VALUE - (packedValue >> 24))
+
+
+def __packHex__(hexValue):
+    """
+    Returns a formatted '#RRGGBB' or '#RRGGBBAA' hex string packed by
+    __packRGBA__
+        '#FF0080'       => 0x00FF0080
+        '#FF008000'     => 0xFFFF0080
+    """
+    hexDigits = hexValue.lstrip('#')
+    if len(hexDigits) == 8:
+        return __packRGBA__(__rgbaFromHexDigits__(hexDigits))
+    else:
+        return int(hexDigits, 16)
+
+
+def __rgbaToHex__(rgb, alpha):
+    """
+    Returns a formatted hex string from an RGB tuple and an alpha value.
+    Opaque colors are formatted as '#RRGGBB', and other colors as
+    '#RRGGBBAA'.
+    """
+    if alpha == DEFAULT_ALPHA_VALUE:
+        return __rgbToHex__(rgb)
+    else:
+        return __rgbToHex__(rgb) + INT_TO_HEX[alpha]
+
+
+def __rgbFromColor__(colorValue):
+    """
+    Returns an RGB tuple of integers from a Color, a FrozenColor, or any
+    value that can be parsed. Missing values are 0.
+    """
+    if hasattr(colorValue, 'rgb'):
+        return colorValue.rgb
+    else:
+        return tuple(item or DEFAULT_INT_VALUE for item in __rgbFromValue__(colorValue))
+
+
+def __rgbaFromColor__(colorValue):
+    """
+    Returns an RGBA tuple of integers from a Color, a FrozenColor, or any
+    value that can be parsed. Missing color values are 0.
+    """
+    if hasattr(colorValue, 'rgba'):
+        return colorValue.rgba
+    else:
+        red, green, blue, alpha = __rgbaFromValue__(colorValue)
+        return (red or DEFAULT_INT_VALUE, green or DEFAULT_INT_VALUE, blue or DEFAULT_INT_VALUE, alpha)
+
+
+def __cacheKey__(inputValue):
+    """
+    Returns a hashable key for the provided values, or None if the values
+    cannot be cached. Single values are unwrapped the same way the parser
+    unwraps them, and numbers are keyed with their type, since 1 and 1.0
+    parse to different colors. NaN is never equal to itself, so values
+    with NaN are not cached, or they would fill the cache with keys that
+    can never be found.
+    Examples:
+        ('#FFF',)       => '#FFF'
+        [[128]]         => (int, 128)
+        (1.0, 0, 0)     => ((float, 1.0), (int, 0), (int, 0))
+        ([1], {'g': 1}) => None
+        (nan, 0, 0)     => None
+    """
+    cacheValue = inputValue
+    while cacheValue.__class__ in SEQUENCE_TYPES and len(cacheValue) == 1:
+        cacheValue = cacheValue[0]
+
+    if isinstance(cacheValue, STRING_TYPES):
+        return cacheValue
+
+    elif cacheValue.__class__ in SEQUENCE_TYPES:
+        cacheKey = []
+        for item in cacheValue:
+            if isinstance(item, STRING_TYPES):
+                cacheKey.append(item)
+            elif isinstance(item, SCALAR_TYPES) and item == item:
+                cacheKey.append((item.__class__, item))
+            else:
+                return None
+        return tuple(cacheKey)
+
+    elif isinstance(cacheValue, SCALAR_TYPES) and cacheValue == cacheValue:
+        return (cacheValue.__class__, cacheValue)
+
+    else:
+        return None
+
+
+class __parseCache__(object):
+    """
+    A bounded cache of parsed RGBA tuples, keyed on the values that were
+    parsed. Once the cache is full, the least recently used value is evicted.
+    The cache is disabled while its maximum size is 0. Values that cannot be
+    hashed, like lists of lists or dictionaries, are parsed without the cache.
+    """
+    __slots__ = ['__values__', '__lock__', 'maxSize', 'hits', 'misses', 'evictions']
+
+    def __init__(self, maxSize = 0):
+        self.__values__ = OrderedDict()
+        self.__lock__ = threading.Lock()
+        self.maxSize = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.resize(maxSize)
+
+    def __len__(self):
+        """
+        Returns the number of values in the cache
+        """
+        return len(self.__values__)
+
+    def get(self, inputValue):
+        """
+        Returns the RGBA tuple for the provided values, parsing and caching
+        them if they are not in the cache already.
+        """
+        cacheKey = __cacheKey__(inputValue)
+        if cacheKey is None:
+            return __parseValue__(inputValue)
+
+        with self.__lock__:
+            rgba = self.__values__.pop(cacheKey, None)
+            if rgba is not None:
+                # Re-insert the value, so that it is the most recently used
+                self.__values__[cacheKey] = rgba
+                self.hits += 1
+                return rgba
+            self.misses += 1
+
+        rgba = __parseValue__(inputValue)
+
+        with self.__lock__:
+            self.__values__[cacheKey] = rgba
+            self.__evict__()
+
+        return rgba
+
+    def __evict__(self):
+        """
+        Removes the least recently used values, until the cache fits its
+        maximum size.
+        """
+        while len(self.__values__) > self.maxSize:
+            self.__values__.popitem(last = False)
+            self.evictions += 1
+
+    def clear(self):
+        """
+        Removes every value from the cache. The hit, miss and eviction
+        counts are kept.
+        """
+        with self.__lock__:
+            self.__values__.clear()
+
+    def resize(self, maxSize = DEFAULT_CACHE_SIZE):
+        """
+        Sets the maximum number of values the cache holds, evicting the least
+        recently used values if needed. A size of 0 disables the cache.
+        """
+        maxSize = __toInt__(maxSize)
+        if maxSize is None or maxSize < 0:
+            raise ValueError('The cache size must be a positive integer, or 0!')
+
+        with self.__lock__:
+            self.maxSize = maxSize
+            self.__evict__()
+
+    def stats(self):
+        """
+        Returns a dictionary with the hit, miss and eviction counts, and the
+        current and maximum size of the cache.
+        """
+        return dict(hits = self.hits, misses = self.misses, evictions = self.evictions, size = len(self), maxSize = self.maxSize)
+
+
+def __hasSlot__(obj, slotName):
+    """
+    Returns True if the slot has been set on the provided object
+    """
+    try:
+        object.__getattribute__(obj, slotName)
+        return True
+    except AttributeError:
+        return False
 
 
 class __const__(object):
@@ -652,13 +1226,64 @@ class __const__(object):
     A subclass of object that does not allow existing properties to be updated. New values can be added.
     Properties can be referenced like normal object properties, or like a dictionary.
     New values can only be valid colors, and will be converted to hex strings.
+    Each color is also indexed by its value packed by __packRGBA__, so that color
+    names can be parsed, and colors can be looked up by value, with a single
+    dictionary lookup. Translucent colors keep their alpha, as '#RRGGBBAA'.
     """
-    __slots__ = ['__colorValues__', '__colorNames__']
+    __slots__ = ['__colorValues__', '__colorNames__', '__colorInts__', '__hexNames__', '__intNames__', '__loadLock__']
+
+    # The slots that hold the colors and their indexes
+    __tableNames__ = ('__colorValues__', '__colorNames__', '__colorInts__', '__hexNames__', '__intNames__')
 
     def __init__(self):
-        __colorValues__ = dict(__definedColors__)
-        __colorNames__ = dict((__cleanString__(key), key) for key in __colorValues__.keys())
-        pass
+        # __setattr__ is overridden to add colors, so the slots are set directly.
+        # The color table is built the first time it's used, not on import.
+        object.__setattr__(self, '__loadLock__', threading.Lock())
+
+    def __load__(self):
+        """
+        Builds the color table and its indexes from the defined colors. Each
+        index is only set once every color has been added to it, so that other
+        threads never see a partly built table.
+        """
+        with self.__loadLock__:
+            if all(__hasSlot__(self, tableName) for tableName in self.__tableNames__):
+                return
+
+            colorTable = object.__new__(__const__)
+            object.__setattr__(colorTable, '__colorValues__', dict())
+            object.__setattr__(colorTable, '__colorNames__', dict())
+            # Original and cleaned color names => packed value
+            object.__setattr__(colorTable, '__colorInts__', dict())
+            # Hex string => color names
+            object.__setattr__(colorTable, '__hexNames__', dict())
+            # Packed value => color names
+            object.__setattr__(colorTable, '__intNames__', dict())
+
+            for colorName, hexValue in __definedColors__.items():
+                colorTable.__addColor__(colorName, hexValue)
+
+            for tableName in self.__tableNames__:
+                object.__setattr__(self, tableName, object.__getattribute__(colorTable, tableName))
+
+    def __addColor__(self, colorName, hexValue):
+        """
+        Adds the color name and its formatted hex value to the object, and to
+        its indexes.
+        """
+        cleanName = __cleanString__(colorName)
+        packedValue = __packHex__(hexValue)
+
+        self.__colorValues__[colorName] = hexValue
+        self.__colorNames__[cleanName] = colorName
+
+        # Names that look like hex strings are always parsed as hex strings
+        if HEX_STRING_PATTERN.match(colorName) is None and HEX_ALPHA_PATTERN.match(colorName) is None:
+            self.__colorInts__[colorName] = packedValue
+            self.__colorInts__[cleanName] = packedValue
+
+        self.__hexNames__[hexValue] = sorted(self.__hexNames__.get(hexValue, []) + [colorName])
+        self.__intNames__[packedValue] = self.__hexNames__[hexValue]
 
     def __contains__(self, lookupKey):
         """
@@ -679,6 +1304,11 @@ class __const__(object):
         """
         Returns the value of a property. If it does not exist, the default value is returned.
         """
+        # Only called for the color table when it hasn't been built yet
+        if lookupKey in self.__tableNames__:
+            self.__load__()
+            return object.__getattribute__(self, lookupKey)
+
         try:
             return self.__getitem__(lookupKey)
         except AttributeError as err:
@@ -712,10 +1342,11 @@ class __const__(object):
         """
 
         if __isStringType__(lookupKey):
-            if lookupKey not in self.__colorNames__:
-                cleanKey = __cleanString__(lookupKey)
-                self.__colorValues__[lookupKey] = __hexFromValue__(newValue)
-                self.__colorNames__[cleanKey] = lookupKey.strip()
+            if not self.has_key(lookupKey):
+                red, green, blue, alpha = __rgbaFromValue__(newValue)
+                self.__addColor__(lookupKey.strip(), __rgbaToHex__((red, green, blue), alpha))
+                # The new name may have been cached as an unknown string
+                PARSE_CACHE.clear()
             else:
                 raise KeyError('Cannot overwrite an existing key value!')
         else:
@@ -742,4 +1373,20 @@ class __const__(object):
         else:
             return None
 
+    def get_names(self, colorValue):
+        """
+        Returns a sorted list of the color names (with original casing) that
+        have the provided color value. Formatted hex strings, like '#FF0000',
+        are looked up directly. Other values, like Color objects, RGB tuples,
+        or other color names, are parsed first.
+        If no colors have the value, an empty list is returned.
+        """
+        colorNames = self.__hexNames__.get(colorValue) if __isStringType__(colorValue) else None
+
+        if colorNames is None:
+            colorNames = self.__intNames__.get(__packRGBA__(__rgbaFromColor__(colorValue)), [])
+
+        return colorNames[:]
+
+PARSE_CACHE = __parseCache__()
 COLORS = __const__()
@@ -0,0 +1,157 @@
+"""
+Times benchmark cases, writes the results as JSON, and compares them to a
+baseline.
+Each module of benchmarks should have a benchmarks variable: a list of tuples
+that contain the name of the benchmark, its group, and a function that takes
+no arguments and runs the code that is being timed once.
+"""
+import argparse, json, platform, sys, timeit
+
+# The number of samples that are timed for each benchmark
+DEFAULT_REPEAT = 7
+
+# Each sample runs the benchmark enough times to take at least this many seconds
+MINIMUM_SAMPLE_TIME = 0.02
+
+# A benchmark is a regression if it's this much slower than the baseline (0.2 => 20% slower)
+DEFAULT_THRESHOLD = 0.2
+
+# The version of the results format, stored in the JSON output
+RESULTS_VERSION = 1
+
+
+def __calibrate__(benchmarkFunction, minimumTime = MINIMUM_SAMPLE_TIME):
+    """
+    Returns the number of times the function has to run for a sample to take
+    at least minimumTime seconds.
+    """
+    timer = timeit.Timer(benchmarkFunction)
+    number = 1
+    while True:
+        if timer.timeit(number) >= minimumTime:
+            return number
+        number *= 10
+
+
+def __timeBenchmark__(benchmarkFunction, repeat = DEFAULT_REPEAT, minimumTime = MINIMUM_SAMPLE_TIME):
+    """
+    Returns a dictionary with the fastest and median time, in seconds, of a
+    single call of the function.
+    """
+    number = __calibrate__(benchmarkFunction, minimumTime)
+    sampleTimes = sorted(sampleTime / number for sampleTime in timeit.Timer(benchmarkFunction).repeat(repeat, number))
+    return dict(
+        best = sampleTimes[0],
+        median = sampleTimes[len(sampleTimes) // 2],
+        number = number,
+        repeat = repeat
+    )
+
+
+def __metadata__():
+    """
+    Returns a dictionary that describes the machine and Python version the
+    benchmarks ran on.
+    """
+    return dict(
+        version = RESULTS_VERSION,
+        python = platform.python_version(),
+        implementation = platform.python_implementation(),
+        platform = platform.platform(),
+        machine = platform.machine()
+    )
+
+
+def __compareResults__(results, baseline, threshold = DEFAULT_THRESHOLD):
+    """
+    Returns a list of (name, baseline time, time, ratio, status) tuples for the
+    benchmarks that are in both results. The status is 'slower' if the best
+    time is more than threshold slower than the baseline, 'faster' if it is
+    more than threshold faster, and 'same' otherwise.
+    """
+    comparisons = []
+    for name in sorted(results['results'].keys()):
+        if name not in baseline['results']:
+            continue
+
+        baselineTime = baseline['results'][name]['best']
+        currentTime = results['results'][name]['best']
+        ratio = currentTime / baselineTime if baselineTime > 0 else float('inf')
+
+        if ratio > 1 + threshold:
+            status = 'slower'
+        elif ratio < 1 - threshold:
+            status = 'faster'
+        else:
+            status = 'same'
+        comparisons.append((name, baselineTime, currentTime, ratio, status))
+
+    return comparisons
+
+
+def __formatTime__(seconds):
+    """
+    Returns the time formatted with a unit that keeps it readable
+    """
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return '%.2f %s' % (seconds / scale, unit)
+    return '%.1f ns' % (seconds / 1e-9)
+
+
+def runBenchmarks(benchmarks, nameFilter = None, repeat = DEFAULT_REPEAT):
+    """
+    Times each benchmark whose name contains nameFilter, and returns the
+    results with their metadata.
+    """
+    results = dict()
+    for name, group, benchmarkFunction in benchmarks:
+        if nameFilter is None or nameFilter in name:
+            result = __timeBenchmark__(benchmarkFunction, repeat)
+            result['group'] = group
+            results[name] = result
+
+    return dict(metadata = __metadata__(), results = results)
+
+
+def main(benchmarks, description = None):
+    """
+    Runs the benchmarks from the command line. Returns the exit code, which
+    is 1 if a baseline was provided and any benchmark is slower than it.
+    """
+    parser = argparse.ArgumentParser(description = description)
+    parser.add_argument('--filter', default = None, help = 'Only run the benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type = int, default = DEFAULT_REPEAT, help = 'The number of samples to time for each benchmark')
+    parser.add_argument('--json', default = None, help = 'Write the results as JSON to this file, or - for stdout')
+    parser.add_argument('--baseline', default = None, help = 'Compare the results to a JSON file written by --json')
+    parser.add_argument('--threshold', type = float, default = DEFAULT_THRESHOLD, help = 'How much slower than the baseline is a regression (0.2 => 20%%)')
+    arguments = parser.parse_args()
+
+    results = runBenchmarks(benchmarks, arguments.filter, arguments.repeat)
+
+    if arguments.json == '-':
+        print(json.dumps(results, indent = 4, sort_keys = True))
+    else:
+        if arguments.json is not None:
+            with open(arguments.json, 'w') as jsonFile:
+                json.dump(results, jsonFile, indent = 4, sort_keys = True)
+
+        for name, group, benchmarkFunction in benchmarks:
+            if name in results['results']:
+                print('%-40s %12s' % (name, __formatTime__(results['results'][name]['best'])))
+
+    if arguments.baseline is None:
+        return 0
+
+    with open(arguments.baseline) as baselineFile:
+        baseline = json.load(baselineFile)
+
+    comparisons = __compareResults__(results, baseline, arguments.threshold)
+    output = sys.stderr if arguments.json == '-' else sys.stdout
+    output.write('\n%-40s %12s %12s %8s\n' % ('Benchmark', 'Baseline', 'Current', 'Ratio'))
+    for name, baselineTime, currentTime, ratio, status in comparisons:
+        output.write('%-40s %12s %12s %7.2fx %s\n' % (name, __formatTime__(baselineTime), __formatTime__(currentTime), ratio, '' if status == 'same' else status))
+
+    regressions = [comparison for comparison in comparisons if comparison[4] == 'slower']
+    output.write('\n%i of %i benchmarks are more than %i%% slower than the baseline\n' % (len(regressions), len(comparisons), arguments.threshold * 100))
+    return 1 if regressions else 0
@@ -0,0 +1,93 @@
+"""
+Measures how long it takes to import colorClass, and fails if it takes longer
+than the import time budget, or if it imports a slow optional module, like
+NumPy or asyncio, a colorClass submodule that should only be imported when
+it's first used, or builds the color table.
+Each import is timed in a new Python process, so nothing is already imported
+or cached. The fastest of several runs is compared to the budget, since
+slower runs are noise from the machine, not from colorClass.
+    python importBenchmark.py
+    python importBenchmark.py --budget 0.02 --runs 10
+"""
+import argparse, json, os, subprocess, sys
+
+# The most time, in seconds, that importing colorClass may take
+IMPORT_TIME_BUDGET = 0.04
+
+# The number of processes the import is timed in
+DEFAULT_RUNS = 7
+
+# Modules that are slow to import, and must only be imported once they're used
+DEFERRED_MODULES = ['numpy', 'asyncio', 'trollius', 'concurrent.futures', 'multiprocessing', 'inspect']
+
+# The directory that colorClass is imported from
+PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(os.path.realpath(os.path.abspath(__file__))))
+
+# Run in a new process. Prints the import time, the deferred modules and
+# colorClass submodules that were imported anyway, and whether the color table
+# was built.
+IMPORT_SCRIPT = '''
+import json, sys, time
+sys.path.insert(0, %r)
+startTime = time.time()
+import colorClass
+importTime = time.time() - startTime
+from colorClass import helpers
+print(json.dumps(dict(
+    importTime = importTime,
+    importedModules = [name for name in %r if name in sys.modules] + [
+        'colorClass.' + name for name in colorClass.__lazyModules__ if 'colorClass.' + name in sys.modules
+    ],
+    isTableBuilt = helpers.__hasSlot__(helpers.COLORS, '__colorValues__')
+)))
+'''
+
+
+def __timeImport__():
+    """
+    Imports colorClass in a new Python process, and returns its results
+    """
+    script = IMPORT_SCRIPT % (PACKAGE_DIRECTORY, DEFERRED_MODULES)
+    output = subprocess.check_output([sys.executable, '-c', script])
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def run(budget = IMPORT_TIME_BUDGET, runs = DEFAULT_RUNS):
+    """
+    Times the import in runs new processes, and returns a dictionary with the
+    results and whether the budget was met.
+    """
+    results = [__timeImport__() for runIndex in range(runs)]
+    importTimes = sorted(result['importTime'] for result in results)
+    importedModules = sorted(set(name for result in results for name in result['importedModules']))
+    isTableBuilt = any(result['isTableBuilt'] for result in results)
+
+    return dict(
+        budget = budget,
+        fastest = importTimes[0],
+        median = importTimes[len(importTimes) // 2],
+        importedModules = importedModules,
+        isTableBuilt = isTableBuilt,
+        passed = importTimes[0] <= budget and not importedModules and not isTableBuilt
+    )
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description = 'Checks the time it takes to import colorClass against a budget.')
+    parser.add_argument('--budget', type = float, default = IMPORT_TIME_BUDGET, help = 'The most time, in seconds, that the import may take')
+    parser.add_argument('--runs', type = int, default = DEFAULT_RUNS, help = 'The number of processes to time the import in')
+    parser.add_argument('--json', action = 'store_true', help = 'Print the results as JSON')
+    arguments = parser.parse_args()
+
+    results = run(arguments.budget, arguments.runs)
+    if arguments.json:
+        print(json.dumps(results, indent = 4, sort_keys = True))
+    else:
+        print('Import time: %.1f ms fastest, %.1f ms median (budget %.1f ms)' % (results['fastest'] * 1000, results['median'] * 1000, results['budget'] * 1000))
+        if results['importedModules']:
+            print('Imported on startup: %s' % ', '.join(results['importedModules']))
+        if results['isTableBuilt']:
+            print('The color table was built on startup')
+        print('PASSED' if results['passed'] else 'FAILED')
+
+    sys.exit(0 if results['passed'] else 1)
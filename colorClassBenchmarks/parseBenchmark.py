@@ -0,0 +1,95 @@
+"""
+Benchmarks for the parsing and conversion hot paths: creating a Color from
+each kind of input, reading its hex and RGB values, looking up COLORS,
+flattening nested inputs, converting single channel values, formatting
+batches of hex strings, and building gradients.
+    python parseBenchmark.py
+    python parseBenchmark.py --json results.json
+    python parseBenchmark.py --baseline results.json --threshold 0.1
+"""
+import os, sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(os.path.abspath(__file__)))))
+
+import benchmarkHelpers as bh
+
+from colorClass import Color, COLORS, FrozenColor, PARSE_CACHE, format_hex_many, iter_gradient
+from colorClass import helpers
+
+# Time the parser itself, not the cache
+PARSE_CACHE.resize(0)
+
+red = Color('red')
+
+# Colors to format in one batch
+frozenColors = [FrozenColor.fromInt(colorIndex * 0x10101 % 0x1000000) for colorIndex in range(1000)]
+
+# Inputs for each kind of value that the Color class accepts
+colorInputs = [
+    ('name', 'red'),
+    ('name_mixed_case', 'LightGoldenRodYellow'),
+    ('hex_3', '#FFF'),
+    ('hex_6', '#144AB6'),
+    ('hex_6_no_hash', '144ab6'),
+    ('int_tuple', (20, 74, 182)),
+    ('float_tuple', (0.08, 0.29, 0.71)),
+    ('dict', {'red': 255, 'blue': 96}),
+    ('comma_string', '20, 74, 182'),
+    ('nested_list', [[20], [74, [182]]])
+]
+
+nestedInputs = [
+    ('flat', (20, 74, 182)),
+    ('nested', [[[20, 74, 182]]]),
+    ('mixed', [[[[1, 2, 3]]], [[{'a': 1, 'b': 2}], [1, 2, 3]], 1, ['s'], set([1, 2, 3, 4]), 's'])
+]
+
+
+def __colorBenchmark__(value):
+    """
+    Returns a function that creates a Color from the value
+    """
+    return lambda: Color(value)
+
+
+def __argumentsBenchmark__(values):
+    """
+    Returns a function that creates a Color from the values as separate arguments
+    """
+    return lambda: Color(*values)
+
+
+def __flattenBenchmark__(value):
+    """
+    Returns a function that flattens the value
+    """
+    return lambda: helpers.__flatten__(value)
+
+
+benchmarks = (
+    [('Color(%s)' % inputName, 'construct', __colorBenchmark__(value)) for inputName, value in colorInputs] +
+    [
+        ('Color(int, int, int)', 'construct', __argumentsBenchmark__((20, 74, 182))),
+        ('Color.fromInt', 'construct', lambda: Color.fromInt(0x144AB6)),
+        ('FrozenColor(name)', 'construct', lambda: FrozenColor('red')),
+        ('Color.hex', 'access', lambda: red.hex),
+        ('Color.rgb', 'access', lambda: red.rgb),
+        ('Color.red', 'access', lambda: red.red),
+        ('COLORS.attribute', 'lookup', lambda: COLORS.red),
+        ('COLORS[mixed_case]', 'lookup', lambda: COLORS['lightGoldenRodYellow']),
+        ('COLORS.contains', 'lookup', lambda: 'LightGoldenRodYellow' in COLORS),
+        ('COLORS.get_names', 'lookup', lambda: COLORS.get_names('#FF0000'))
+    ] +
+    [('__flatten__(%s)' % inputName, 'flatten', __flattenBenchmark__(value)) for inputName, value in nestedInputs] +
+    [
+        ('__intToHex__', 'channel', lambda: helpers.__intToHex__(182)),
+        ('__hexToInt__', 'channel', lambda: helpers.__hexToInt__('b6')),
+        ('__getColorInt__(float)', 'channel', lambda: helpers.__getColorInt__(0.71)),
+        ('__getColorPercent__', 'channel', lambda: helpers.__getColorPercent__(182)),
+        ('format_hex_many(1000)', 'format', lambda: format_hex_many(frozenColors)),
+        ('iter_gradient(256)', 'gradient', lambda: list(iter_gradient(['navy', 'yellow', 'red'], 256)))
+    ]
+)
+
+
+if __name__ == '__main__':
+    sys.exit(bh.main(benchmarks, __doc__.strip().splitlines()[0]))
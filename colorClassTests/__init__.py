@@ -2,7 +2,7 @@ import inspect, os, sys
 import testHelpers as th
 
 # Make sure we import the colorClass that is in the same directory as this test directory
-sys.path.insert(0, os.path.realpath(os.path.abspath(os.path.dirname(os.path.dirname(__file__)))))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(os.path.abspath(__file__)))))
 
 # List of test modules
 # Each module should have these variables:
@@ -13,13 +13,18 @@ sys.path.insert(0, os.path.realpath(os.path.abspath(os.path.dirname(os.path.dirn
 #                           The expected result. This can be a function.
 #   * internalTests:    Optional tuple that contains *test module* functions to
 #                       execute, and their expected results
-modules = ['colorTest', 'helpersTest']
+# Tests for optional modules, like NumPy, are added with testHelpers.__optionalTests__
+modules = ['colorTest', 'colorArrayTest', 'colorAsyncTest', 'colorBlendTest', 'colorBufferTest', 'colorDifferenceTest', 'colorFormatTest', 'colorGradientTest', 'colorHistogramTest', 'colorPaletteTest', 'colorParallelTest', 'colorProfilerTest', 'colorQuantizeTest', 'colorSearchTest', 'colorSpacesTest', 'colorStreamTest', 'helpersTest']
+
+# Failed tests are collected, so that every module runs
+failures = []
 
 for unitTestModuleName in modules:
     try:
         unitTestModule = __import__(name = unitTestModuleName)
     except:
-        print 'Could not import the module %s!' % unitTestModule
+        print 'Could not import the module %s!' % unitTestModuleName
+        raise
 
     assert('tests' in dir(unitTestModule)), 'Could not find the tests variable in module %s!' % unitTestModuleName
     unitTests = unitTestModule.tests
@@ -40,10 +45,17 @@ for unitTestModuleName in modules:
         for testParams in testCases:
             unitTestCount += 1
             passed, params, result, expectedResult = th.__runTestFunction__(fx, testParams)
-            assert(passed is True), 'Function %s failed test %i!\n\tTest value: %s\n\tExpected result: %s\n\tActual result: %s' % (funcName, unitTestCount, params, expectedResult, result)
+            if passed is not True:
+                failures.append('Function %s failed test %i!\n\tTest value: %s\n\tExpected result: %s\n\tActual result: %s' % (funcName, unitTestCount, params, expectedResult, result))
             del passed, params, result, expectedResult
 
-    #         if result != testResult:
-    #             print 'Function %s failed validation with value %s!' % (funcName, testValue)
-    # else:
-    #     print 'The function %s could not be found!' % funcName
\ No newline at end of file
+    for internalTest, expectedResult in getattr(unitTestModule, 'internalTests', tuple()):
+        passed, result, expectedResult = th.__runInternalTest__(internalTest, expectedResult)
+        if passed is not True:
+            failures.append('Test %s in module %s failed!\n\tExpected result: %s\n\tActual result: %s' % (internalTest.__name__, unitTestModuleName, expectedResult, result))
+        del passed, result, expectedResult
+
+for failure in failures:
+    print failure
+
+assert(not failures), '%i tests failed!' % len(failures)
@@ -0,0 +1,58 @@
+"""
+Test cases for the colorClass colorArray module
+"""
+import testHelpers as th
+import colorClass
+import colorClass.colorArray as ca
+ColorArray = colorClass.ColorArray
+
+def hexStringsAreParsed():
+    return list(ColorArray(['#FFF', 'e6e6e6', '#80', 'red', '0, 0, 128', 'zz']).hex) == ['#FFFFFF', '#E6E6E6', '#800000', '#FF0000', '#000080', '#000000']
+
+def tuplesAreParsed():
+    return ColorArray([(0, 178, 0), (0.5, 0.5, 0.5), (300, 1.5, -1)]).rgb.tolist() == [[0, 178, 0], [127, 127, 127], [0, 1, 0]]
+
+def mixedValuesAreParsed():
+    return list(ColorArray([colorClass.Color('red'), 'blue', {'g': 128}]).hex) == ['#FF0000', '#0000FF', '#008000']
+
+def canIndexAndSlice():
+    colors = ColorArray(['red', 'green', 'blue'])
+    return colors[2].rgb == (0, 0, 255) and list(colors[1:].hex) == ['#008000', '#0000FF']
+
+def packedValuesRoundTrip():
+    colors = ColorArray(['#123456', '#FF0000'])
+    return ColorArray.fromPacked(colors.packed).rgb.tolist() == colors.rgb.tolist()
+
+def colorSpacesMatchColor():
+    colors = ColorArray(['#144AB6', '#FF0000', '#FFFFFF', '#000000'])
+    return all(
+        ColorArray.fromSpace(getattr(colors, space), space).rgb.tolist() == colors.rgb.tolist()
+        and ca.numpy.abs(getattr(colors, space)[0] - getattr(colors[0], space)).max() < 1e-9
+        for space in ('hsl', 'hsv', 'xyz', 'lab', 'lch')
+    )
+
+def storesAlphaOnlyWhenNeeded():
+    opaque = ColorArray(['#FFF', 'red', (0, 0, 128)])
+    values = ['#FF000080', '#0F08', 'rgba(0, 0, 255, 0.5)', 'blue', (1, 2, 3, 64)]
+    colors = ColorArray(values)
+    return (
+        opaque.rgb.flags.c_contiguous and opaque.rgba.shape == (3, 4) and opaque.alpha.tolist() == [255, 255, 255]
+        and colors.alpha.tolist() == [colorClass.Color(value).alpha for value in values]
+        and list(colors.hex) == [colorClass.Color(value).hex for value in values]
+        and colors[1].rgba == (0, 255, 0, 136) and list(colors[3:].hex) == ['#0000FF', '#01020340']
+    )
+
+testModule = ca
+
+tests = []
+
+# ColorArray needs NumPy, which is optional
+internalTests = th.__optionalTests__(ca.__requireNumpy__, (
+    (hexStringsAreParsed, True),
+    (tuplesAreParsed, True),
+    (mixedValuesAreParsed, True),
+    (canIndexAndSlice, True),
+    (packedValuesRoundTrip, True),
+    (colorSpacesMatchColor, True),
+    (storesAlphaOnlyWhenNeeded, True)
+))
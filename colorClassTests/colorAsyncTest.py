@@ -0,0 +1,73 @@
+"""
+Test cases for the colorClass colorAsync module
+"""
+import threading
+import testHelpers as th
+import colorClass
+import colorClass.colorAsync as cas
+import colorClass.colorParallel as cp
+
+def __newLoop__():
+    asyncio = cas.__requireAsyncio__()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    return asyncio, loop
+
+def runsRequestsOffTheLoop():
+    asyncio, loop = __newLoop__()
+    try:
+        with cas.ColorService(workers = 2) as service:
+            results = loop.run_until_complete(asyncio.gather(service.parse('rgba(255, 0, 0, 0.5)'), service.nearest_name('#FE0101')))
+    finally:
+        loop.close()
+    return results == [colorClass.FrozenColor('#FF000080'), 'Red']
+
+def sharesCancelsAndRefusesJobs():
+    asyncio, loop = __newLoop__()
+    gate = threading.Event()
+    calls = []
+    def slowDouble(value):
+        calls.append(value)
+        gate.wait()
+        return value * 2
+
+    try:
+        service = cas.ColorService(workers = 1, maxPending = 1)
+        first = service.__submit__(('slowDouble', 1), slowDouble, 1)
+        shared = service.__submit__(('slowDouble', 1), slowDouble, 1)
+        waiting = service.__submit__(('slowDouble', 2), slowDouble, 2)
+        refused = service.__submit__(('slowDouble', 3), slowDouble, 3)
+        isBounded = service.running == 1 and service.pending == 1 and isinstance(refused.exception(), asyncio.QueueFull)
+
+        waiting.cancel()
+        first.cancel()
+        loop.run_until_complete(asyncio.sleep(0))
+        isDropped = service.pending == 0
+        gate.set()
+        result = loop.run_until_complete(shared)
+        service.close()
+    finally:
+        gate.set()
+        loop.close()
+    return isBounded and isDropped and result == 2 and calls == [1] and first.cancelled()
+
+def rejectsBadLimits():
+    for workers, maxPending in ((0, 1), (1, -1), (1.5, 1)):
+        try:
+            cas.ColorService(workers, maxPending)
+            return False
+        except ValueError:
+            pass
+    return True
+
+testModule = cas
+
+tests = []
+
+# A ColorService needs asyncio and concurrent.futures, which are optional on
+# Python 2
+internalTests = th.__optionalTests__((cas.__requireAsyncio__, cp.__requireFutures__), (
+    (runsRequestsOffTheLoop, True),
+    (sharesCancelsAndRefusesJobs, True),
+    (rejectsBadLimits, True)
+))
@@ -0,0 +1,112 @@
+"""
+Test cases for the colorClass colorBlend module
+"""
+import testHelpers as th
+import colorClass
+import colorClass.colorArray as ca
+import colorClass.colorBlend as cb
+
+def colorsBlendIntoNewColors():
+    color = colorClass.Color('blue')
+    blended = color.blend('red', alpha = 0.5)
+    frozenBlended = colorClass.FrozenColor('white').blend(colorClass.Color('#144AB6'), 'multiply')
+    return (
+        blended.hex == '#800080' and color.hex == '#0000FF'
+        and isinstance(frozenBlended, colorClass.FrozenColor) and frozenBlended.hex == '#144AB6'
+    )
+
+def translucentColorsBlendByTheirAlpha():
+    blue = colorClass.Color('blue')
+    return (
+        blue.blend('#FF000000').hex == '#0000FF' and blue.blend('#FF000080').hex == '#80007F'
+        and blue.blend('#FF000080', alpha = 0.5).hex == blue.blend('red', alpha = 128 / 255.0 * 0.5).hex
+        and colorClass.FrozenColor('#0000FF00').blend('#FF000080').hex == '#FF000080'
+    )
+
+def rejectsBadModesAndAlphas():
+    for mode, alpha in (('dissolve', 1.0), ('over', 1.5), ('over', -0.1), ('over', 'half')):
+        try:
+            cb.__blendRGB__((0, 0, 0), (255, 255, 255), mode, alpha)
+            return False
+        except ValueError:
+            pass
+    return True
+
+def arraysMatchColors():
+    numpy = ca.numpy
+    backdrop = th.__randomPixels__((4, 5, 3))
+    source = th.__randomPixels__((4, 5, 3), seed = 1)
+    alphas = numpy.random.RandomState(2).rand(4, 5)
+    for mode in cb.BLEND_MODES:
+        blended = cb.blend_many(backdrop, source, mode, alphas)
+        expected = [
+            cb.__blendRGB__(tuple(backdropPixel), tuple(sourcePixel), mode, alpha)
+            for backdropPixel, sourcePixel, alpha in zip(backdrop.reshape(-1, 3).tolist(), source.reshape(-1, 3).tolist(), alphas.reshape(-1))
+        ]
+        if blended.shape != backdrop.shape or [tuple(pixel) for pixel in blended.reshape(-1, 3).tolist()] != expected:
+            return False
+    return True
+
+def alphaArraysMatchColors():
+    numpy = ca.numpy
+    backdrop = th.__randomPixels__((4, 5, 4))
+    source = th.__randomPixels__((20, 4), seed = 1)
+    alphas = numpy.random.RandomState(2).rand(20)
+    for mode in cb.BLEND_MODES:
+        blended = cb.blend_many(backdrop, ca.ColorArray(source), mode, alphas)
+        expected = [
+            cb.__blendRGBA__(tuple(backdropPixel), tuple(sourcePixel), mode, alpha)
+            for backdropPixel, sourcePixel, alpha in zip(backdrop.reshape(-1, 4).tolist(), source.tolist(), alphas)
+        ]
+        if blended.shape != backdrop.shape or [tuple(pixel) for pixel in blended.reshape(-1, 4).tolist()] != expected:
+            return False
+    return True
+
+def keepsTheBackdropAlpha():
+    pixels = ca.ColorArray(['blue', '#0000FF00'])
+    blended = cb.blend_many(pixels, '#FF000080')
+    colors = colorClass.ColorBuffer(['blue', '#0000FF00'], channels = 4)
+    cb.blend_many(colors, '#FF000080', out = colors)
+    return list(blended.hex) == ['#80007F', '#FF000080'] and [color.hex for color in colors] == ['#80007F', '#FF000080']
+
+def blendsOneColorInPlace():
+    pixels = ca.ColorArray(['white', 'gray'])
+    blended = cb.blend_many(pixels, 'red', 'multiply')
+    buffer = bytearray(b'\xff\xff\xff\x00\x00\x00')
+    cb.blend_many(buffer, (255, 0, 0), 'screen', out = buffer)
+    return (
+        isinstance(blended, ca.ColorArray) and list(blended.hex) == ['#FF0000', '#800000']
+        and cb.blend_many(pixels, 'red', out = pixels) is pixels and list(pixels.hex) == ['#FF0000', '#FF0000']
+        and buffer == bytearray(b'\xff\xff\xff\xff\x00\x00')
+    )
+
+testModule = cb
+
+tests = [
+    ('__blendRGB__',
+        (((255, 255, 255), (255, 0, 0), 'multiply'), (255, 0, 0)),
+        (((0, 0, 255), (255, 0, 0), 'over', 0.5), (128, 0, 128)),
+        (((0, 128, 255), (128, 128, 128), 'screen'), (128, 192, 255)),
+        (((64, 192, 0), (128, 128, 128), 'overlay'), (64, 192, 0)),
+        (((64, 192, 0), (128, 128, 128), 'darken'), (64, 128, 0)),
+        (((64, 192, 0), (128, 128, 128), 'lighten'), (128, 192, 128))
+    ),
+    ('__blendRGBA__',
+        (((0, 0, 255, 255), (255, 0, 0, 128), 'over'), (128, 0, 127, 255)),
+        (((0, 0, 255, 255), (255, 0, 0, 0), 'over'), (0, 0, 255, 255)),
+        (((0, 0, 255, 0), (255, 0, 0, 128), 'multiply'), (255, 0, 0, 128)),
+        (((0, 0, 0, 0), (0, 0, 0, 0), 'over'), (0, 0, 0, 0))
+    )
+]
+
+# blend_many needs NumPy, which is optional
+internalTests = (
+    (colorsBlendIntoNewColors, True),
+    (translucentColorsBlendByTheirAlpha, True),
+    (rejectsBadModesAndAlphas, True)
+) + th.__optionalTests__(ca.__requireNumpy__, (
+    (arraysMatchColors, True),
+    (alphaArraysMatchColors, True),
+    (keepsTheBackdropAlpha, True),
+    (blendsOneColorInPlace, True)
+))
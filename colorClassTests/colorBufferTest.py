@@ -0,0 +1,102 @@
+"""
+Test cases for the colorClass colorBuffer module
+"""
+import array, mmap
+import testHelpers as th
+import colorClass
+import colorClass.colorArray as ca
+import colorClass.colorBuffer as cb
+
+def readsColorsOnDemand():
+    colors = cb.ColorBuffer(b'\xff\x00\x00\x80\x00\x00\xff\xff', channels = 4)
+    return (
+        len(colors) == 2 and isinstance(colors[0], colorClass.FrozenColor) and colors[0].hex == '#FF000080'
+        and colors[-1] == colorClass.Color('blue') and [color.hex for color in colors] == ['#FF000080', '#0000FF']
+    )
+
+def sharesBytesWithTheSource():
+    pixels = bytearray(b'\x01\x02\x03' * 4)
+    colors = cb.ColorBuffer(pixels)
+    middle = colors[1:3]
+    middle[0] = 'red'
+    middle[-1] = colorClass.Color('#0000FF80')
+    return (
+        pixels == bytearray(b'\x01\x02\x03\xff\x00\x00\x00\x00\xff\x01\x02\x03')
+        and len(middle) == 2 and middle.view.tobytes() == b'\xff\x00\x00\x00\x00\xff'
+        and len(colors[3:1]) == 0
+    )
+
+def wrapsOtherBuffers():
+    arrayColors = cb.ColorBuffer(array.array('B', [1, 2, 3, 4, 5, 6]))
+    mapped = mmap.mmap(-1, 3)
+    mapped.write(b'\x10\x20\x30')
+    return (
+        [color.hex for color in arrayColors] == ['#010203', '#040506']
+        and cb.ColorBuffer(mapped)[0].hex == '#102030'
+        and cb.ColorBuffer(['red', '#0000FF80'], 4).tobytes() == b'\xff\x00\x00\xff\x00\x00\xff\x80'
+        and cb.ColorBuffer(2).tobytes() == b'\x00' * 6
+    )
+
+def writesIntoOtherBuffers():
+    pixels = array.array('B', [1, 2, 3, 4, 5, 6])
+    arrayColors = cb.ColorBuffer(pixels)
+    arrayColors[1:][0] = 'lime'
+    mapped = mmap.mmap(-1, 8)
+    mappedColors = cb.ColorBuffer(mapped, channels = 4)
+    mappedColors[1] = '#FF000080'
+    return pixels.tolist() == [1, 2, 3, 0, 255, 0] and mapped[:] == b'\x00' * 4 + b'\xff\x00\x00\x80'
+
+def rejectsSingleColors():
+    for color in ((255, 0, 0), (255, 0, 0, 128), 'red', u'#FF0000', colorClass.Color('red'), colorClass.FrozenColor('red')):
+        try:
+            cb.ColorBuffer(color)
+            return False
+        except ValueError:
+            pass
+    return len(cb.ColorBuffer([(255, 0, 0)])) == 1 and len(cb.ColorBuffer(((255, 0, 0), 'blue'))) == 2
+
+def rejectsBadBuffers():
+    colors = cb.ColorBuffer(b'\xff\x00\x00')
+    for makeError in (lambda: cb.ColorBuffer(b'\xff\x00'), lambda: cb.ColorBuffer(b'', 2), lambda: colors[::2], lambda: colors[1]):
+        try:
+            makeError()
+            return False
+        except (ValueError, IndexError):
+            pass
+    try:
+        colors[0] = 'blue'
+        return False
+    except TypeError:
+        return True
+
+def numpyArraysShareBytes():
+    numpy = ca.numpy
+    image = numpy.zeros((2, 2, 3), dtype = numpy.uint8)
+    colors = cb.ColorBuffer(image)
+    colors[3] = 'white'
+    colorArray = ca.ColorArray(colors)
+    colorArray.rgb[0] = (1, 2, 3)
+    return (
+        image[1, 1].tolist() == [255, 255, 255] and image[0, 0].tolist() == [1, 2, 3]
+        and colors[1:].pixels.shape == (3, 3) and ca.__pixelArray__(colors, 3)[0].tolist()[0] == [1, 2, 3]
+    )
+
+testModule = cb
+
+tests = [
+    ('__packColors__',
+        ((['red', '#0000FF80'], 4), bytearray(b'\xff\x00\x00\xff\x00\x00\xff\x80')),
+        ((['red'], 5), bytearray(b'\xff\x00\x00\xff\x00')),
+        (([(1, 2, 3)], 3), bytearray(b'\x01\x02\x03'))
+    )
+]
+
+# NumPy arrays need NumPy, which is optional
+internalTests = (
+    (readsColorsOnDemand, True),
+    (sharesBytesWithTheSource, True),
+    (wrapsOtherBuffers, True),
+    (writesIntoOtherBuffers, True),
+    (rejectsSingleColors, True),
+    (rejectsBadBuffers, True)
+) + th.__optionalTests__(ca.__requireNumpy__, ((numpyArraysShareBytes, True),))
@@ -0,0 +1,86 @@
+"""
+Test cases for the colorClass colorDifference module
+"""
+import testHelpers as th
+import colorClass
+import colorClass.colorArray as ca
+import colorClass.colorDifference as cd
+
+# Lab pairs and their CIEDE2000 delta-E, from Sharma, Wu and Dalal's test data
+SHARMA_PAIRS = (
+    ((50.0, 2.6772, -79.7751), (50.0, 0.0, -82.7485), 2.0425),
+    ((50.0, 0.0, 0.0), (50.0, -1.0, 2.0), 2.3669),
+    ((50.0, 2.49, -0.001), (50.0, -2.49, 0.0009), 7.1792),
+    ((50.0, 2.5, 0.0), (73.0, 25.0, -18.0), 27.1492),
+    ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+    ((22.7233, 20.0904, -46.694), (23.0331, 14.973, -42.5619), 2.0373)
+)
+
+def matchesPublishedCIEDE2000():
+    return all(round(cd.__ciede2000__(lab, otherLab), 4) == expected for lab, otherLab, expected in SHARMA_PAIRS)
+
+def colorsMeasureDifferences():
+    red = colorClass.Color('red')
+    return (
+        red.delta_e('red') == 0.0 and round(colorClass.Color('black').delta_e('white', 'cie76'), 4) == 100.0
+        and colorClass.FrozenColor('red').delta_e('orange', 'cie94') == red.delta_e(colorClass.FrozenColor('orange'), 'cie94')
+        and red.delta_e('blue', 'cie76') > red.delta_e('blue')
+    )
+
+def rejectsBadFormulas():
+    try:
+        colorClass.Color('red').delta_e('blue', 'cie2000')
+        return False
+    except ValueError:
+        return True
+
+def arraysMatchColors():
+    numpy = ca.numpy
+    colors = th.__randomPixels__((4, 5, 3))
+    others = th.__randomPixels__((20, 3), seed = 1)
+    for formula in cd.DELTA_E_FORMULAS:
+        distances = cd.delta_e_many(colors, others, formula)
+        expected = [cd.__deltaE__(tuple(color), tuple(other), formula) for color, other in zip(colors.reshape(-1, 3).tolist(), others.tolist())]
+        if distances.shape != (4, 5) or not numpy.allclose(distances.reshape(-1), expected):
+            return False
+    return True
+
+def buildsMatricesInChunks():
+    numpy = ca.numpy
+    colors = ca.ColorArray(['red', 'blue', 'navy', 'white', 'gray'])
+    chunkSize = cd.DELTA_E_CHUNK_SIZE
+    cd.DELTA_E_CHUNK_SIZE = 4
+    try:
+        distances = cd.delta_e_matrix(colors, ['red', 'black'])
+        pairwise = cd.delta_e_matrix(colors, formula = 'cie76')
+    finally:
+        cd.DELTA_E_CHUNK_SIZE = chunkSize
+    return (
+        distances.shape == (5, 2) and numpy.allclose(distances[:, 0], cd.delta_e_many(colors, 'red'))
+        and pairwise.shape == (5, 5) and numpy.allclose(pairwise, pairwise.T) and not pairwise.diagonal().any()
+    )
+
+testModule = cd
+
+tests = [
+    ('__deltaE__',
+        (((255, 0, 0), (255, 0, 0)), 0.0),
+        (((20, 74, 182), (20, 74, 182), 'cie94'), 0.0)
+    ),
+    ('__cie76__',
+        (((50, 0, 0), (53, 4, 0)), 5.0),
+    ),
+    ('__cie94__',
+        (((50, 0, 0), (53, 0, 0)), 3.0),
+    )
+]
+
+# delta_e_many and delta_e_matrix need NumPy, which is optional
+internalTests = (
+    (matchesPublishedCIEDE2000, True),
+    (colorsMeasureDifferences, True),
+    (rejectsBadFormulas, True)
+) + th.__optionalTests__(ca.__requireNumpy__, (
+    (arraysMatchColors, True),
+    (buildsMatricesInChunks, True)
+))
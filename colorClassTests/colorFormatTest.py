@@ -0,0 +1,57 @@
+"""
+Test cases for the colorClass colorFormat module
+"""
+import mmap
+import testHelpers as th
+import colorClass
+import colorClass.colorFormat as cf
+
+def writesIntoBuffers():
+    output = bytearray(b'.' * 20)
+    written = cf.format_hex_many(['red', (0, 0, 255)], output, 'csv', 2)
+    return written == 15 and output == bytearray(b'..#FF0000,#0000FF...')
+
+def writesIntoMemoryMaps():
+    output = mmap.mmap(-1, 16)
+    written = cf.format_hex_many(['red', 'blue'], output)
+    return written == 15 and output[:15] == b'#FF0000\n#0000FF'
+
+def rejectsSmallBuffers():
+    try:
+        cf.format_hex_many(['red', 'blue'], bytearray(14))
+    except ValueError:
+        return True
+    return False
+
+def formatsColorArrays():
+    colors = colorClass.ColorArray(['#144AB6', 'red', (1, 2, 3)])
+    output = bytearray(cf.hex_output_size(len(colors), 'json'))
+    cf.format_hex_many(colors, output, 'json')
+    return output == bytearray(b'["#144AB6","#FF0000","#010203"]') and cf.format_hex_many(colors[:1]) == '#144AB6'
+
+testModule = cf
+
+tests = [
+    ('format_hex_many',
+        (['red', colorClass.FrozenColor('#144AB6'), (1, 2, 3)], '#FF0000\n#144AB6\n#010203'),
+        ((['red', 'blue'], None, 'json'), '["#FF0000","#0000FF"]'),
+        ((['red', 'blue'], None, 'csv'), '#FF0000,#0000FF'),
+        (([], None, 'json'), '[]')
+    ),
+    ('hex_output_size',
+        ((2, 'json'), 21),
+        ((2, 'lines'), 15),
+        ((0, 'lines'), 0)
+    ),
+    ('__formatHexBytes__',
+        ((cf.array.array('l', [0xFF0000, 0x000080]), 'json'), b'["#FF0000","#000080"]'),
+        ((cf.array.array('l'), 'lines'), b'')
+    )
+]
+
+# ColorArray needs NumPy, which is optional
+internalTests = (
+    (writesIntoBuffers, True),
+    (writesIntoMemoryMaps, True),
+    (rejectsSmallBuffers, True)
+) + th.__optionalTests__(colorClass.colorArray.__requireNumpy__, ((formatsColorArrays, True),))
@@ -0,0 +1,72 @@
+"""
+Test cases for the colorClass colorGradient module
+"""
+import testHelpers as th
+import colorClass
+import colorClass.colorArray as ca
+import colorClass.colorGradient as cg
+
+def __hexValues__(colors):
+    return [color.hex for color in colors]
+
+def interpolatesBetweenStops():
+    return (
+        __hexValues__(cg.iter_gradient(['red', 'blue'], 3)) == ['#FF0000', '#800080', '#0000FF']
+        and __hexValues__(cg.iter_gradient(['black', 'white'], 3, 'linear')) == ['#000000', '#BCBCBC', '#FFFFFF']
+        and __hexValues__(cg.iter_gradient(['black', 'white'], 3, 'lab')) == ['#000000', '#777777', '#FFFFFF']
+    )
+
+def placesStopsAtTheirPositions():
+    gradient = cg.iter_gradient([(0.25, 'red'), (0.5, 'lime'), (0.5, 'blue')], 5)
+    return __hexValues__(gradient) == ['#FF0000', '#FF0000', '#0000FF', '#0000FF', '#0000FF']
+
+def appliesEasing():
+    easeIn = __hexValues__(cg.iter_gradient(['black', 'white'], 3, easing = 'ease_in'))
+    squared = __hexValues__(cg.iter_gradient(['black', 'white'], 3, easing = lambda position: position ** 2))
+    return easeIn == ['#000000', '#202020', '#FFFFFF'] and squared == ['#000000', '#404040', '#FFFFFF']
+
+def returnsColorsOrFrozenColors():
+    colors = list(cg.iter_gradient(['red', 'blue'], 2))
+    frozenColors = list(cg.iter_gradient(['red', 'blue'], 2, frozen = True))
+    return isinstance(colors[0], colorClass.Color) and isinstance(frozenColors[0], colorClass.FrozenColor) and frozenColors[1].hex == '#0000FF'
+
+def rejectsBadStops():
+    for stops in ([], [(0.5, 'red'), (0.25, 'blue')], [(0, 'red'), (2, 'blue')]):
+        try:
+            cg.iter_gradient(stops, 3)
+            return False
+        except ValueError:
+            pass
+    return True
+
+def arrayMatchesIterator():
+    stops = [(0.1, 'navy'), (0.5, 'yellow'), (0.5, '#123456'), (0.9, 'red')]
+    return all(
+        list(cg.gradient_array(stops, 101, space, easing).hex) == __hexValues__(cg.iter_gradient(stops, 101, space, easing))
+        for space in ('rgb', 'linear', 'lab')
+        for easing in ('linear', 'ease_in_out')
+    )
+
+testModule = cg
+
+tests = [
+    ('__parseStops__',
+        (['red', 'blue'], ([0.0, 1.0], [(255, 0, 0), (0, 0, 255)])),
+        ([(0, 'red'), (0.25, (0, 0, 255))], ([0.0, 0.25], [(255, 0, 0), (0, 0, 255)])),
+        ([(0, 0, 255)], ([0.0], [(0, 0, 255)]))
+    ),
+    ('__ease__',
+        ((None, 0.3), 0.3),
+        ((cg.__getEasingTable__('ease_in_out'), 0.5), 0.5),
+        ((cg.__getEasingTable__('ease_out'), 1.0), 1.0)
+    )
+]
+
+# gradient_array needs NumPy, which is optional
+internalTests = (
+    (interpolatesBetweenStops, True),
+    (placesStopsAtTheirPositions, True),
+    (appliesEasing, True),
+    (returnsColorsOrFrozenColors, True),
+    (rejectsBadStops, True)
+) + th.__optionalTests__(ca.__requireNumpy__, ((arrayMatchesIterator, True),))
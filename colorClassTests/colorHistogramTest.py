@@ -0,0 +1,55 @@
+"""
+Test cases for the colorClass colorHistogram module
+"""
+import array
+import testHelpers as th
+import colorClass
+import colorClass.colorArray as ca
+import colorClass.colorHistogram as ch
+
+# A 3 x 2 image, with an alpha channel
+PIXELS = b'\xff\x00\x00\x80' * 3 + b'\x00\x00\xff\xff' * 2 + b'\x01\x02\x03\x00'
+
+def countsUniqueColors():
+    colors, counts = ch.color_histogram(PIXELS, 3, 2, channels = 4)
+    return (
+        all(isinstance(color, colorClass.Color) for color in colors)
+        and [color.hex for color in colors] == ['#FF0000', '#0000FF', '#010203'] and counts == [3, 2, 1]
+    )
+
+def keepsTheTopColors():
+    topColors = ch.color_histogram(array.array('B', PIXELS), 3, 2, channels = 4, top = 2, asColors = False)
+    tiedColors = ch.color_histogram(b'\x00\x00\x02\x00\x00\x01', 2, 1, top = 1, asColors = False)
+    return topColors == ([0xFF0000, 0x0000FF], [3, 2]) and tiedColors == ([0x000001], [1])
+
+def bytesMatchArrays():
+    pixels = th.__randomPixels__((20, 30, 3), maxValue = 4) * 60
+    for top in (None, 0, 1, 10, 100):
+        if ch.__histogramBytes__(pixels.tobytes(), 30, 20, 3, top) != ch.__histogramArray__(pixels, 30, 20, 3, top):
+            return False
+    return True
+
+def rejectsBadSizes():
+    for width, height, channels, top in ((3, 3, 4, None), (-3, -2, 4, None), (3, 2, 2, None), (3, 2, 4, -1)):
+        try:
+            ch.color_histogram(PIXELS, width, height, channels, top)
+            return False
+        except ValueError:
+            pass
+    return True
+
+testModule = ch
+
+tests = [
+    ('__histogramBytes__',
+        ((b'\xff\x00\x00\x00\x00\xff\xff\x00\x00', 3, 1, 3, None), ([0xFF0000, 0x0000FF], [2, 1])),
+        ((b'', 0, 0, 3, None), ([], []))
+    )
+]
+
+# Arrays of pixels need NumPy, which is optional
+internalTests = (
+    (countsUniqueColors, True),
+    (keepsTheTopColors, True),
+    (rejectsBadSizes, True)
+) + th.__optionalTests__(ca.__requireNumpy__, ((bytesMatchArrays, True),))
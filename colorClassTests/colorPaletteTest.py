@@ -0,0 +1,79 @@
+"""
+Test cases for the colorClass colorPalette module
+"""
+import gc, os, tempfile
+import testHelpers as th
+import colorClass
+import colorClass.colorPalette as cp
+
+def __writeAndLoad__(colors):
+    fileDescriptor, path = tempfile.mkstemp(suffix = '.palette')
+    os.close(fileDescriptor)
+    cp.write_palette(path, colors)
+    palette = cp.load_palette(path)
+    os.remove(path)
+    return palette
+
+def canLoadNamedColors():
+    palette = __writeAndLoad__({'Dark': '#111', 'light': (238, 238, 238), 'Blue': 'blue'})
+    return (
+        len(palette) == 3
+        and [palette.name(index) for index in range(3)] == ['Blue', 'Dark', 'light']
+        and [color.hex for color in palette] == ['#0000FF', '#111111', '#EEEEEE']
+        and palette['DARK'] == colorClass.Color('#111')
+        and 'Light' in palette and 'red' not in palette
+        and palette.get('red') is None
+    )
+
+def canLoadColorsWithoutNames():
+    palette = __writeAndLoad__(['#FFF', (1, 2, 3), 'red'])
+    return not palette.hasNames and palette.name(0) is None and [color.hex for color in palette] == ['#FFFFFF', '#010203', '#FF0000']
+
+def canSlicePalettes():
+    palette = __writeAndLoad__(colorClass.COLORS)
+    reversedPalette = palette[::-1]
+    return (
+        len(palette) == len(colorClass.COLORS.__colorValues__)
+        and list(palette[10:20:3]) == list(palette)[10:20:3]
+        and [reversedPalette.name(index) for index in range(len(reversedPalette))] == [palette.name(index) for index in range(len(palette))][::-1]
+        and len(palette[5:2]) == 0
+    )
+
+def cannotLoadOtherFiles():
+    try:
+        cp.load_palette(__file__)
+    except ValueError:
+        return True
+    return False
+
+def canRegisterColors():
+    palette = __writeAndLoad__({'paletteTestGreen': '#00B201', 'red': '#FE0000'})
+    return palette.register() == 1 and colorClass.COLORS.paletteTestGreen == '#00B201' and colorClass.COLORS.red == '#FF0000'
+
+def colorArraysOutliveThePalette():
+    palette = __writeAndLoad__(['red', '#123456', 'blue'])
+    colors = palette[1:].toColorArray()
+    palette.close()
+    isReadable = list(colors.hex) == ['#123456', '#0000FF']
+    del colors
+    gc.collect()
+
+    otherPalette = __writeAndLoad__(['red'])
+    otherPalette.close()
+    try:
+        otherPalette[0]
+    except ValueError:
+        return isReadable
+    return False
+
+testModule = cp
+
+tests = []
+
+internalTests = (
+    (canLoadNamedColors, True),
+    (canLoadColorsWithoutNames, True),
+    (canSlicePalettes, True),
+    (cannotLoadOtherFiles, True),
+    (canRegisterColors, True)
+) + th.__optionalTests__(colorClass.colorArray.__requireNumpy__, ((colorArraysOutliveThePalette, True),))
@@ -0,0 +1,35 @@
+"""
+Test cases for the colorClass colorParallel module
+"""
+import colorClass
+import colorClass.colorParallel as cp
+
+values = ['red', '#FFF', (0, 0, 128), {'red': 255, 'blue': 96}, '10, 20, 30'] * 4
+
+def keepsTheOrderOfValues():
+    return [str(color) for color in cp.parse_many(values, workers = 2, chunksize = 3)] == [str(colorClass.Color(value)) for value in values]
+
+def parsesInThisProcessWithOneWorker():
+    return cp.parse_many(values, workers = 1) == cp.parse_many(values, workers = 2, chunksize = 1)
+
+def canReturnPackedValues():
+    return list(cp.parse_many(['red', '#000080'], workers = 1, packed = True)) == [0xFF0000, 0x000080]
+
+def survivesChunksThatCannotBePickled():
+    return [str(color) for color in cp.parse_many(['red', lambda: None, 'blue', '#FFF'], workers = 2, chunksize = 2)] == ['#FF0000', '#000000', '#0000FF', '#FFFFFF']
+
+testModule = cp
+
+tests = [
+    ('__parseChunk__',
+        (['red', (0, 0, 128)], cp.array.array('l', [0xFF0000, 0x000080])),
+        ([], cp.array.array('l'))
+    )
+]
+
+internalTests = (
+    (keepsTheOrderOfValues, True),
+    (parsesInThisProcessWithOneWorker, True),
+    (canReturnPackedValues, True),
+    (survivesChunksThatCannotBePickled, True)
+)
@@ -0,0 +1,100 @@
+"""
+Test cases for the colorClass colorProfiler module
+"""
+import threading
+import colorClass
+import colorClass.colorProfiler as cp
+from colorClass import helpers
+
+def countsCallsAndInputTypes():
+    cp.PROFILER.reset()
+    with cp.PROFILER:
+        colorClass.Color('#144AB6')
+        colorClass.Color([[1], [2, [3]]])
+    stats = cp.PROFILER.stats()['__rgbaFromValue__']
+    return stats['calls'] == 2 and stats['types'] == {'str': 1, 'list': 1} and stats['time'] > 0
+
+def countsFallbacksToBlack():
+    cp.PROFILER.reset()
+    with cp.PROFILER:
+        colorClass.Color('#FFF')
+        colorClass.Color('notAColor')
+    return cp.PROFILER.stats()['__fallbackRGB__']['calls'] == 1
+
+def countsColorLookups():
+    cp.PROFILER.reset()
+    with cp.PROFILER:
+        colorClass.COLORS['Red']
+    return cp.PROFILER.stats()['COLORS.__getitem__']['calls'] == 1
+
+def restoresFunctionsWhenDisabled():
+    originalFunction = helpers.__rgbaFromValue__
+    cp.PROFILER.enable()
+    isReplaced = helpers.__rgbaFromValue__ is not originalFunction
+    cp.PROFILER.disable()
+    cp.PROFILER.reset()
+    colorClass.Color('red')
+    return isReplaced and helpers.__rgbaFromValue__ is originalFunction and cp.PROFILER.stats() == {} and not cp.PROFILER.isEnabled
+
+def profilesTheFunctionsThatParse():
+    cp.PROFILER.reset()
+    with cp.PROFILER:
+        colorClass.Color('rgba(1, 2, 3, 0.5)').hex
+        colorClass.Color((1, 2, 3, 0.5))
+    stats = cp.PROFILER.stats()
+    return all(stats.get(functionName, {}).get('calls') for functionName in ['__parseValue__', '__rgbaFromString__', '__rgbaFromFunctionArguments__', '__rgbaFromValues__', '__toColorInt__', '__toAlphaInt__', '__rgbaToHex__'])
+
+def profilesSettingChannels():
+    color = colorClass.Color('#144AB6')
+    cp.PROFILER.reset()
+    with cp.PROFILER:
+        color.red = 10
+        color.green = 20
+        color.hex
+    stats = cp.PROFILER.stats()
+    return stats['__getColorInt__']['calls'] == 2 and stats['__getColorInt__']['types'] == {'int': 2} and stats['__rgbToHex__']['calls'] == 1 and color.hex == '#0A14B6'
+
+def restoresFunctionsAcrossThreads():
+    originalFunctions = [getattr(helpers, functionName) for functionName in cp.PROFILED_FUNCTIONS]
+    def toggle():
+        for toggleIndex in range(50):
+            cp.PROFILER.enable()
+            colorClass.Color('#144AB6')
+            cp.PROFILER.disable()
+    threads = [threading.Thread(target = toggle) for threadIndex in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    cp.PROFILER.reset()
+    return [getattr(helpers, functionName) for functionName in cp.PROFILED_FUNCTIONS] == originalFunctions and not cp.PROFILER.isEnabled
+
+def reportsEachFunction():
+    cp.PROFILER.reset()
+    with cp.PROFILER:
+        colorClass.Color('#144AB6').hex
+    report = cp.PROFILER.report()
+    return '__rgbaFromValue__' in report and '__rgbaToHex__' in report
+
+testModule = cp
+
+tests = [
+    ('__inputType__',
+        (('red',), 'str'),
+        ((('red',),), 'str'),
+        (((1, 2, 3),), 'tuple'),
+        ((1, 2, 3), 'arguments'),
+        (tuple(), 'none')
+    )
+]
+
+internalTests = (
+    (countsCallsAndInputTypes, True),
+    (countsFallbacksToBlack, True),
+    (countsColorLookups, True),
+    (restoresFunctionsWhenDisabled, True),
+    (profilesTheFunctionsThatParse, True),
+    (profilesSettingChannels, True),
+    (restoresFunctionsAcrossThreads, True),
+    (reportsEachFunction, True)
+)
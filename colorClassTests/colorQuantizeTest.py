@@ -0,0 +1,71 @@
+"""
+Test cases for the colorClass colorQuantize module
+"""
+import testHelpers as th
+import colorClass
+import colorClass.colorArray as ca
+import colorClass.colorQuantize as cq
+
+def __imagePixels__():
+    numpy = ca.numpy
+    image = numpy.zeros((4, 6, 3), dtype = numpy.uint8)
+    image[:, :4] = (250, 10, 10)
+    image[:, 4:] = (10, 10, 240)
+    image[0, 0] = (255, 0, 0)
+    return image
+
+def keepsTheImageShape():
+    palette, indexes = cq.quantize(__imagePixels__(), colors = 2)
+    return (
+        [color.hex for color in palette] == ['#FA0909', '#0A0AF0']
+        and indexes.shape == (4, 6)
+        and indexes[:, :4].tolist() == [[0] * 4] * 4
+        and indexes[:, 4:].tolist() == [[1] * 2] * 4
+    )
+
+def sortsPaletteByUse():
+    palette, indexes = cq.quantize(b'\x00\x00\xff' + b'\xff\x00\x00' * 3, colors = 4)
+    return [color.hex for color in palette] == ['#FF0000', '#0000FF'] and indexes.tolist() == [1, 0, 0, 0]
+
+def readsBuffersWithAlpha():
+    palette, indexes = cq.quantize(bytearray(b'\x01\x02\x03\x80' * 5), colors = 4, channels = 4)
+    return [color.hex for color in palette] == ['#010203'] and indexes.tolist() == [0] * 5
+
+def kMeansMatchesClusters():
+    palette, indexes = cq.quantize(__imagePixels__(), colors = 2, method = 'kmeans', seed = 1)
+    return sorted(color.hex for color in palette) == ['#0A0AF0', '#FA0909'] and len(set(indexes[:, 4:].ravel().tolist())) == 1
+
+def samplingMatchesEveryPixel():
+    palette, indexes = cq.quantize(__imagePixels__().reshape(-1, 3), colors = 2, sample = 8, seed = 1)
+    return len(palette) == 2 and indexes.shape == (24,) and indexes[0] != indexes[-1]
+
+def rejectsBadPaletteSizes():
+    try:
+        cq.quantize(b'\x00\x00\x00', colors = 0)
+    except ValueError:
+        return True
+    return False
+
+def rejectsBadSamples():
+    for sample in (0, -1, 2.5, '8'):
+        try:
+            cq.quantize(b'\x00\x00\x00' * 4, colors = 2, sample = sample)
+            return False
+        except ValueError:
+            pass
+    return len(cq.quantize(b'\x00\x00\x00' * 4, colors = 2, sample = 1)[0]) == 1
+
+testModule = cq
+
+tests = []
+
+# Quantizing needs NumPy, which is optional
+internalTests = th.__optionalTests__(ca.__requireNumpy__, (
+    (keepsTheImageShape, True),
+    (sortsPaletteByUse, True),
+    (readsBuffersWithAlpha, True),
+    (kMeansMatchesClusters, True),
+    (samplingMatchesEveryPixel, True),
+    (rejectsBadPaletteSizes, True),
+    (rejectsBadSamples, True)
+))
@@ -0,0 +1,47 @@
+"""
+Test cases for the colorClass colorSearch module
+"""
+import colorClass
+import colorClass.colorSearch as cs
+Color = colorClass.Color
+FrozenColor = colorClass.FrozenColor
+ColorIndex = colorClass.ColorIndex
+
+def colorsHaveNearestNames():
+    return Color('#FE0101').nearest_name() == 'Red' and FrozenColor(0, 0, 250).nearest_name(metric = 'lab') == 'Blue'
+
+def canUseNamedPalette():
+    palette = {'dark': '#111', 'light': '#EEE'}
+    return Color('#333').nearest_name(palette) == 'dark' and Color('#CCC').nearest_name(ColorIndex(palette, 'weighted')) == 'light'
+
+def canUseListPalette():
+    return ColorIndex(['#111', '#EEE'], 'lab').nearest_many(['#333', '#CCC']) == ['#111', '#EEE']
+
+def emptyPaletteHasNoNearest():
+    return ColorIndex([]).nearest('red') is None
+
+def treeMatchesLinearSearch():
+    palette = [(red, green, blue) for red in range(0, 256, 51) for green in range(0, 256, 85) for blue in range(0, 256, 64)]
+    index = ColorIndex(palette)
+    for rgb in [(12, 200, 7), (255, 255, 255), (100, 100, 100), (1, 130, 250)]:
+        closest = min(palette, key = lambda item: sum((item[channel] - rgb[channel]) ** 2 for channel in range(3)))
+        if index.nearest(rgb) != closest:
+            return False
+    return True
+
+testModule = cs
+
+tests = [
+    ('nearest_names',
+        (['#FE0101', (0, 0, 250)], ['Red', 'Blue']),
+        (['#00FFFE'], ['Aqua'])
+    )
+]
+
+internalTests = (
+    (colorsHaveNearestNames, True),
+    (canUseNamedPalette, True),
+    (canUseListPalette, True),
+    (emptyPaletteHasNoNearest, True),
+    (treeMatchesLinearSearch, True)
+)
@@ -0,0 +1,78 @@
+"""
+Test cases for the colorClass colorSpaces module
+"""
+import random
+import colorClass
+import colorClass.colorSpaces as sp
+
+def __randomColors__(count = 2000):
+    randomGenerator = random.Random(255)
+    return [tuple(randomGenerator.randint(0, 255) for channel in range(3)) for colorIndex in range(count)]
+
+def everySpaceRoundTrips():
+    return all(
+        toRGB(fromRGB(rgb)) == rgb
+        for fromRGB, toRGB in sp.COLOR_SPACES.values()
+        for rgb in __randomColors__()
+    )
+
+def labMatchesReferenceValues():
+    return all(
+        max(abs(value - expected) for value, expected in zip(sp.__rgbToLab__(rgb), expectedLab)) < 0.01
+        for rgb, expectedLab in [
+            ((255, 255, 255), (100.0, 0.0, 0.0)),
+            ((255, 0, 0), (53.24, 80.09, 67.20)),
+            ((0, 0, 255), (32.30, 79.19, -107.86))
+        ]
+    )
+
+def canSetColorSpaces():
+    color = colorClass.Color()
+    color.hsl = (120, 1, 0.25)
+    isGreen = color.hex == '#008000'
+    color.lab = colorClass.Color('#144AB6').lab
+    return isGreen and color.hex == '#144AB6'
+
+def frozenColorsHaveColorSpaces():
+    return colorClass.FrozenColor('#144AB6').lch == colorClass.Color('#144AB6').lch
+
+testModule = sp
+
+tests = [
+    ('__rgbToHSL__',
+        ((255, 0, 0), (0.0, 1.0, 0.5)),
+        ((0, 0, 0), (0.0, 0.0, 0.0)),
+        ((None, 255, None), (120.0, 1.0, 0.5))
+    ),
+    ('__hslToRGB__',
+        ((120, 1, 0.25), (0, 128, 0)),
+        ((480, 1, 0.5), (0, 255, 0)),
+        ((0, 0, 1), (255, 255, 255))
+    ),
+    ('__rgbToHSV__',
+        ((255, 0, 0), (0.0, 1.0, 1.0)),
+        ((0, 0, 255), (240.0, 1.0, 1.0))
+    ),
+    ('__hsvToRGB__',
+        ((240, 1, 1), (0, 0, 255)),
+        ((60, 1, 0.5), (128, 128, 0))
+    ),
+    ('__delinearize__',
+        (0.0, 0),
+        (1.0, 255),
+        (-0.5, 0),
+        (2.0, 255),
+        (sp.SRGB_TO_LINEAR[128], 128)
+    ),
+    ('__xyzToRGB__',
+        (sp.REFERENCE_WHITE, (255, 255, 255)),
+        ((0, 0, 0), (0, 0, 0))
+    )
+]
+
+internalTests = (
+    (everySpaceRoundTrips, True),
+    (labMatchesReferenceValues, True),
+    (canSetColorSpaces, True),
+    (frozenColorsHaveColorSpaces, True)
+)
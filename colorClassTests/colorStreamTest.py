@@ -0,0 +1,52 @@
+"""
+Test cases for the colorClass colorStream module
+"""
+import io
+import colorClass
+import colorClass.colorStream as cs
+
+def __findColors__(text, chunkSize = cs.DEFAULT_CHUNK_SIZE):
+    return [(offset, token, str(color)) for offset, token, color in colorClass.iter_colors(io.StringIO(text), chunkSize)]
+
+def findsEveryTokenType():
+    return __findColors__(u'a { color: Red; border: 1px solid #FFF; background: rgba(0, 0, 255, .5) }') == [
+        (11, u'Red', '#FF0000'),
+        (34, u'#FFF', '#FFFFFF'),
+        (52, u'rgba(0, 0, 255, .5)', '#0000FF80')
+    ]
+
+def findsHexWithAlpha():
+    return __findColors__(u'fill: #0000FF80; stroke: #F008') == [(6, u'#0000FF80', '#0000FF80'), (25, u'#F008', '#FF000088')]
+
+def ignoresPartsOfWords():
+    return __findColors__(u'.dark-red, .reddish, #tan, #12345, redblue') == []
+
+def findsTokensAcrossChunks():
+    text = u''.join(u'%s; #123456; rgb(1, 2, 3); lightgoldenrodyellow\n' % ('x' * fill) for fill in range(400))
+    return __findColors__(text, 1) == __findColors__(text, len(text) + 1) and len(__findColors__(text, 1)) == 1200
+
+def findsPaddedFunctionsAcrossChunks():
+    padding = u' ' * cs.MAX_FUNCTION_PADDING
+    text = u''.join(u'%s; rgb(%s1, 2, 3%s);\n' % ('x' * fill, padding, padding) for fill in range(400))
+    return __findColors__(text, 1) == __findColors__(text, len(text) + 1) and len(__findColors__(text, 1)) == 400
+
+def ignoresFunctionsWithTooMuchPadding():
+    text = u'x' * 1000 + u'color: rgb(' + u' ' * 200 + u'1, 2, 3); fill: red'
+    return [offset for offset, token, color in __findColors__(text, 1)] == [offset for offset, token, color in __findColors__(text, 10 ** 7)] == [1227]
+
+def readsBinaryStreams():
+    return [token for offset, token, color in colorClass.iter_colors(io.BytesIO(b'fill="#00B200" stroke="blue"'))] == ['#00B200', 'blue']
+
+testModule = cs
+
+tests = []
+
+internalTests = (
+    (findsEveryTokenType, True),
+    (findsHexWithAlpha, True),
+    (ignoresPartsOfWords, True),
+    (findsTokensAcrossChunks, True),
+    (findsPaddedFunctionsAcrossChunks, True),
+    (ignoresFunctionsWithTooMuchPadding, True),
+    (readsBinaryStreams, True)
+)
@@ -1,6 +1,7 @@
 import colorClass
 Color = colorClass.Color
 COLORS = colorClass.COLORS
+FrozenColor = colorClass.FrozenColor
 
 def objStrEquals(obj, strValue):
     return str(obj) == strValue
@@ -20,6 +21,108 @@ def canChangeRGBColor():
     red.rgb = {'red': 255, 'blue': 96}
     return red.rgb == (255, 0, 96)
 
+def canFreezeColor():
+    red = Color(COLORS.RED)
+    return FrozenColor(red).rgb == (255, 0, 0) and Color(FrozenColor(red)).rgb == (255, 0, 0)
+
+def frozenColorIsHashable():
+    return len(set([FrozenColor('#F00'), FrozenColor(255, 0, 0), FrozenColor(COLORS.RED)])) == 1
+
+def cannotChangeFrozenColor():
+    red = FrozenColor(COLORS.RED)
+    try:
+        red.blue = 100
+    except AttributeError:
+        return red.rgb == (255, 0, 0)
+    return False
+
+def canLookupColorNames():
+    return COLORS.get_names('#00FFFF') == ['Aqua', 'Cyan'] and COLORS.get_names(Color(COLORS.RED)) == ['Red'] and COLORS.get_names((1, 2, 3)) == []
+
+def cannotOverwriteColorInAnotherCase():
+    try:
+        COLORS['RED'] = '#000000'
+    except KeyError:
+        return Color('red').rgb == (255, 0, 0)
+    return False
+
+def colorTableIsBuiltOnFirstUse():
+    colorTable = colorClass.helpers.__const__()
+    isBuiltEarly = colorClass.helpers.__hasSlot__(colorTable, '__colorValues__')
+    return not isBuiltEarly and colorTable.red == '#FF0000' and colorClass.helpers.__hasSlot__(colorTable, '__colorValues__')
+
+def packageNamesMatchTheirModules():
+    for moduleName in colorClass.__lazyModules__:
+        module = getattr(colorClass, moduleName)
+        for name in getattr(module, '__all__', ()):
+            if name.startswith('__'):
+                continue
+            if colorClass.__lazyNames__.get(name) != moduleName or name not in colorClass.__all__ or getattr(colorClass, name) is not getattr(module, name):
+                return False
+    return set(colorClass.__lazyNames__.values()) <= set(colorClass.__lazyModules__)
+
+def namedColorsAreShared():
+    red = FrozenColor('red')
+    return red is FrozenColor(COLORS.RED) and red is FrozenColor(' RED ') and FrozenColor('#144AB6') is not FrozenColor('#144AB6')
+
+def registeredColorsAreShared():
+    COLORS['sharedTestColor'] = (1, 2, 3)
+    return FrozenColor('sharedTestColor') is FrozenColor('sharedtestcolor') and FrozenColor('sharedTestColor').rgb == (1, 2, 3)
+
+def registeredColorsKeepTheirAlpha():
+    COLORS['translucentTestColor'] = '#FF000080'
+    COLORS.translucentTestTuple = (0, 0, 255, 0.25)
+    return (COLORS['translucentTestColor'] == '#FF000080' and COLORS.translucentTestTuple == '#0000FF40'
+        and Color('translucentTestColor').alpha == 128 and Color(' TranslucentTestColor ').rgba == (255, 0, 0, 128)
+        and FrozenColor('translucentTestColor').alpha == 128 and FrozenColor('translucentTestTuple').rgba == (0, 0, 255, 64)
+        and COLORS.get_names((255, 0, 0, 128)) == ['translucentTestColor'] and COLORS.get_names('red') == ['Red'])
+
+def namedColorsCreateNewColors():
+    red = Color('red')
+    red.blue = 96
+    return red is not Color('red') and Color('red').rgb == (255, 0, 0) and FrozenColor('red').rgb == (255, 0, 0)
+
+def canCreateColorFromInt():
+    color = Color.fromInt(0x144AB6)
+    color.red = 0
+    return color.rgb == (0, 74, 182) and Color.fromInt(0xFF0000).rgb == Color('red').rgb
+
+def colorsHaveAlpha():
+    color = Color('#FF000080')
+    return (
+        color.rgba == (255, 0, 0, 128) and color.hex == '#FF000080' and Color(color.hex).alpha == 128
+        and Color(255, 0, 0, 0).alpha == 0 and Color('red').alpha == 255 and Color('red').hex == '#FF0000'
+    )
+
+def alphaIsTheSameInEveryForm():
+    color = Color('red')
+    color.alpha = 0.3
+    forms = [(0, 0, 0, 0.3), [0, 0, 0, 0.3], '0, 0, 0, 0.3', {'red': 0, 'alpha': 0.3}, 'rgba(0, 0, 0, 0.3)', 'rgba(0 0 0 / 30%)']
+    return (
+        set(Color(form).alpha for form in forms) == set([77]) and color.alpha == 77
+        and Color((0, 0, 0, 0.5)) == Color('rgba(0, 0, 0, 0.5)') and Color('rgba(0, 0, 0, 0.5)').hex == '#00000080'
+    )
+
+def frozenColorsPackAlpha():
+    translucent = FrozenColor('rgba(255, 0, 0, 0.5)')
+    return (
+        int(FrozenColor('red').__value__) == 0xFF0000 and translucent.rgba == (255, 0, 0, 128)
+        and int(translucent) == 0xFF0000 and translucent != FrozenColor('red')
+        and translucent == FrozenColor.fromInt(0xFF0000, 128) and Color(translucent).hex == '#FF000080'
+    )
+
+def colorsCompareByValue():
+    red = Color('red')
+    translucentRed = Color('#FF000080')
+    return (
+        red == FrozenColor('red') and hash(red) == hash(FrozenColor('red')) and hash(translucentRed) == hash(FrozenColor(translucentRed))
+        and len(set([red, Color(255, 0, 0), FrozenColor('#F00'), translucentRed])) == 2 and red != translucentRed
+        and red == 'red' and red != 'blue' and red != 0xFF0000
+        and Color('black') != 'notacolor' and FrozenColor('black') != 'zzz' and not Color('black') == 'zzz'
+        and Color('black') == 'rgb(0, 0, 0)' and translucentRed == 'rgba(255, 0, 0, 0.5)'
+        and sorted([red, Color('lime'), FrozenColor('blue'), translucentRed]) == ['#0000FF', '#00FF00', translucentRed, red]
+    )
+
 testModule = colorClass
 
 tests = [
@@ -28,10 +131,30 @@ tests = [
         ((0, 178, 0), lambda x: objStrEquals(x, '#00B200')),
         ('#144AB6', lambda x: objStrEquals(x, '#144AB6'))
     ),
+    ('FrozenColor',
+        (COLORS.RED, lambda x: objStrEquals(x, '#FF0000')),
+        ('#144AB6', lambda x: int(x) == 0x144AB6)
+    ),
 ]
 
 internalTests = (
     (checkIfColorsChange, True),
     (canChangeHexColor, True),
-    (canChangeRGBColor, True)
+    (canChangeRGBColor, True),
+    (canFreezeColor, True),
+    (frozenColorIsHashable, True),
+    (cannotChangeFrozenColor, True),
+    (canLookupColorNames, True),
+    (cannotOverwriteColorInAnotherCase, True),
+    (colorTableIsBuiltOnFirstUse, True),
+    (packageNamesMatchTheirModules, True),
+    (namedColorsAreShared, True),
+    (registeredColorsAreShared, True),
+    (registeredColorsKeepTheirAlpha, True),
+    (namedColorsCreateNewColors, True),
+    (canCreateColorFromInt, True),
+    (colorsHaveAlpha, True),
+    (alphaIsTheSameInEveryForm, True),
+    (frozenColorsPackAlpha, True),
+    (colorsCompareByValue, True)
 )
\ No newline at end of file
@@ -249,7 +249,64 @@ tests = [
         ('#80', (128, None, None)),
         ('#FFF', (255, 255, 255)),
         ('#800000', (128, 222, None)),
-        ({'GRN': None, 'r': 128, 'blu': None}, (128, None, None))
+        ({'GRN': None, 'r': 128, 'blu': None}, (128, None, None)),
+        ('rEd', (255, 0, 0)),
+        ('255, 0, 128', (255, 0, 128)),
+        ((0.5, 0, 1.0), (127, 0, 255))
+    ),
+    ('__packRGB__',
+        ((255, 0, 128), 0xFF0080),
+        ((128, None, None), 0x800000)
+    ),
+    ('__unpackRGB__',
+        (0xFF0080, (255, 0, 128)),
+        (0, (0, 0, 0))
+    ),
+    ('__rgbaFromValue__',
+        ('#FF000080', (255, 0, 0, 128)),
+        ('#F008', (255, 0, 0, 136)),
+        ('red', (255, 0, 0, 255)),
+        ('rgba(255, 0, 128, 0.5)', (255, 0, 128, 128)),
+        ('RGB(100%, 0%, 50%)', (255, 0, 128, 255)),
+        ('255, 0, 128, 0.5', (255, 0, 128, 128)),
+        ((255, 0, 128, 64), (255, 0, 128, 64)),
+        ({'r': 255, 'alpha': 64}, (255, None, None, 64)),
+        ([[128]], (128, None, None, 255))
+    ),
+    ('__rgbaFromFunctionArguments__',
+        ('255, 0, 128', (255, 0, 128, 255)),
+        ('100% 0% 50% / 0.5', (255, 0, 128, 128)),
+        ('300, -5, 12.6, 50%', (255, 0, 13, 128)),
+        ('1, 2', None),
+        ('a, b, c', None)
+    ),
+    ('__packRGBA__',
+        ((255, 0, 128, 255), 0xFF0080),
+        ((255, 0, 128, 0), 0xFFFF0080)
+    ),
+    ('__unpackRGBA__',
+        (0xFF0080, (255, 0, 128, 255)),
+        (0x7FFF0080, (255, 0, 128, 128))
+    ),
+    ('__packHex__',
+        ('#FF0080', 0xFF0080),
+        ('#FF008080', 0x7FFF0080)
+    ),
+    ('__rgbaToHex__',
+        (((255, 0, 128), 255), '#FF0080'),
+        (((255, 0, 128), 128), '#FF008080')
+    ),
+    ('__rgbFromColor__',
+        ('#FFF', (255, 255, 255)),
+        ([[128]], (128, 0, 0))
+    ),
+    ('__cacheKey__',
+        ('#FFF', '#FFF'),
+        ([[128]], (int, 128)),
+        ((1.0, 0), ((float, 1.0), (int, 0))),
+        (([1], {'g': 1}), None),
+        ((float('nan'), 0, 0), None),
+        ([[float('nan')]], None)
     )
 ]
 
@@ -267,3 +324,9 @@ th.__addToTest__(tests, '__isColorInt__', __valuesAreIntTests__)
 th.__addToTest__(tests, '__getColorInt__', __valuesToIntTests__)
 th.__addToTest__(tests, '__isColorPercent__', __valuesArePctTests__)
 th.__addToTest__(tests, '__getColorPercent__', __valuesToPctTests__)
+
+# The lookup tables must give the same results as the conversions they replace
+th.__addToTest__(tests, '__intToHex__', tuple([(item, '%02X' % item) for item in intValues]))
+th.__addToTest__(tests, '__hexToInt__', tuple([(item.lower(), int(item, 16)) for item in singleHexValues]))
+th.__addToTest__(tests, '__rgbToHex__', (((20, 74, 182), '#144AB6'), ((0, 0, 256), '#000000')))
+th.__addToTest__(tests, '__getColorInt__', ((-0.5, 0), (255.5, 255), (256.0, None), (float('nan'), None)))
@@ -38,6 +38,20 @@ def __addToTest__(testObj, keyValue, newValues):
         testObj[keyValue] = existingValues
 
 
+def __getArgumentCount__(testFunction):
+    """
+    Returns the number of named arguments of testFunction.
+    For a class, the arguments of its __init__ are counted, without self.
+    """
+    if inspect.isclass(testFunction):
+        initFunction = getattr(testFunction, '__init__', None)
+        if not inspect.ismethod(initFunction) and not inspect.isfunction(initFunction):
+            return 0
+        return len(inspect.getargspec(initFunction).args) - 1
+
+    return len(inspect.getargspec(testFunction).args)
+
+
 def __executeFunction__(testFunction, testValue):
     """
     Runs testFunction with testParams.
@@ -47,7 +61,7 @@ def __executeFunction__(testFunction, testValue):
 
     try:
         # Try to catch when we want to pass parameters to the function vs just passing an interable to it
-        if isinstance(testValue, tuple) and len(inspect.getargspec(testFunction).args) > 1:
+        if isinstance(testValue, tuple) and __getArgumentCount__(testFunction) > 1:
             return testFunction(*testValue)
         else:
             return testFunction(testValue)
@@ -63,6 +77,9 @@ def __runTestFunction__(testFunction, testParams):
         containing values to pass to the function.
         The output of testFunction is then compared to expectedResult, which can be single
         value, a tuple of values, or a function.
+        If expectedResult is a function, it is passed the output of testFunction, and the
+        test passes if it returns True.
+    Returns a tuple of whether the test passed, testValue, the output, and expectedResult.
     """
 
     testValue = testParams[0]
@@ -70,10 +87,75 @@ def __runTestFunction__(testFunction, testParams):
     testResult = __executeFunction__(testFunction, testValue)
 
     if inspect.isfunction(expectedResult):
-        expectedResult = __executeFunction__(expectedResult, testResult)
+        return (__executeFunction__(expectedResult, testResult) is True, testValue, testResult, expectedResult)
 
     # Check if we just want to compare class types
     if inspect.isclass(expectedResult):
-        return isinstance(testResult, expectedResult)
+        # Errors are returned as their type, so they are compared as classes
+        isExpectedType = issubclass(testResult, expectedResult) if inspect.isclass(testResult) else isinstance(testResult, expectedResult)
+        return (isExpectedType, testValue, testResult, expectedResult)
+
+    return (__isEqual__(testResult, expectedResult), testValue, testResult, expectedResult)
 
-    return (testResult == expectedResult, testValue, testResult, expectedResult)
+
+def __isEqual__(testResult, expectedResult):
+    """
+    Returns True if testResult is equal to expectedResult.
+    Comparisons that don't return a bool, like NumPy arrays, must be equal for every item.
+    """
+    try:
+        isEqual = testResult == expectedResult
+        if hasattr(isEqual, 'all'):
+            isEqual = isEqual.all()
+        return bool(isEqual)
+    except BaseException:
+        return False
+
+
+def __runInternalTest__(testFunction, expectedResult):
+    """
+    Runs testFunction without any parameters, and compares its output to expectedResult.
+    Returns a tuple of whether the test passed, the output, and expectedResult.
+    """
+    try:
+        testResult = testFunction()
+    except BaseException as err:
+        testResult = type(err)
+    return (__isEqual__(testResult, expectedResult), testResult, expectedResult)
+
+
+def __requireOptional__(*requireFunctions):
+    """
+    Returns True if every function in requireFunctions can import the optional module
+    it needs, like colorClass.colorArray.__requireNumpy__. Returns False if one of them
+    raises an ImportError.
+    """
+    try:
+        for requireFunction in requireFunctions:
+            requireFunction()
+    except ImportError:
+        return False
+    return True
+
+
+def __optionalTests__(requireFunctions, tests):
+    """
+    Returns tests if the optional modules that requireFunctions import are installed,
+    or an empty tuple if they aren't, so that tests for optional features are skipped.
+    requireFunctions can be one function or a tuple of them.
+        internalTests = (...) + __optionalTests__(ca.__requireNumpy__, ((arraysMatchColors, True),))
+    """
+    if not isinstance(requireFunctions, tuple):
+        requireFunctions = (requireFunctions,)
+    return tuple(tests) if __requireOptional__(*requireFunctions) else tuple()
+
+
+def __randomPixels__(shape, seed = 0, maxValue = 256):
+    """
+    Returns a uint8 NumPy array of random channels between 0 and maxValue - 1, with the
+    shape. The same seed always returns the same pixels.
+    NumPy must have been imported by colorClass.colorArray.__requireNumpy__.
+    """
+    import colorClass.colorArray as ca
+    numpy = ca.__requireNumpy__()
+    return numpy.random.RandomState(seed).randint(0, maxValue, shape).astype(numpy.uint8)